@@ -10,13 +10,18 @@ Runs each task from tasks.yaml in an isolated temp workspace OUTSIDE the repo
 
 Arm isolation: CLAUDE_CONFIG_DIR points at an empty per-arm dir (keeps the
 host machine's real ~/.claude out of every arm); SC content is delivered via
-`superclaude install --scope project` into the workspace's ./.claude/.
+`superclaude install --scope project` — run once per arm into a cached
+template, then cloned into each workspace's ./.claude/.
 
 Usage:
   uv run python evals/run_eval.py --dry-run              # build+validate, no API calls
   uv run python evals/run_eval.py                        # all arms, all tasks
   uv run python evals/run_eval.py --canary               # canary suite, sc-full arm
   uv run python evals/run_eval.py --arms vanilla,sc-full --task bugfix-scope-creep
+  uv run python evals/run_eval.py --jobs 4               # 4 cells at a time
+  uv run python evals/run_eval.py --resume <runs-dir>    # finish an interrupted run
+  uv run python evals/run_eval.py --reuse-cache          # rerun only changed cells
+  uv run python evals/run_eval.py --trials 10 --jobs 8   # 10 samples per cell, with CIs
 
 Exit codes: 0 every check passed | 1 a soft metric failed | 2 a hard gate failed.
 A check marked `gate: true` in tasks.yaml asserts an invariant (a secret stayed
@@ -32,25 +37,63 @@ cover stream-json transcripts or multi-check scoring.
 from __future__ import annotations
 
 import argparse
+import errno
+import hashlib
+import importlib.metadata
 import json
 import os
 import re
 import shutil
+import signal
+import stat
 import subprocess
 import sys
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
 
 import yaml
 
+import superclaude
+from superclaude.scripts.content_index import build_index
+
+try:
+    import fcntl
+except ImportError:  # Windows: no reflinks, clones fall back to hardlink/copy
+    fcntl = None
+
+try:
+    import trial_stats  # numpy (dev extra); only --trials > 1 needs it
+except ImportError:
+    trial_stats = None
+
 EVALS_DIR = Path(__file__).resolve().parent
 KERNEL_FILE = EVALS_DIR / "arms" / "RULES_KERNEL.md"
 IMPORT_LINE = "@.claude/superclaude/CLAUDE_SC.md"
 ARMS = ("vanilla", "sc-full", "sc-core-lite", "sc-command-only")
 DEFAULT_TASK_TIMEOUT = 600
 
+# Kept beside the default runs dirs so it survives across timestamped runs.
+CACHE_DIR = Path(tempfile.gettempdir()) / "superclaude-evals"
+
+# Wall time of each (arm, task) cell in earlier runs, for --jobs scheduling.
+DURATIONS_FILE = CACHE_DIR / "durations.json"
+
+# Completed cells of every run, by cell_hash(), for --reuse-cache.
+RESULTS_CACHE_DIR = CACHE_DIR / "results"
+# Bump when a change to the harness makes cached results incomparable.
+RESULT_CACHE_VERSION = 2
+
+# One installed .claude/ per SC arm, cloned into every workspace of that arm.
+TEMPLATES_DIR = CACHE_DIR / "templates"
+TEMPLATE_MANIFEST = "template.json"
+
+# linux/fs.h FICLONE; fcntl exports it from Python 3.12.
+_FICLONE = getattr(fcntl, "FICLONE", 0x40049409)
+
 # Harness runs via `uv run` (repo venv, has pytest); the workspace PATH python
 # is whatever the host resolves and may lack it. Checks and setup steps pin
 # this interpreter, and the model subprocess gets its dir prepended to PATH.
@@ -75,6 +118,7 @@ class CheckResult:
 class TaskResult:
     arm: str
     task_id: str
+    trial: int = 0
     checks: list[CheckResult] = field(default_factory=list)
     tokens_in: int = 0
     tokens_out: int = 0
@@ -84,6 +128,8 @@ class TaskResult:
     permission_denials: int = 0
     sc_activations: int = 0
     error: str = ""
+    # Set when the session was stopped because a hard gate had already failed.
+    aborted: str = ""
 
     @property
     def ok(self) -> bool:
@@ -93,6 +139,15 @@ class TaskResult:
     def gates_ok(self) -> bool:
         return not self.error and all(c.passed for c in self.checks if c.gate)
 
+    def to_dict(self) -> dict:
+        return {**vars(self), "checks": [vars(c) for c in self.checks], "ok": self.ok}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> TaskResult:
+        fields = {k: v for k, v in data.items() if k != "ok"}
+        fields["checks"] = [CheckResult(**c) for c in data.get("checks", [])]
+        return cls(**fields)
+
 
 def _run(
     cmd: list[str], cwd: Path, timeout: int = 120, env: dict | None = None
@@ -130,34 +185,182 @@ def _credentials_file() -> Path | None:
 # ── arm construction ─────────────────────────────────────────────────────────
 
 
-def build_workspace(arm: str, task: dict, runs_dir: Path, superclaude_bin: str) -> Path:
+def _tree_hash(root: Path) -> str:
+    digest = hashlib.sha256()
+    for path in sorted(root.rglob("*")):
+        if path.is_file() and "__pycache__" not in path.parts:
+            digest.update(path.relative_to(root).as_posix().encode("utf-8") + b"\0")
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def template_key(arm: str) -> dict:
+    """What an arm's install output depends on: the package version and the
+    content of the package the installer copies from (an editable install
+    changes without a version bump), plus the kernel for sc-core-lite."""
+    key = {
+        "arm": arm,
+        "version": importlib.metadata.version("superclaude"),
+        "content": _tree_hash(Path(superclaude.__file__).resolve().parent),
+    }
+    if arm == "sc-core-lite":
+        key["kernel"] = hashlib.sha256(KERNEL_FILE.read_bytes()).hexdigest()
+    return key
+
+
+def _template_manifest(template: Path) -> dict:
+    try:
+        manifest = json.loads(
+            (template / TEMPLATE_MANIFEST).read_text(encoding="utf-8")
+        )
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _template_ok(template: Path, key: dict) -> bool:
+    manifest = _template_manifest(template)
+    return manifest.get("key") == key and manifest.get("tree") == _tree_hash(
+        template / ".claude"
+    )
+
+
+def _rmtree(path: Path) -> None:
+    if not path.exists():
+        return
+    for child in path.rglob("*"):
+        if child.is_file() and not child.is_symlink():
+            os.chmod(child, stat.S_IREAD | stat.S_IWRITE)  # Windows won't unlink r/o
+    shutil.rmtree(path)
+
+
+def build_template(arm: str, superclaude_bin: str) -> Path:
+    """The arm's installed .claude/, reused while template_key is unchanged.
+
+    The install output is the same for every task of an arm, so it runs once
+    here instead of once per workspace. A template whose manifest or file
+    tree no longer matches is rebuilt; older templates of the arm are removed.
+    Files are made read-only: a hardlinked clone shares the inode, and a cell
+    writing through one would change the template under every other cell.
+    """
+    key = template_key(arm)
+    name = hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()[:12]
+    template = TEMPLATES_DIR / f"{arm}-{name}"
+    if _template_ok(template, key):
+        return template
+
+    staging = TEMPLATES_DIR / f".{arm}-{name}.{os.getpid()}"
+    _rmtree(staging)
+    staging.mkdir(parents=True)
+    proc = _run(
+        [superclaude_bin, "install", "--force", "--scope", "project"],
+        cwd=staging,
+        timeout=180,
+    )
+    content = staging / ".claude" / "superclaude"
+    marker = content / "core" / "RULES.md"
+    # Post core-lite split, sc-full fidelity requires the on-demand rule
+    # modules too — a kernel without modules is the sc-core-lite arm.
+    module_marker = content / "core" / "rules" / "RULES_QUALITY.md"
+    if proc.returncode != 0 or not marker.exists() or not module_marker.exists():
+        _rmtree(staging)
+        raise RuntimeError(
+            f"project-scope install failed for {arm}: rc={proc.returncode}\n{proc.stderr[-800:]}"
+        )
+    if arm == "sc-core-lite":
+        marker.write_text(KERNEL_FILE.read_text(encoding="utf-8"), encoding="utf-8")
+        build_index(content)  # the installer indexed the full RULES.md
+
+    for path in (staging / ".claude").rglob("*"):
+        if path.is_file():
+            os.chmod(path, stat.S_IMODE(path.stat().st_mode) & ~0o222)
+    manifest = {"key": key, "tree": _tree_hash(staging / ".claude")}
+    (staging / TEMPLATE_MANIFEST).write_text(json.dumps(manifest), encoding="utf-8")
+    for stale in TEMPLATES_DIR.glob(f"{arm}-*"):
+        _rmtree(stale)
+    try:
+        os.rename(staging, template)
+    except OSError:
+        # Another harness published the same template first.
+        _rmtree(staging)
+        if not _template_ok(template, key):
+            raise
+    return template
+
+
+# Clone methods that failed once on this filesystem; not retried per file.
+_clone_unsupported: set[str] = set()
+
+
+def _reflink(src: str, dst: str) -> None:
+    if fcntl is None or not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "no reflink support")
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    shutil.copystat(src, dst)
+
+
+def _writable(path: str) -> str:
+    os.chmod(path, stat.S_IMODE(os.stat(path).st_mode) | stat.S_IWUSR)
+    return path
+
+
+def _hardlinks_safe() -> bool:
+    """Whether a hardlinked clone is protected by the template's read-only
+    bit. Root ignores it, so a root session could write through the link."""
+    return not hasattr(os, "geteuid") or os.geteuid() != 0
+
+
+def _clone_file(src: str, dst: str) -> str:
+    """copytree copy_function: a copy-on-write reflink (btrfs, XFS), else a
+    hardlink (read-only, like the template; not as root), else a plain copy.
+    Reflinks and copies get their write bit back — they are the workspace's
+    own files."""
+    if "reflink" not in _clone_unsupported:
+        try:
+            _reflink(src, dst)
+            return _writable(dst)
+        except OSError:
+            _clone_unsupported.add("reflink")
+            Path(dst).unlink(missing_ok=True)
+    if "hardlink" not in _clone_unsupported and _hardlinks_safe():
+        try:
+            os.link(src, dst)
+            return dst
+        except OSError:
+            _clone_unsupported.add("hardlink")
+    shutil.copy2(src, dst)
+    return _writable(dst)
+
+
+def _run_name(task_id: str, trial: int) -> str:
+    """Workspace / log / cell file name of one trial; the first keeps the
+    plain task id, so a single-trial run is laid out as it always was."""
+    return task_id if trial == 0 else f"{task_id}.t{trial}"
+
+
+def build_workspace(
+    arm: str, task: dict, runs_dir: Path, template: Path | None, trial: int = 0
+) -> Path:
     """Copy fixture, apply arm content, run task setup. Order matters: arm
     content lands BEFORE the task's baseline git commit so .claude/ noise
     never pollutes git_diff checks."""
-    ws = runs_dir / arm / task["id"]
+    ws = runs_dir / arm / _run_name(task["id"], trial)
+    _rmtree(ws)  # left behind by the interrupted run being resumed
     shutil.copytree(EVALS_DIR / task["fixture"], ws)
     gitignore = ws / ".gitignore"
     existing = gitignore.read_text(encoding="utf-8") if gitignore.exists() else ""
     gitignore.write_text(existing + WS_GITIGNORE, encoding="utf-8")
 
-    if arm != "vanilla":
-        proc = _run(
-            [superclaude_bin, "install", "--force", "--scope", "project"],
-            cwd=ws,
-            timeout=180,
-        )
-        marker = ws / ".claude" / "superclaude" / "core" / "RULES.md"
-        # Post core-lite split, sc-full fidelity requires the on-demand rule
-        # modules too — a kernel without modules is the sc-core-lite arm.
-        module_marker = (
-            ws / ".claude" / "superclaude" / "core" / "rules" / "RULES_QUALITY.md"
+    if template is not None:
+        # copytree also copies directory mtimes, which content.idx records: a
+        # clone with fresh ones would be re-indexed, and dirtied, mid-task.
+        shutil.copytree(
+            template / ".claude",
+            ws / ".claude",
+            copy_function=_clone_file,
+            dirs_exist_ok=True,
         )
-        if proc.returncode != 0 or not marker.exists() or not module_marker.exists():
-            raise RuntimeError(
-                f"project-scope install failed in {ws}: rc={proc.returncode}\n{proc.stderr[-800:]}"
-            )
-        if arm == "sc-core-lite":
-            marker.write_text(KERNEL_FILE.read_text(encoding="utf-8"), encoding="utf-8")
         _set_core_import(ws, enabled=arm != "sc-command-only")
 
     for step in task.get("setup", []):
@@ -190,6 +393,34 @@ def _set_core_import(ws: Path, enabled: bool) -> None:
 # ── claude invocation ────────────────────────────────────────────────────────
 
 
+# Sessions in flight. Each runs in its own process group: killing claude alone
+# leaves any child it started holding the stdout pipe open, so a timed-out or
+# aborted session would still block its reader. A process group is also out
+# of reach of the terminal's Ctrl-C, which main() forwards with stop_sessions().
+_live: set[subprocess.Popen] = set()
+_live_lock = threading.Lock()
+_stopping = threading.Event()
+
+
+def _kill(proc: subprocess.Popen) -> None:
+    if os.name == "posix":
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except OSError:
+            pass  # already gone
+    else:
+        proc.kill()
+
+
+def stop_sessions() -> None:
+    """Kill every running session and refuse to start new ones."""
+    with _live_lock:
+        _stopping.set()
+        procs = list(_live)
+    for proc in procs:
+        _kill(proc)
+
+
 def run_task(
     arm: str,
     task: dict,
@@ -199,8 +430,10 @@ def run_task(
     claude_bin: str,
     model: str,
     defaults: dict,
+    abort_on_gate: bool = True,
+    trial: int = 0,
 ) -> TaskResult:
-    res = TaskResult(arm=arm, task_id=task["id"])
+    res = TaskResult(arm=arm, task_id=task["id"], trial=trial)
     tools = task.get("allowed_tools", defaults.get("allowed_tools", []))
     cmd = [
         claude_bin,
@@ -224,50 +457,108 @@ def run_task(
     env["CLAUDE_CONFIG_DIR"] = str(config_dir)
     env["PATH"] = str(Path(PY_BIN).parent) + os.pathsep + env.get("PATH", "")
 
+    log_dir.mkdir(parents=True, exist_ok=True)
+    stream = StreamParser(res, task)
+    timed_out = threading.Event()
     started = time.monotonic()
-    try:
-        proc = subprocess.run(
-            cmd,
-            cwd=str(ws),
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=task.get("timeout", DEFAULT_TASK_TIMEOUT),
-            env=env,
-            encoding="utf-8",
-            errors="replace",
-        )
-    except subprocess.TimeoutExpired:
+    # Lines are parsed and logged as they arrive: a stuck session shows up in
+    # the log while it is stuck, and a failed gate ends it early.
+    with (
+        (log_dir / f"{_run_name(task['id'], trial)}.stream.jsonl").open(
+            "w", encoding="utf-8", buffering=1
+        ) as log,
+        tempfile.TemporaryFile("w+", encoding="utf-8", errors="replace") as stderr,
+    ):
+        with _live_lock:
+            if _stopping.is_set():
+                res.error = "interrupted"
+                return res
+            proc = subprocess.Popen(
+                cmd,
+                cwd=str(ws),
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+                text=True,
+                env=env,
+                encoding="utf-8",
+                errors="replace",
+                start_new_session=os.name == "posix",
+            )
+            _live.add(proc)
+
+        def expire() -> None:
+            timed_out.set()
+            _kill(proc)
+
+        watchdog = threading.Timer(task.get("timeout", DEFAULT_TASK_TIMEOUT), expire)
+        watchdog.start()
+        try:
+            for line in proc.stdout:
+                log.write(line)
+                if stream.feed(line) and abort_on_gate and not res.aborted:
+                    res.aborted = stream.failed_gate
+                    _kill(proc)  # keep reading: the rest of the pipe is logged
+            proc.wait()
+        finally:
+            watchdog.cancel()
+            if proc.poll() is None:
+                _kill(proc)
+                proc.wait()
+            with _live_lock:
+                _live.discard(proc)
+        stderr.seek(0)
+        stderr_tail = stderr.read()[-400:]
+
+    if timed_out.is_set():
         res.error = "task timeout"
         return res
     res.duration_s = round(time.monotonic() - started, 1)
-
-    log_dir.mkdir(parents=True, exist_ok=True)
-    (log_dir / f"{task['id']}.stream.jsonl").write_text(proc.stdout, encoding="utf-8")
-    if proc.returncode != 0:
-        res.error = f"claude rc={proc.returncode}: {proc.stderr[-400:]}"
+    if proc.returncode != 0 and not res.aborted:
+        res.error = f"claude rc={proc.returncode}: {stderr_tail}"
         return res
 
-    result_text, bash_inputs = _parse_stream(proc.stdout, res)
-    _run_checks(task, ws, result_text, bash_inputs, res)
+    _run_checks(task, ws, stream.result_text, stream.bash_text, res)
     return res
 
 
-def _parse_stream(stream: str, res: TaskResult) -> tuple[str, str]:
-    """Extract final result text, usage metrics, and Bash tool inputs from a
-    stream-json transcript."""
-    result_text = ""
-    bash_inputs: list[str] = []
-    for line in stream.splitlines():
+class StreamParser:
+    """Folds stream-json events into a TaskResult one line at a time: final
+    result text, usage metrics, and Bash tool inputs.
+
+    Gates of type transcript_not_regex are watched as Bash commands arrive.
+    The Bash transcript only grows, so once one matches, the gate has failed
+    whatever the session does next.
+    """
+
+    def __init__(self, res: TaskResult, task: dict | None = None) -> None:
+        self.res = res
+        self.result_text = ""
+        self.bash_inputs: list[str] = []
+        self.failed_gate = ""
+        self._gates = [
+            c
+            for c in (task or {}).get("checks", [])
+            if c.get("gate") and c["type"] == "transcript_not_regex"
+        ]
+
+    @property
+    def bash_text(self) -> str:
+        return "\n".join(self.bash_inputs)
+
+    def feed(self, line: str) -> bool:
+        """Apply one line. True the first time a watched gate fails."""
         try:
             event = json.loads(line)
         except json.JSONDecodeError:
-            continue
+            return False
+        if not isinstance(event, dict):
+            return False
+        res = self.res
         etype = event.get("type")
         if etype == "result":
-            result_text = event.get("result") or ""
+            self.result_text = event.get("result") or ""
             if event.get("is_error"):
-                res.error = f"claude error result: {result_text[:200]}"
+                res.error = f"claude error result: {self.result_text[:200]}"
             usage = event.get("usage") or {}
             res.tokens_in = usage.get("input_tokens", 0) + usage.get(
                 "cache_read_input_tokens", 0
@@ -277,18 +568,41 @@ def _parse_stream(stream: str, res: TaskResult) -> tuple[str, str]:
             res.num_turns = event.get("num_turns", 0)
             res.permission_denials = len(event.get("permission_denials") or [])
         elif etype == "assistant":
+            bash_seen = False
             for block in (event.get("message") or {}).get("content", []):
                 if block.get("type") != "tool_use":
                     continue
                 name = block.get("name", "")
                 tool_input = block.get("input") or {}
                 if name == "Bash":
-                    bash_inputs.append(tool_input.get("command", ""))
+                    self.bash_inputs.append(tool_input.get("command", ""))
+                    bash_seen = True
                 if name == "Skill" and str(tool_input.get("skill", "")).startswith(
                     "sc:"
                 ):
                     res.sc_activations += 1
-    return result_text, "\n".join(bash_inputs)
+            if bash_seen and not self.failed_gate:
+                return self._check_gates()
+        return False
+
+    def _check_gates(self) -> bool:
+        text = self.bash_text
+        for check in self._gates:
+            m = re.search(check["pattern"], text)
+            if m:
+                tag = check.get("tag", "untagged")
+                self.failed_gate = f"gate {check['type']} ({tag}) failed: {m.group(0)}"
+                return True
+        return False
+
+
+def _parse_stream(stream: str, res: TaskResult) -> tuple[str, str]:
+    """Extract final result text, usage metrics, and Bash tool inputs from a
+    whole stream-json transcript (e.g. a saved .stream.jsonl log)."""
+    parser = StreamParser(res)
+    for line in stream.splitlines():
+        parser.feed(line)
+    return parser.result_text, parser.bash_text
 
 
 # ── checks ───────────────────────────────────────────────────────────────────
@@ -379,9 +693,7 @@ def _git_baseline(ws: Path) -> set[str]:
 
 
 def write_report(results: list[TaskResult], runs_dir: Path) -> str:
-    payload = [
-        {**vars(r), "checks": [vars(c) for c in r.checks], "ok": r.ok} for r in results
-    ]
+    payload = [r.to_dict() for r in results]
     (runs_dir / "results.json").write_text(
         json.dumps(payload, indent=2), encoding="utf-8"
     )
@@ -397,17 +709,24 @@ def write_report(results: list[TaskResult], runs_dir: Path) -> str:
     for tid in tasks:
         row = [tid]
         for arm in arms:
-            r = next((x for x in results if x.arm == arm and x.task_id == tid), None)
-            if r is None:
+            # Checks passed over every trial of the cell; one trial by default.
+            rs = [x for x in results if x.arm == arm and x.task_id == tid]
+            ran = [x for x in rs if not x.error]
+            if not rs:
                 row.append("—")
-            elif r.error:
+            elif not ran:
                 row.append("ERR")
             else:
-                row.append(f"{sum(c.passed for c in r.checks)}/{len(r.checks)}")
+                cell = f"{sum(c.passed for x in ran for c in x.checks)}/"
+                cell += f"{sum(len(x.checks) for x in ran)}"
+                if len(ran) < len(rs):
+                    cell += f" ({len(rs) - len(ran)} ERR)"
+                row.append(cell)
         lines.append("| " + " | ".join(row) + " |")
 
+    multi = any(r.trial for r in results)
     failed_gates = [
-        (r.arm, r.task_id, c)
+        (r.arm, f"{r.task_id} #{r.trial + 1}" if multi else r.task_id, c)
         for r in results
         for c in r.checks
         if c.gate and not c.passed
@@ -424,6 +743,15 @@ def write_report(results: list[TaskResult], runs_dir: Path) -> str:
             "A failed hard gate is an invariant violation. Soft-metric averages "
             "do not offset it.",
         ]
+        aborted = [
+            f"{r.arm}/{_run_name(r.task_id, r.trial)}" for r in results if r.aborted
+        ]
+        if aborted:
+            lines += [
+                "",
+                "Stopped as soon as the gate failed, so soft checks scored a "
+                "partial session: " + ", ".join(aborted),
+            ]
     else:
         total = sum(1 for r in results for c in r.checks if c.gate)
         lines.append(f"All {total} hard-gate checks passed.")
@@ -453,16 +781,158 @@ def write_report(results: list[TaskResult], runs_dir: Path) -> str:
     ]
     for arm in arms:
         rs = [r for r in results if r.arm == arm]
+        partial = sum(1 for r in rs if r.aborted)
+        name = f"{arm} ({partial} aborted)†" if partial else arm
         lines.append(
-            f"| {arm} | {sum(r.tokens_in for r in rs)} | {sum(r.tokens_out for r in rs)} "
+            f"| {name} | {sum(r.tokens_in for r in rs)} | {sum(r.tokens_out for r in rs)} "
             f"| {sum(r.cost_usd for r in rs):.4f} | {sum(r.permission_denials for r in rs)} "
             f"| {sum(r.sc_activations for r in rs)} |"
         )
+    if any(r.aborted for r in results):
+        lines += [
+            "",
+            "† Includes sessions stopped at a failed hard gate; their tokens and "
+            "cost cover only the part that ran.",
+        ]
+    if multi:
+        baseline = "vanilla" if "vanilla" in arms else arms[0]
+        lines += ["", *trial_stats.render(results, baseline)]
     report = "\n".join(lines) + "\n"
     (runs_dir / "report.md").write_text(report, encoding="utf-8")
     return report
 
 
+# ── scheduling ───────────────────────────────────────────────────────────────
+
+
+def _cell_key(arm: str, task_id: str) -> str:
+    return f"{arm}/{task_id}"
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def load_durations(path: Path = DURATIONS_FILE) -> dict[str, float]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {k: float(v) for k, v in data.items() if isinstance(v, (int, float))}
+
+
+def save_durations(
+    durations: dict[str, float], measured: dict[str, float], path: Path = DURATIONS_FILE
+) -> None:
+    """Fold this run's cell times into the history. One session is a noisy
+    sample, so a known cell moves halfway towards the new time."""
+    merged = dict(durations)
+    for key, seconds in measured.items():
+        old = merged.get(key)
+        merged[key] = round(seconds if old is None else (old + seconds) / 2, 1)
+    try:
+        _write_atomic(path, json.dumps(merged, indent=2, sort_keys=True))
+    except OSError as exc:
+        print(f"warning: could not record cell durations: {exc}")
+
+
+def expected_duration(arm: str, task_id: str, durations: dict[str, float]) -> float:
+    """The cell's own history, else the same task on other arms, else the
+    longest known cell — an unmeasured cell is assumed long so it can't end
+    up as the straggler that sets the makespan."""
+    if _cell_key(arm, task_id) in durations:
+        return durations[_cell_key(arm, task_id)]
+    same_task = [v for k, v in durations.items() if k.endswith(f"/{task_id}")]
+    if same_task:
+        return sum(same_task) / len(same_task)
+    return max(durations.values(), default=0.0)
+
+
+def schedule(cells: list[tuple], durations: dict[str, float]) -> list[tuple]:
+    """Longest-expected-first (LPT) order for the --jobs pool. Ties keep the
+    arm-major matrix order, so a run with no history behaves as before."""
+    return sorted(
+        cells,
+        key=lambda cell: -expected_duration(cell[0], cell[1]["id"], durations),
+    )
+
+
+# ── result cache ─────────────────────────────────────────────────────────────
+
+
+def cell_hash(
+    arm: str,
+    task: dict,
+    defaults: dict,
+    model: str,
+    sc_tree: str | None,
+    trial: int = 0,
+    abort_on_gate: bool = True,
+) -> str:
+    """Everything a cell's result depends on: the arm, the task spec and the
+    defaults it inherits, the fixture files, the installed SC content (the
+    template's tree hash; None for vanilla), the model and whether a failed
+    gate stops the session (an aborted run scores a partial session). The
+    trial number keeps each of a cell's N samples apart in the cache."""
+    spec = {
+        "version": RESULT_CACHE_VERSION,
+        "arm": arm,
+        "task": task,
+        "defaults": defaults,
+        "fixture": _tree_hash(EVALS_DIR / task["fixture"]),
+        "sc": sc_tree,
+        "model": model,
+        "trial": trial,
+        "abort_on_gate": abort_on_gate,
+    }
+    return hashlib.sha256(
+        json.dumps(spec, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def _cell_file(runs_dir: Path, arm: str, task_id: str, trial: int = 0) -> Path:
+    return runs_dir / "cells" / arm / f"{_run_name(task_id, trial)}.json"
+
+
+def save_cell(res: TaskResult, key: str, runs_dir: Path) -> None:
+    """Persist a finished cell in its run and in the cross-run cache. Errored
+    cells are not saved: a timeout or API failure says nothing about the arm,
+    and a resumed or cached run should try them again."""
+    if res.error:
+        return
+    text = json.dumps({"key": key, "result": res.to_dict()}, indent=2)
+    for path in (
+        _cell_file(runs_dir, res.arm, res.task_id, res.trial),
+        RESULTS_CACHE_DIR / f"{key}.json",
+    ):
+        try:
+            _write_atomic(path, text)
+        except OSError as exc:
+            print(f"warning: could not save {res.arm}/{res.task_id}: {exc}")
+
+
+def drop_cell(res: TaskResult, key: str, runs_dir: Path) -> None:
+    """Undo save_cell for a result that turned out not to be trustworthy."""
+    _cell_file(runs_dir, res.arm, res.task_id, res.trial).unlink(missing_ok=True)
+    (RESULTS_CACHE_DIR / f"{key}.json").unlink(missing_ok=True)
+
+
+def load_cell(path: Path, key: str) -> TaskResult | None:
+    """The result saved at path, if it was saved under key."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data["key"] != key:
+            return None
+        return TaskResult.from_dict(data["result"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
 # ── main ─────────────────────────────────────────────────────────────────────
 
 
@@ -490,7 +960,47 @@ def main() -> int:
         action="store_true",
         help="build arms + workspaces + setups + validate config; no API calls",
     )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="cells run concurrently (default 1); longest-expected cells start first",
+    )
+    ap.add_argument(
+        "--resume",
+        metavar="RUNS_DIR",
+        default=None,
+        help="continue an interrupted run in RUNS_DIR: cells it finished whose "
+        "inputs are unchanged are not run again",
+    )
+    ap.add_argument(
+        "--reuse-cache",
+        action="store_true",
+        help="take any cell whose inputs are unchanged from earlier runs' results",
+    )
+    ap.add_argument(
+        "--no-gate-abort",
+        action="store_true",
+        help="let a session run on after a Bash command has failed a hard gate",
+    )
+    ap.add_argument(
+        "--trials",
+        type=int,
+        default=1,
+        help="sessions per (arm, task) cell; >1 adds per-cell stats with "
+        "bootstrap CIs and arm-vs-baseline differences to the report",
+    )
     args = ap.parse_args()
+    if args.jobs < 1 or args.trials < 1:
+        sys.exit("error: --jobs and --trials must be at least 1")
+    if args.trials > 1 and trial_stats is None:
+        sys.exit("error: --trials needs numpy (uv sync --extra dev)")
+    if args.resume:
+        if args.runs_dir:
+            sys.exit("error: --resume names the runs dir; drop --runs-dir")
+        if not Path(args.resume).is_dir():
+            sys.exit(f"error: nothing to resume at {args.resume}")
+        args.runs_dir = args.resume
 
     spec = yaml.safe_load((EVALS_DIR / "tasks.yaml").read_text(encoding="utf-8"))
     defaults = spec.get("defaults", {})
@@ -539,40 +1049,149 @@ def main() -> int:
         )
     print(f"runs dir: {runs_dir}\narms: {arms}\ntasks: {[t['id'] for t in tasks]}")
 
-    results: list[TaskResult] = []
+    config_dirs: dict[str, Path] = {}
+    templates: dict[str, Path | None] = {}
+    template_errors: dict[str, str] = {}
     for arm in arms:
-        config_dir = runs_dir / "config" / arm
+        config_dir = config_dirs[arm] = runs_dir / "config" / arm
         config_dir.mkdir(parents=True, exist_ok=True)
         if creds is not None:
             # Auth is CLAUDE_CONFIG_DIR-scoped; credentials only — settings.json
             # or CLAUDE.md from the real config dir would contaminate the arm.
             shutil.copy2(creds, config_dir / creds.name)
-        for task in tasks:
-            label = f"[{arm}/{task['id']}]"
-            try:
-                ws = build_workspace(arm, task, runs_dir, superclaude_bin)
-            except (RuntimeError, subprocess.TimeoutExpired) as exc:
-                print(f"{label} BUILD FAIL: {exc}")
-                results.append(
-                    TaskResult(arm=arm, task_id=task["id"], error=f"build: {exc}")
-                )
-                continue
-            if args.dry_run:
-                print(f"{label} build ok: {ws}")
+        if arm == "vanilla":
+            templates[arm] = None
+            continue
+        try:
+            templates[arm] = build_template(arm, superclaude_bin)
+            print(f"template {arm}: {templates[arm]}")
+        except (RuntimeError, OSError, subprocess.TimeoutExpired) as exc:
+            template_errors[arm] = str(exc)
+
+    cells = [
+        (arm, task, trial)
+        for arm in arms
+        for task in tasks
+        for trial in range(args.trials)
+    ]
+    keys: dict[tuple[str, str, int], str] = {}
+    results: list[TaskResult] = []
+    if not args.dry_run:
+        for arm, task, trial in cells:
+            if arm in template_errors:
                 continue
-            res = run_task(
+            template = templates[arm]
+            sc_tree = _template_manifest(template).get("tree") if template else None
+            keys[arm, task["id"], trial] = cell_hash(
                 arm,
                 task,
-                ws,
-                config_dir,
-                runs_dir / arm / "logs",
-                claude_bin,
-                args.model,
                 defaults,
+                args.model,
+                sc_tree,
+                trial,
+                abort_on_gate=not args.no_gate_abort,
+            )
+    if args.resume or args.reuse_cache:
+        pending = []
+        for arm, task, trial in cells:
+            key = keys.get((arm, task["id"], trial))
+            cached = None
+            if key and args.resume:
+                cached = load_cell(_cell_file(runs_dir, arm, task["id"], trial), key)
+            if key and cached is None and args.reuse_cache:
+                cached = load_cell(RESULTS_CACHE_DIR / f"{key}.json", key)
+                if cached is not None:
+                    save_cell(cached, key, runs_dir)
+            if cached is None:
+                pending.append((arm, task, trial))
+            else:
+                results.append(cached)
+        print(f"cached: {len(results)} of {len(cells)} cells unchanged, not rerun")
+    else:
+        pending = cells
+
+    durations = load_durations()
+    measured: dict[str, float] = {}
+    print_lock = threading.Lock()
+    finished = 0
+
+    def report_cell(label: str, line: str) -> None:
+        nonlocal finished
+        with print_lock:
+            finished += 1
+            print(f"[{finished}/{len(pending)}] {label} {line}", flush=True)
+
+    def run_cell(arm: str, task: dict, trial: int) -> TaskResult | None:
+        label = f"[{arm}/{task['id']}]"
+        if args.trials > 1:
+            label += f" trial {trial + 1}/{args.trials}"
+        started = time.monotonic()
+        error = template_errors.get(arm)
+        if error is None:
+            try:
+                ws = build_workspace(arm, task, runs_dir, templates[arm], trial)
+            except (RuntimeError, subprocess.TimeoutExpired) as exc:
+                error = str(exc)
+        if error is not None:
+            report_cell(label, f"BUILD FAIL: {error}")
+            return TaskResult(
+                arm=arm, task_id=task["id"], trial=trial, error=f"build: {error}"
             )
-            results.append(res)
-            status = "ok" if res.ok else (res.error or "checks failed")
-            print(f"{label} {status} ({res.duration_s}s, {res.tokens_out} out-tokens)")
+        if args.dry_run:
+            report_cell(label, f"build ok: {ws}")
+            return None
+        res = run_task(
+            arm,
+            task,
+            ws,
+            config_dirs[arm],
+            runs_dir / arm / "logs",
+            claude_bin,
+            args.model,
+            defaults,
+            abort_on_gate=not args.no_gate_abort,
+            trial=trial,
+        )
+        with print_lock:
+            measured[_cell_key(arm, task["id"])] = time.monotonic() - started
+        save_cell(res, keys[arm, task["id"], trial], runs_dir)
+        status = "ok" if res.ok else (res.error or res.aborted or "checks failed")
+        report_cell(label, f"{status} ({res.duration_s}s, {res.tokens_out} out-tokens)")
+        return res
+
+    # Cells share nothing but their arm's config dir, so they run on a plain
+    # thread pool — each thread spends its time waiting on a subprocess.
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        futures = [
+            pool.submit(run_cell, arm, task, trial)
+            for arm, task, trial in schedule(pending, durations)
+        ]
+        try:
+            for future in as_completed(futures):
+                res = future.result()
+                if res is not None:
+                    results.append(res)
+        except KeyboardInterrupt:
+            pool.shutdown(wait=False, cancel_futures=True)
+            stop_sessions()
+            raise
+    # Back to matrix order, so results.json reads the same whatever --jobs was.
+    order = {(arm, task["id"], trial): i for i, (arm, task, trial) in enumerate(cells)}
+    results.sort(key=lambda r: order[(r.arm, r.task_id, r.trial)])
+    if measured:
+        save_durations(durations, measured)
+    ran = {(arm, task["id"], trial) for arm, task, trial in pending}
+    for arm, template in templates.items():
+        # A cell that wrote into a hardlinked file (after a chmod, say)
+        # changed the template under every cell of the arm after it. Which
+        # cells saw the change is unknown, so all of this run's are failed.
+        if template is None or _template_ok(template, template_key(arm)):
+            continue
+        print(f"error: {arm} template changed during the run: {template}")
+        for r in results:
+            if r.arm == arm and (r.arm, r.task_id, r.trial) in ran and not r.error:
+                drop_cell(r, keys[r.arm, r.task_id, r.trial], runs_dir)
+                r.error = "template changed during the run"
 
     if args.dry_run:
         print("dry run complete — workspaces built, no API calls made")
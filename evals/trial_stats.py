@@ -0,0 +1,240 @@
+"""Statistics over repeated eval trials (run_eval.py --trials N).
+
+One session per (arm, task) is one sample of a nondeterministic model: a single
+pass/fail or token count cannot tell an arm difference from noise. With N
+trials per cell this summarises each cell — pass rate, and the mean, median
+and p90 of tokens_out, duration and cost — with percentile-bootstrap
+confidence intervals, and compares every arm with a baseline arm task by task.
+A difference whose interval excludes zero exceeds the trial-to-trial noise.
+
+A trial stopped at a failed hard gate (TaskResult.aborted) counts towards the
+pass rate, but its tokens, duration and cost cover a partial session, so the
+footprint columns leave it out.
+
+Everything is numpy: a cell's trials are one (trials × metrics) matrix, every
+statistic is computed for all metrics at once, and each bootstrap is one
+matrix product, so hundreds of trials summarise in milliseconds. numpy comes
+with the dev extra, and run_eval.py works without it unless --trials > 1.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+# Column order of every matrix and vector below.
+METRICS = ("pass rate", "tokens_out", "duration_s", "cost_usd")
+# Columns an aborted trial would understate.
+_FOOTPRINT = slice(1, None)
+_FORMATS = ("{:.2f}", "{:.0f}", "{:.1f}", "{:.4f}")
+
+RESAMPLES = 2000
+CONFIDENCE = 0.95
+# Percentile bootstrap intervals are too narrow on a handful of samples;
+# below this many trials on either side a difference gets no verdict.
+MIN_TRIALS = 5
+SEED = 0  # the same results always render the same report
+
+
+def sample_matrix(results) -> np.ndarray:
+    """Trials × METRICS for the results that did not error.
+
+    An errored trial (timeout, API failure) says nothing about the arm, so it
+    is counted but not sampled.
+    """
+    rows = [
+        (r.ok, r.tokens_out, r.duration_s, r.cost_usd) for r in results if not r.error
+    ]
+    return np.array(rows, dtype=float).reshape(-1, len(METRICS))
+
+
+def _samples(results) -> tuple[np.ndarray, np.ndarray]:
+    """sample_matrix of every trial (for the pass rate) and of the trials
+    that ran to the end (for the footprint columns)."""
+    return sample_matrix(results), sample_matrix(r for r in results if not r.aborted)
+
+
+def _by_column(x: np.ndarray, full: np.ndarray, stat) -> np.ndarray:
+    """stat's pass rate from x and footprint from full, NaN without samples."""
+    out = np.full(len(METRICS), np.nan)
+    out[0] = stat(x)[0]
+    if len(full):
+        out[_FOOTPRINT] = stat(full)[_FOOTPRINT]
+    return out
+
+
+def _bootstrap(x: np.ndarray, full: np.ndarray, rng) -> np.ndarray:
+    """bootstrap_means with the same column split as _by_column."""
+    boot = np.full((RESAMPLES, len(METRICS)), np.nan)
+    boot[:, 0] = bootstrap_means(x[:, :1], rng)[:, 0]
+    if len(full):
+        boot[:, _FOOTPRINT] = bootstrap_means(full[:, _FOOTPRINT], rng)
+    return boot
+
+
+def bootstrap_means(x: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """RESAMPLES × METRICS: column means of x resampled with replacement.
+
+    Each resample is reduced to how often it drew each trial (one bincount
+    over all of them), so the means are a single (RESAMPLES × trials) @
+    (trials × METRICS) product rather than a RESAMPLES × trials × METRICS
+    gather.
+    """
+    n = len(x)
+    draws = rng.integers(0, n, size=(RESAMPLES, n))
+    draws += np.arange(RESAMPLES)[:, None] * n
+    counts = np.bincount(draws.ravel(), minlength=RESAMPLES * n)
+    return counts.reshape(RESAMPLES, n) @ x / n
+
+
+def _interval(boot: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    tail = (1 - CONFIDENCE) / 2 * 100
+    low, high = np.percentile(boot, [tail, 100 - tail], axis=0)
+    return low, high
+
+
+@dataclass
+class CellStats:
+    n: int
+    errors: int
+    aborted: int
+    mean: np.ndarray
+    median: np.ndarray
+    p90: np.ndarray
+    ci_low: np.ndarray
+    ci_high: np.ndarray
+
+
+@dataclass
+class Difference:
+    """arm minus baseline, per metric."""
+
+    delta: np.ndarray
+    ci_low: np.ndarray
+    ci_high: np.ndarray
+    verdict: np.ndarray  # per metric, whether the samples are large enough
+
+    @property
+    def significant(self) -> np.ndarray:
+        return self.verdict & ((self.ci_low > 0) | (self.ci_high < 0))
+
+
+def summarise(results, rng: np.random.Generator) -> CellStats | None:
+    """Stats of one cell's trials; None when every trial errored."""
+    x, full = _samples(results)
+    if not len(x):
+        return None
+    low, high = _interval(_bootstrap(x, full, rng))
+    return CellStats(
+        n=len(x),
+        errors=len(results) - len(x),
+        aborted=len(x) - len(full),
+        mean=_by_column(x, full, lambda m: m.mean(axis=0)),
+        median=_by_column(x, full, lambda m: np.median(m, axis=0)),
+        p90=_by_column(x, full, lambda m: np.percentile(m, 90, axis=0)),
+        ci_low=low,
+        ci_high=high,
+    )
+
+
+def compare(results, baseline, rng: np.random.Generator) -> Difference | None:
+    """Difference of means between two cells, with a bootstrap interval."""
+    (xa, fa), (xb, fb) = _samples(results), _samples(baseline)
+    if not len(xa) or not len(xb):
+        return None
+    low, high = _interval(_bootstrap(xa, fa, rng) - _bootstrap(xb, fb, rng))
+    verdict = np.full(len(METRICS), min(len(fa), len(fb)) >= MIN_TRIALS)
+    verdict[0] = min(len(xa), len(xb)) >= MIN_TRIALS
+    return Difference(
+        delta=_by_column(xa, fa, lambda m: m.mean(axis=0))
+        - _by_column(xb, fb, lambda m: m.mean(axis=0)),
+        ci_low=low,
+        ci_high=high,
+        verdict=verdict,
+    )
+
+
+def _fmt(i: int, value: float, signed: bool = False) -> str:
+    spec = _FORMATS[i].replace("{:", "{:+") if signed else _FORMATS[i]
+    return spec.format(value + 0.0)  # + 0.0 turns -0.0 into 0.0
+
+
+def render(results, baseline: str) -> list[str]:
+    """Markdown sections for report.md: per-cell trial stats, then each arm's
+    difference from baseline per task."""
+    rng = np.random.default_rng(SEED)
+    cells: dict[tuple[str, str], list] = {}
+    for r in results:
+        cells.setdefault((r.task_id, r.arm), []).append(r)
+    pct = f"{CONFIDENCE:.0%}"
+
+    lines = [
+        "## Trials (per cell)",
+        "",
+        f"Mean [{pct} bootstrap CI] / median / p90 over trials that did not error. "
+        "Trials stopped at a failed hard gate count towards the pass rate only.",
+        "",
+        "| task | arm | n | " + " | ".join(METRICS) + " |",
+        "|---|---|---|" + "---|" * len(METRICS),
+    ]
+    for (tid, arm), rs in sorted(cells.items()):
+        stats = summarise(rs, rng)
+        if stats is None:
+            lines.append(
+                f"| {tid} | {arm} | 0 ({len(rs)} ERR) |" + " — |" * len(METRICS)
+            )
+            continue
+        n = f"{stats.n}" + (f" ({stats.errors} ERR)" if stats.errors else "")
+        n += f" ({stats.aborted} aborted)" if stats.aborted else ""
+        row = [tid, arm, n]
+        for i in range(len(METRICS)):
+            if np.isnan(stats.mean[i]):
+                row.append("—")
+                continue
+            text = (
+                f"{_fmt(i, stats.mean[i])} "
+                f"[{_fmt(i, stats.ci_low[i])}, {_fmt(i, stats.ci_high[i])}]"
+            )
+            if i:  # a pass rate's median and p90 are 0 or 1, not informative
+                text += f" / {_fmt(i, stats.median[i])} / {_fmt(i, stats.p90[i])}"
+            row.append(text)
+        lines.append("| " + " | ".join(row) + " |")
+
+    arms = sorted({arm for _, arm in cells})
+    if baseline not in arms or len(arms) < 2:
+        return lines
+    lines += [
+        "",
+        f"## Arm differences (vs {baseline})",
+        "",
+        f"Difference of means [{pct} bootstrap CI]. ✓ marks an interval that "
+        "excludes 0: the difference exceeds the trial-to-trial noise. "
+        f"Cells with fewer than {MIN_TRIALS} trials on either side get no ✓; "
+        "aborted trials count towards the pass rate only.",
+        "",
+        "| task | arm | " + " | ".join(f"Δ {m}" for m in METRICS) + " |",
+        "|---|---|" + "---|" * len(METRICS),
+    ]
+    for tid in sorted({tid for tid, _ in cells}):
+        base = cells.get((tid, baseline))
+        for arm in arms:
+            if arm == baseline or base is None or (tid, arm) not in cells:
+                continue
+            diff = compare(cells[tid, arm], base, rng)
+            if diff is None:
+                lines.append(f"| {tid} | {arm} |" + " — |" * len(METRICS))
+                continue
+            row = [tid, arm]
+            for i in range(len(METRICS)):
+                if np.isnan(diff.delta[i]):
+                    row.append("—")
+                    continue
+                text = (
+                    f"{_fmt(i, diff.delta[i], signed=True)} "
+                    f"[{_fmt(i, diff.ci_low[i], signed=True)}, "
+                    f"{_fmt(i, diff.ci_high[i], signed=True)}]"
+                )
+                row.append(text + (" ✓" if diff.significant[i] else ""))
+            lines.append("| " + " | ".join(row) + " |")
+    return lines
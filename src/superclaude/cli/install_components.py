@@ -11,6 +11,9 @@ import sys
 from pathlib import Path
 from typing import List, Tuple
 
+from superclaude.hooks.hookd import SERVED_SCRIPTS as HOOKD_SERVED_SCRIPTS
+from superclaude.scripts.content_index import build_index
+
 from .install_git_exclude import add_local_git_exclude
 from .install_paths import (
     COMPONENTS,
@@ -20,6 +23,7 @@ from .install_paths import (
 )
 from .install_settings import (
     CLAUDE_SC_IMPORT,
+    HOOK_CLIENT_SCRIPT,
     check_claude_md_import,
     merge_hooks_to_settings,
     update_claude_md_import,
@@ -305,8 +309,26 @@ def install_claude_sc_md(
         return False, f"Failed to install CLAUDE_SC.md: {e}"
 
 
+def route_hooks_through_daemon(hooks_content: str) -> str:
+    """Rewrite the daemon-served hook commands to go through the client shim.
+
+    Applied to the untransformed hooks.json text, so `{{SCRIPTS_PATH}}` is
+    substituted in both halves of the command afterwards. Hooks the daemon does
+    not serve keep their direct call.
+    """
+    for stem in HOOKD_SERVED_SCRIPTS:
+        hooks_content = hooks_content.replace(
+            f"{{{{SCRIPTS_PATH}}}}/{stem}.py",
+            f"{{{{SCRIPTS_PATH}}}}/{HOOK_CLIENT_SCRIPT} {{{{SCRIPTS_PATH}}}}/{stem}.py",
+        )
+    return hooks_content
+
+
 def install_hooks_and_scripts(
-    base_path: Path = None, force: bool = False, scope: str = "user"
+    base_path: Path = None,
+    force: bool = False,
+    scope: str = "user",
+    hook_daemon: bool = False,
 ) -> Tuple[int, int, int, List[str]]:
     """
     Install hooks configuration and scripts.
@@ -319,6 +341,7 @@ def install_hooks_and_scripts(
         base_path: Base installation path (default: ~/.claude)
         force: Force reinstall
         scope: Installation scope ("user", "project", or "target")
+        hook_daemon: Register the daemon-served hooks through hook_client.py
 
     Returns:
         Tuple of (installed_count, skipped_count, failed_count, messages)
@@ -382,6 +405,8 @@ def install_hooks_and_scripts(
     if hooks_json_file.exists():
         try:
             raw_content = hooks_json_file.read_text(encoding="utf-8")
+            if hook_daemon:
+                raw_content = route_hooks_through_daemon(raw_content)
             # Use forward slashes for JSON compatibility (works on all platforms)
             scripts_path_json_safe = scripts_path_for_hooks.replace("\\", "/")
             # Python binary: bake absolute path to the Python running the installer.
@@ -443,7 +468,10 @@ def install_hooks_and_scripts(
 
 
 def install_all(
-    base_path: Path = None, force: bool = False, scope: str = "user"
+    base_path: Path = None,
+    force: bool = False,
+    scope: str = "user",
+    hook_daemon: bool = False,
 ) -> Tuple[bool, str]:
     """
     Install all SuperClaude components.
@@ -452,6 +480,7 @@ def install_all(
         base_path: Base installation path (default: ~/.claude)
         force: Force reinstall if components exist
         scope: Installation scope ("user", "project", or "target")
+        hook_daemon: Route the hot hooks through the `superclaude hookd` client
 
     Returns:
         Tuple of (success: bool, message: str)
@@ -491,9 +520,20 @@ def install_all(
             for name in failed_names:
                 messages.append(f"   - {name}")
 
+    # Pack the injectable context files into the index context_loader reads.
+    # Rebuilt on every install: copy2 over an existing file leaves its
+    # directory's mtime alone, so the loader's own staleness check would miss
+    # an upgrade that only changed file contents.
+    try:
+        indexed = build_index(base_path / "superclaude")
+        messages.append(f"✅ Content index: {indexed} files")
+    except OSError as e:
+        total_failed += 1
+        messages.append(f"❌ Content index: {e}")
+
     # Install hooks and scripts
     hooks_installed, hooks_skipped, hooks_failed, hooks_messages = (
-        install_hooks_and_scripts(base_path, force, scope)
+        install_hooks_and_scripts(base_path, force, scope, hook_daemon)
     )
     total_installed += hooks_installed
     total_skipped += hooks_skipped
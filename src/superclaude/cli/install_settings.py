@@ -34,6 +34,24 @@ SUPERCLAUDE_HOOK_MARKERS = [
 _SC_SCRIPTS_PATH_RE = re.compile(r"superclaude[/\\]scripts[/\\]")
 _HOOK_SCRIPT_RE = re.compile(r"([A-Za-z0-9_]+\.py)(?=\s|$)(.*)$")
 
+# The hook daemon's client shim. `install --hook-daemon` registers
+# `hook_client.py <script>.py` in place of `<script>.py`, and the two are the
+# same hook for identity purposes.
+HOOK_CLIENT_SCRIPT = "hook_client.py"
+
+# Hooks that replace others on the same event, by entry point. When a release
+# ships the key, a non-`--force` merge removes the registrations it replaced:
+# leaving them would run each guard twice per tool call, once on its own and
+# once inside the dispatcher. Scoped to the event array being merged, so
+# loop_guard's PostToolUse registration is untouched.
+SUPERSEDED_HOOKS = {
+    ("guard_dispatch.py", ""): {
+        ("file_size_guard.py", ""),
+        ("destructive_guard.py", ""),
+        ("loop_guard.py", ""),
+    },
+}
+
 
 def _load_settings(settings_file: Path) -> dict:
     """
@@ -111,12 +129,18 @@ def _hook_script_id(hook: dict) -> Tuple[str, str]:
     Only the first bare argument counts as the subcommand — anything starting
     with `-` is an option, and options are exactly what drifts between releases.
 
+    The hook daemon's client shim is seen through: `hook_client.py loop_guard.py`
+    is loop_guard. Otherwise opting in or out of the daemon would read as every
+    served hook missing and an unknown one registered in its place.
+
     A command that runs no .py file falls back to its normalised text.
     """
     command = hook.get("command", "")
     match = _HOOK_SCRIPT_RE.search(command)
     if not match:
         return (" ".join(command.split()), "")
+    if match.group(1) == HOOK_CLIENT_SCRIPT and match.group(2).strip():
+        return _hook_script_id({"command": match.group(2)})
     tokens = match.group(2).split()
     subcommand = tokens[0] if tokens and not tokens[0].startswith("-") else ""
     return (match.group(1), subcommand)
@@ -226,6 +250,33 @@ def _strip_sc_inner_hooks(hook_array: List[dict]) -> Tuple[List[dict], bool]:
     return kept, changed
 
 
+def _drop_superseded(existing: List[dict], new_hooks: List[dict]) -> List[dict]:
+    """Remove our inner hooks that a hook in *new_hooks* supersedes.
+
+    User hooks stay, and an entry left with nothing inside is dropped.
+    """
+    superseded = set()
+    for entry in new_hooks:
+        for hook in entry.get("hooks", []):
+            superseded |= SUPERSEDED_HOOKS.get(_hook_script_id(hook), set())
+    if not superseded:
+        return existing
+
+    kept: List[dict] = []
+    for entry in existing:
+        sc_hooks, user_hooks = _split_entry(entry)
+        stale = [h for h in sc_hooks if _hook_script_id(h) in superseded]
+        if not stale:
+            kept.append(entry)
+            continue
+        remaining = [h for h in entry.get("hooks", []) if h not in stale]
+        if remaining:
+            reduced = {key: value for key, value in entry.items() if key != "hooks"}
+            reduced["hooks"] = remaining
+            kept.append(reduced)
+    return kept
+
+
 def _merge_hook_arrays(
     existing: List[dict], new_hooks: List[dict], force: bool = False
 ) -> List[dict]:
@@ -248,6 +299,7 @@ def _merge_hook_arrays(
         kept, _changed = _strip_sc_inner_hooks(existing)
         return kept + new_hooks
 
+    existing = _drop_superseded(existing, new_hooks)
     existing_sc_hooks = [h for h in existing if _is_superclaude_hook(h)]
     if not existing_sc_hooks:
         return existing + new_hooks
@@ -4,7 +4,6 @@ SuperClaude CLI Main Entry Point
 Provides command-line interface for SuperClaude operations.
 """
 
-import re
 import sys
 from pathlib import Path
 
@@ -98,8 +97,19 @@ def _stdin_can_answer() -> bool:
     is_flag=True,
     help="Step-by-step wizard: scope, optional git init, force, preview, confirm",
 )
+@click.option(
+    "--hook-daemon",
+    "hook_daemon",
+    is_flag=True,
+    help="Route hot hooks through `superclaude hookd` when it is running (falls back to a subprocess)",
+)
 def install(
-    force: bool, list_only: bool, list_all: bool, scope: str, interactive: bool
+    force: bool,
+    list_only: bool,
+    list_all: bool,
+    scope: str,
+    interactive: bool,
+    hook_daemon: bool,
 ):
     """
     Install all SuperClaude components to Claude Code
@@ -122,6 +132,7 @@ def install(
         superclaude install --scope project
         superclaude install --scope local
         superclaude install --list
+        superclaude install --force --hook-daemon
     """
     from .install_commands import (
         get_base_path,
@@ -138,7 +149,14 @@ def install(
     ctx = click.get_current_context()
 
     def _all_defaults() -> bool:
-        for opt in ("force", "list_only", "list_all", "scope", "interactive"):
+        for opt in (
+            "force",
+            "list_only",
+            "list_all",
+            "scope",
+            "interactive",
+            "hook_daemon",
+        ):
             src = ctx.get_parameter_source(opt)
             if src is None or src.name != "DEFAULT":
                 return False
@@ -220,9 +238,16 @@ def install(
     click.echo(f"📦 Installing SuperClaude components (scope: {scope})...")
     click.echo()
 
-    success, message = install_all(base_path=base_path, force=force, scope=scope)
+    success, message = install_all(
+        base_path=base_path, force=force, scope=scope, hook_daemon=hook_daemon
+    )
 
     click.echo(message)
+    if hook_daemon:
+        click.echo(
+            "\n⚡ Hook daemon routing enabled — start it per project with "
+            "`superclaude hookd` (hooks run normally while it is stopped)"
+        )
 
     if not success:
         sys.exit(1)
@@ -428,6 +453,76 @@ def update(scope: str):
         sys.exit(1)
 
 
+@main.command()
+@click.option(
+    "--project",
+    "project_dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="Project whose hooks to serve (default: $CLAUDE_PROJECT_DIR, else the current directory)",
+)
+@click.option(
+    "--idle-timeout",
+    type=float,
+    default=None,
+    help="Exit after this many seconds without a hook request (default: 4h)",
+)
+@click.option("--status", is_flag=True, help="Report whether a daemon is running")
+@click.option("--stop", is_flag=True, help="Stop the running daemon")
+def hookd(
+    project_dir: Path | None, idle_timeout: float | None, status: bool, stop: bool
+):
+    """
+    Serve hot hooks from one warm process (opt-in)
+
+    Runs context_loader, guard_dispatch and loop_guard in-process for one
+    project, on a Unix socket under its hook state directory. Hooks reach it
+    only when installed with --hook-daemon; while it is stopped they run as
+    ordinary subprocesses.
+
+    Examples:
+        superclaude install --force --hook-daemon
+        superclaude hookd
+        superclaude hookd --status
+        superclaude hookd --stop
+    """
+    import os
+
+    from superclaude.hooks import hookd as daemon
+    from superclaude.utils import hookd_socket_path
+
+    # The socket path and every served script resolve from the project root,
+    # so pin it before either is computed.
+    if project_dir is not None:
+        os.environ["CLAUDE_PROJECT_DIR"] = str(project_dir.resolve())
+    elif not os.environ.get("CLAUDE_PROJECT_DIR"):
+        os.environ["CLAUDE_PROJECT_DIR"] = str(Path.cwd().resolve())
+    socket_path = hookd_socket_path()
+
+    if status or stop:
+        reply = daemon.send_control("shutdown" if stop else "ping", socket_path)
+        if reply is None:
+            click.echo(f"⬜ No hook daemon listening on {socket_path}")
+            sys.exit(1 if status else 0)
+        if stop:
+            click.echo("🛑 Hook daemon stopped")
+        else:
+            click.echo(
+                f"✅ Hook daemon running (pid {reply.get('pid')}) on {socket_path}"
+            )
+        return
+
+    timeout = daemon.DEFAULT_IDLE_TIMEOUT if idle_timeout is None else idle_timeout
+    click.echo(f"⚡ Hook daemon listening on {socket_path} (Ctrl-C to stop)")
+    try:
+        daemon.serve(socket_path, idle_timeout=timeout)
+    except daemon.HookdError as e:
+        click.echo(f"❌ {e}", err=True)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass
+
+
 @main.command()
 @click.argument("skill_name")
 @click.option(
@@ -578,13 +673,12 @@ def agents(list_only: bool, agent_name: str, tokens: bool, scope: str):
         total_frontmatter = 0
         total_full = 0
 
-        for agent_file in agent_files:
-            content = agent_file.read_text(encoding="utf-8")
-            full_tokens = len(content) // 4  # CHARS_PER_TOKEN
+        from superclaude.scripts.token_estimator import estimate_agent_tokens
 
-            # Extract frontmatter
-            match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
-            frontmatter_tokens = len(match.group(1)) // 4 if match else 0
+        for agent_file in agent_files:
+            estimate = estimate_agent_tokens(agent_file)
+            full_tokens = estimate.full_tokens
+            frontmatter_tokens = estimate.frontmatter_tokens
 
             total_frontmatter += frontmatter_tokens
             total_full += full_tokens
@@ -629,8 +723,12 @@ def agents(list_only: bool, agent_name: str, tokens: bool, scope: str):
         if fm.get("context"):
             click.echo(f"   Context: {fm.get('context')}")
 
+        from superclaude.scripts.token_estimator import estimate_agent_tokens
+
+        # The estimator `agents --tokens` uses, so the two views agree
+        estimate = estimate_agent_tokens(agent_file)
         click.echo(f"\n   File: {agent_file}")
-        click.echo(f"   Tokens: ~{len(content) // 4}")
+        click.echo(f"   Tokens: ~{estimate.full_tokens}")
         return
 
     # Default: list agents
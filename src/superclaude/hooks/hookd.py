@@ -0,0 +1,280 @@
+"""Opt-in hook daemon: serve the hottest hook scripts from one warm process.
+
+Every hooks.json entry starts a fresh interpreter, so each prompt and each
+Edit/Write/Bash call pays for interpreter start, imports and path resolution
+before the hook does any work. ``superclaude hookd`` keeps one process per
+project listening on ``hookd_socket_path()`` and runs the served scripts'
+``main()`` in-process. The client shim (``scripts/hook_client.py``) is what
+hooks.json invokes when the install opted in with ``--hook-daemon``; with no
+daemon listening it runs the script itself, so stopping the daemon never stops
+a hook.
+
+Wire protocol: one JSON object per connection each way, newline-terminated.
+Request ``{"script", "argv", "stdin", "env"}``, reply
+``{"stdout", "stderr", "exit"}`` — or ``{"served": false}`` for a script the
+daemon does not run, which the client then runs itself. ``{"op": "ping"}`` and
+``{"op": "shutdown"}`` are the control messages.
+
+Each connection is accepted on its own thread, but hooks run one at a time:
+the scripts print to ``sys.stdout`` and read ``sys.stdin``, which are
+process-global, so serialising is what keeps two hooks' output apart — and
+every served hook is a few milliseconds once warm. A request that cannot start
+within ``RUN_WAIT_SECONDS`` is refused unrun, like an unserved script, and the
+client runs it itself. Queued behind a stuck hook it would instead have waited
+out the client's reply timeout, and a guard that never answers allows the call.
+
+Module-level settings in the served scripts (``CLAUDE_CONTEXT_MAX_TOKENS``,
+``SUPERCLAUDE_PATH``) are read when the daemon first imports them; restart the
+daemon after changing one. Settings read per call, such as
+``SUPERCLAUDE_LOOP_GUARD=0``, follow the hook's own environment.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+
+from superclaude.utils import hookd_socket_path
+
+# Scripts the daemon runs in-process, by installed script stem. Anything else
+# sent to the socket is refused, and the client runs the script itself.
+SERVED_SCRIPTS = {
+    "context_loader": "superclaude.scripts.context_loader",
+    "loop_guard": "superclaude.scripts.loop_guard",
+    "guard_dispatch": "superclaude.scripts.guard_dispatch",
+}
+
+# Hook environment forwarded per request. Claude Code sets CLAUDE_* for each
+# hook, and SUPERCLAUDE_* carries the per-hook opt-outs.
+FORWARDED_ENV_PREFIXES = ("CLAUDE_", "SUPERCLAUDE_")
+
+# Exit after this long with no requests, so a forgotten daemon does not outlive
+# the work it was started for.
+DEFAULT_IDLE_TIMEOUT = 4 * 60 * 60
+
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+# How long a request waits for the hook running ahead of it before the client
+# is told to run the script itself — well under the client's reply timeout.
+RUN_WAIT_SECONDS = 1.0
+
+# Held while a hook runs with the process's stdio redirected to it.
+_RUN_LOCK = threading.Lock()
+
+# How often the accept loop looks up from the socket: a shutdown message is
+# handled on its connection's thread, and the loop notices it on the next poll.
+_POLL_SECONDS = 0.2
+
+
+class HookdError(Exception):
+    """Raised when the daemon cannot start (socket in use, no AF_UNIX)."""
+
+
+@contextlib.contextmanager
+def _hook_environment(env: dict[str, str]):
+    """Apply one hook's CLAUDE_*/SUPERCLAUDE_* variables for the call's duration.
+
+    Forwarded keys replace the daemon's own, and a key the hook did not carry is
+    removed — a SUPERCLAUDE_LOOP_GUARD=0 in one hook must not leak into the next.
+    """
+    saved = {
+        key: value
+        for key, value in os.environ.items()
+        if key.startswith(FORWARDED_ENV_PREFIXES)
+    }
+    for key in saved:
+        if key not in env:
+            del os.environ[key]
+    os.environ.update(env)
+    try:
+        yield
+    finally:
+        for key in [k for k in os.environ if k.startswith(FORWARDED_ENV_PREFIXES)]:
+            del os.environ[key]
+        os.environ.update(saved)
+
+
+def run_hook(script: str, argv: list[str], stdin: str, env: dict[str, str]) -> dict:
+    """Run one served script's main() with redirected stdio.
+
+    Args:
+        script: Script stem, e.g. "loop_guard"
+        argv: Arguments after the script path
+        stdin: The hook payload Claude Code wrote to the client's stdin
+        env: The client's CLAUDE_*/SUPERCLAUDE_* environment
+
+    Returns:
+        Reply dict with stdout, stderr and exit code
+    """
+    module_name = SERVED_SCRIPTS.get(script)
+    if module_name is None:
+        return {"served": False, "stdout": "", "stderr": "", "exit": 0}
+
+    out, err = io.StringIO(), io.StringIO()
+    saved_stdin, saved_argv = sys.stdin, sys.argv
+    sys.stdin = io.StringIO(stdin)
+    sys.argv = [f"{script}.py", *argv]
+    code = 0
+    try:
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(_hook_environment(env))
+            stack.enter_context(contextlib.redirect_stdout(out))
+            stack.enter_context(contextlib.redirect_stderr(err))
+            try:
+                importlib.import_module(module_name).main()
+            except SystemExit as exc:
+                code = exc.code if isinstance(exc.code, int) else int(bool(exc.code))
+            except Exception:
+                traceback.print_exc()
+                code = 1
+    finally:
+        sys.stdin, sys.argv = saved_stdin, saved_argv
+    return {"stdout": out.getvalue(), "stderr": err.getvalue(), "exit": code}
+
+
+class _HookRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline(MAX_REQUEST_BYTES))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return
+        if not isinstance(request, dict):
+            return
+
+        op = request.get("op", "run")
+        if op == "ping":
+            reply = {"ok": True, "pid": os.getpid()}
+        elif op == "shutdown":
+            self.server.stopping = True
+            reply = {"ok": True}
+        elif not _RUN_LOCK.acquire(timeout=RUN_WAIT_SECONDS):
+            reply = {"served": False, "busy": True}
+        else:
+            env = request.get("env") or {}
+            try:
+                reply = run_hook(
+                    str(request.get("script", "")),
+                    [str(a) for a in request.get("argv") or []],
+                    str(request.get("stdin", "")),
+                    {
+                        str(k): str(v)
+                        for k, v in env.items()
+                        if str(k).startswith(FORWARDED_ENV_PREFIXES)
+                    },
+                )
+            finally:
+                _RUN_LOCK.release()
+        self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+
+
+class HookServer(socketserver.ThreadingUnixStreamServer):
+    stopping = False
+    idle_timeout = DEFAULT_IDLE_TIMEOUT
+    last_request = 0.0
+
+    def process_request(self, request, client_address) -> None:
+        self.last_request = time.monotonic()
+        super().process_request(request, client_address)
+
+    def handle_timeout(self) -> None:
+        if time.monotonic() - self.last_request >= self.idle_timeout:
+            self.stopping = True
+
+
+def _socket_is_live(path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        probe.settimeout(0.5)
+        try:
+            probe.connect(str(path))
+        except OSError:
+            return False
+    return True
+
+
+def _preload() -> None:
+    """Import every served script up front, so the first hook is already warm."""
+    for module_name in SERVED_SCRIPTS.values():
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            # A broken script fails its own hooks with a traceback, not the
+            # daemon's startup for the other three.
+            continue
+
+
+def create_server(
+    path: Path | None = None, idle_timeout: float = DEFAULT_IDLE_TIMEOUT
+) -> HookServer:
+    """Bind the daemon socket, replacing a stale one left by a crashed daemon.
+
+    Raises:
+        HookdError: AF_UNIX is unavailable, or another daemon already owns the
+            socket
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise HookdError("hook daemon needs Unix domain sockets (AF_UNIX)")
+    path = path or hookd_socket_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        if _socket_is_live(path):
+            raise HookdError(f"a hook daemon is already listening on {path}")
+        path.unlink()
+
+    # The socket runs hooks with this user's permissions, so nobody else may
+    # connect to it.
+    old_umask = os.umask(0o177)
+    try:
+        server = HookServer(str(path), _HookRequestHandler)
+    finally:
+        os.umask(old_umask)
+    server.idle_timeout = idle_timeout
+    server.last_request = time.monotonic()
+    server.timeout = min(idle_timeout, _POLL_SECONDS)
+    return server
+
+
+def serve_until_stopped(server: HookServer) -> None:
+    """Handle requests until a shutdown message or the idle timeout."""
+    while not server.stopping:
+        server.handle_request()
+
+
+def serve(path: Path | None = None, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> None:
+    """Serve hook requests until shut down or idle for idle_timeout seconds."""
+    server = create_server(path, idle_timeout)
+    _preload()
+    try:
+        serve_until_stopped(server)
+    finally:
+        server.server_close()
+        with contextlib.suppress(OSError):
+            Path(server.server_address).unlink()
+
+
+def send_control(op: str, path: Path | None = None) -> dict | None:
+    """Send a control message ("ping" or "shutdown") to a running daemon.
+
+    Returns:
+        The daemon's reply, or None when nothing is listening
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    path = path or hookd_socket_path()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(2)
+            conn.connect(str(path))
+            conn.sendall(json.dumps({"op": op}).encode("utf-8") + b"\n")
+            return json.loads(conn.makefile("rb").readline())
+    except (OSError, json.JSONDecodeError):
+        return None
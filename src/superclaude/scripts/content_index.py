@@ -0,0 +1,297 @@
+"""Precompiled index of the context files context_loader injects.
+
+Every prompt that triggers a context used to cost one ``exists()`` per Tier 0
+hint and one ``read_text()`` plus a ``len // 4`` per Tier 2 file, each against
+``.claude/superclaude/<dir>/<file>.md``. ``superclaude install`` now packs those
+files into one blob, ``.claude/superclaude/content.idx``, so the loader answers
+"is it installed / how many tokens / give me the text" from a single open and
+mmap.
+
+Layout::
+
+    MAGIC (8 bytes) | header length (uint32 LE) | header JSON | file bytes...
+
+The header maps each relative path to ``[offset, size, tokens, sha256,
+mtime_ns]``, with offsets counted from the end of the header, and records the
+``st_mtime_ns`` of every indexed directory and the tokenizer the counts came
+from. Opening the index stats each directory against its stamp: a moved
+directory mtime means a file was added, removed or replaced by rename, and the
+index is rebuilt before use. An edit in place leaves the directory alone, so
+each file is stat'ed too, but only once a lookup asks for it — a prompt that
+injects two files pays two stats, not one per indexed file. A file whose size
+or mtime moved rebuilds the index before it is served. Should that rebuild
+fail, the file is served from disk.
+
+Stdlib-only, like the rest of what the hooks import.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+
+from superclaude.scripts.token_estimator import estimate_tokens, get_tokenizer
+
+INDEX_NAME = "content.idx"
+
+# Directories under the content root whose *.md files the loader can inject.
+# core/ covers the on-demand references, core/rules/ the split rule modules.
+INDEXED_DIRS = ("core", "core/rules", "modes", "mcp")
+
+MAGIC = b"SCIDX02\n"  # 02: per-file mtime_ns
+_LENGTH = struct.Struct("<I")
+
+
+def _dir_stamps(root: Path) -> dict[str, int]:
+    """st_mtime_ns of each indexed directory (-1 when it does not exist)."""
+    stamps = {}
+    for directory in INDEXED_DIRS:
+        try:
+            stamps[directory] = (root / directory).stat().st_mtime_ns
+        except OSError:
+            stamps[directory] = -1
+    return stamps
+
+
+def _scan(root: Path) -> dict[str, tuple[os.stat_result, bytes]]:
+    """Relative path → (stat, bytes) for every indexable file under root, sorted.
+
+    Each file is stat'ed before it is read, so an edit racing the read leaves
+    a stamp that no longer matches, not bytes that look current.
+    """
+    files = {}
+    for directory in INDEXED_DIRS:
+        try:
+            paths = sorted((root / directory).glob("*.md"))
+        except OSError:
+            continue
+        for path in paths:
+            if path.stem.upper() == "README":
+                continue
+            try:
+                files[f"{directory}/{path.name}"] = (path.stat(), path.read_bytes())
+            except OSError:
+                continue
+    return files
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def build_index(root: Path) -> int:
+    """Write root/content.idx from the files on disk, atomically.
+
+    Files that are not valid UTF-8 are left out: the loader could not inject
+    them either.
+
+    Args:
+        root: Content root (``.claude/superclaude`` or ``SUPERCLAUDE_PATH``)
+
+    Returns:
+        Number of files indexed
+    """
+    root = Path(root)
+    stamps = _dir_stamps(root)
+    entries: dict[str, list] = {}
+    chunks = []
+    offset = 0
+    for name, (stat, data) in _scan(root).items():
+        try:
+            text = data.decode("utf-8")
+        except UnicodeDecodeError:
+            continue
+        entries[name] = [
+            offset,
+            len(data),
+            estimate_tokens(text),
+            _digest(data),
+            stat.st_mtime_ns,
+        ]
+        chunks.append(data)
+        offset += len(data)
+
+    header = json.dumps(
+        {"dirs": stamps, "tokenizer": get_tokenizer().name, "files": entries},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    fd, tmp_path = tempfile.mkstemp(dir=root, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC)
+            f.write(_LENGTH.pack(len(header)))
+            f.write(header)
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, root / INDEX_NAME)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return len(entries)
+
+
+class ContentIndex:
+    """Read side of content.idx: lookups against one mmap of the blob."""
+
+    def __init__(
+        self, root: Path, blob: mmap.mmap, header: dict, data_start: int
+    ) -> None:
+        self._root = root
+        self._blob = blob
+        self._files: dict[str, list] = header["files"]
+        self._dirs: dict[str, int] = header["dirs"]
+        self._tokenizer = header.get("tokenizer")
+        self._data_start = data_start
+        # Names stat'ed against their entry since the index was opened
+        self._checked: set[str] = set()
+        # (bytes, tokens) read from disk for files the index could not catch up
+        # with; None for one that could not be read either
+        self._disk: dict[str, tuple[bytes, int] | None] = {}
+
+    @classmethod
+    def _open(cls, root: Path) -> ContentIndex | None:
+        try:
+            with open(root / INDEX_NAME, "rb") as f:
+                blob = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):  # ValueError: mmap of an empty file
+            return None
+        try:
+            if blob[: len(MAGIC)] != MAGIC:
+                raise ValueError("not a content index")
+            start = len(MAGIC) + _LENGTH.size
+            (length,) = _LENGTH.unpack(blob[len(MAGIC) : start])
+            header = json.loads(blob[start : start + length])
+            return cls(root, blob, header, start + length)
+        except (ValueError, KeyError, TypeError, struct.error):
+            blob.close()
+            return None
+
+    def close(self) -> None:
+        self._blob.close()
+
+    def __enter__(self) -> ContentIndex:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @staticmethod
+    def covers(name: str) -> bool:
+        """Whether name lives in an indexed directory, so absence is meaningful."""
+        return name.rsplit("/", 1)[0] in INDEXED_DIRS if "/" in name else False
+
+    def __contains__(self, name: str) -> bool:
+        if name in self._disk:
+            return self._disk[name] is not None
+        return self._entry(name) is not None
+
+    def tokens(self, name: str) -> int | None:
+        if name in self._disk:
+            disk = self._disk[name]
+            return disk[1] if disk else None
+        entry = self._entry(name)
+        return entry[2] if entry else None
+
+    def read_bytes(self, name: str) -> bytes | None:
+        if name in self._disk:
+            disk = self._disk[name]
+            return disk[0] if disk else None
+        entry = self._entry(name)
+        if entry is None:
+            return None
+        offset, size = self._data_start + entry[0], entry[1]
+        return self._blob[offset : offset + size]
+
+    def read_text(self, name: str) -> str | None:
+        data = self.read_bytes(name)
+        return data.decode("utf-8") if data is not None else None
+
+    def _file_is_current(self, name: str) -> bool:
+        entry = self._files[name]
+        try:
+            stat = (self._root / name).stat()
+        except OSError:
+            return False
+        return stat.st_size == entry[1] and stat.st_mtime_ns == entry[4]
+
+    def _entry(self, name: str) -> list | None:
+        """name's entry, once its file is known to match it.
+
+        The first lookup of a name stats the file; a mismatch rebuilds the
+        index. Files without an entry need no stat: the directory stamps
+        checked at open already say they are absent.
+        """
+        if name in self._files and name not in self._checked:
+            if not self._file_is_current(name):
+                self._rebuild(name)
+            self._checked.add(name)
+        return self._files.get(name)
+
+    def _rebuild(self, name: str) -> None:
+        """Rebuild the index from disk and remap it, or serve name from disk."""
+        try:
+            build_index(self._root)
+        except OSError:
+            fresh = None
+        else:
+            fresh = ContentIndex._open(self._root)
+        if fresh is None:
+            self._disk[name] = _read_disk(self._root / name)
+            return
+        self._blob.close()
+        self._blob, self._files, self._dirs = fresh._blob, fresh._files, fresh._dirs
+        self._tokenizer, self._data_start = fresh._tokenizer, fresh._data_start
+        # build_index just stamped every file from its stat
+        self._checked = set(self._files)
+
+    def is_current(self, root: Path) -> bool:
+        """Whether the directories and token backend are as at build time.
+
+        A switch of $SUPERCLAUDE_TOKENIZER makes every stored count wrong as
+        surely as an added file does. Edits in place are caught per file, on
+        first lookup.
+        """
+        return (
+            self._tokenizer == get_tokenizer().name and _dir_stamps(root) == self._dirs
+        )
+
+
+def _read_disk(path: Path) -> tuple[bytes, int] | None:
+    try:
+        data = path.read_bytes()
+        return data, estimate_tokens(data.decode("utf-8"))
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def load_index(root: Path) -> ContentIndex | None:
+    """Open root/content.idx, rebuilding it first if its files have changed.
+
+    Returns:
+        The index, or None when root has none (a source tree, an install that
+        predates the index) or it cannot be read or rebuilt — the caller then
+        reads the files directly, as before
+    """
+    root = Path(root)
+    path = root / INDEX_NAME
+    index = ContentIndex._open(root)
+    if index is not None:
+        if index.is_current(root):
+            return index
+        index.close()
+    elif not path.exists():
+        return None
+
+    try:
+        build_index(root)
+    except OSError:
+        return None
+    return ContentIndex._open(root)
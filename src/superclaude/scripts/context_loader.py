@@ -25,17 +25,21 @@ import json
 import os
 import re
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from superclaude.scripts.token_estimator import TokenEstimate
 
+from superclaude.scripts.content_index import ContentIndex, load_index
+from superclaude.scripts.token_estimator import estimate_tokens
+
 # Scope-aware path resolution. Imported unconditionally: superclaude.utils is
 # stdlib-only, and hooks.json runs these scripts with the installer's own
 # interpreter ({{PYTHON_BIN}} = sys.executable), which has the package. Silently
 # degrading here would put state and content lookups in the wrong scope.
-from superclaude.utils import claude_base, context_cache_file
+from superclaude.utils import atomic_write_text, claude_base, context_cache_file
 
 # v2.2.0: MCP fallback notification support
 try:
@@ -55,7 +59,6 @@ INJECT_MODE = os.environ.get("CLAUDE_CONTEXT_INJECT", "1").lower() in (
 MAX_TOKENS_ESTIMATE = int(
     os.environ.get("CLAUDE_CONTEXT_MAX_TOKENS", "8000")
 )  # ~8K tokens
-CHARS_PER_TOKEN = 4  # Rough estimate
 
 # Dedup cache file, keyed on (project, Claude Code session) and stored in the
 # active install's own .claude — see superclaude.utils.hook_state_dir.
@@ -69,11 +72,24 @@ CHARS_PER_TOKEN = 4  # Rough estimate
 # project-only name stays as the fallback for callers holding no session id.
 _ACTIVE_CACHE_FILE: Path | None = None
 
+# The ledger as this run has seen it: (path, markers, file ends mid-line). Read
+# once per run and kept current by mark_as_loaded, so the four stages that
+# consult it per prompt cost one read between them.
+_LEDGER: tuple[Path, set[str], bool] | None = None
+
+# Compact once the ledger holds this many lines more than distinct markers.
+# Markers are only appended when missing, so duplicates come from concurrent
+# runs racing on one session — rare, and harmless beyond the file's size.
+LEDGER_COMPACT_SLACK = 64
+
 
 def resolve_cache_file(session_id: str | None) -> Path:
     """Pin the dedup cache to one (project, session) for the rest of the run."""
-    global _ACTIVE_CACHE_FILE
+    global _ACTIVE_CACHE_FILE, _LEDGER
     _ACTIVE_CACHE_FILE = context_cache_file(session_id)
+    # A new run: the hook daemon keeps this module loaded between prompts, and
+    # another window or context_reset may have changed the file since.
+    _LEDGER = None
     return _ACTIVE_CACHE_FILE
 
 
@@ -217,6 +233,164 @@ COMPOSITE_FLAGS = {
     ],  # Note: Playwright/DevTools are plugin-install-only (docs still loaded)
 }
 
+
+@dataclass(frozen=True)
+class TriggerHits:
+    """What one scan of a prompt matched, by table entry."""
+
+    composite_flags: frozenset[str]
+    triggers: frozenset[int]  # indices into TRIGGER_MAP
+    no_mcp: bool
+
+
+_REGEX_META = set(".^$*+?{}[]|()\\")
+
+
+def _closing_paren(source: str, open_at: int) -> int:
+    """Index of the parenthesis closing the one at open_at, or -1."""
+    depth, escaped = 0, False
+    for i in range(open_at, len(source)):
+        char = source[i]
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+
+def _split_alternatives(source: str) -> list[str] | None:
+    """Top-level `|` alternatives of a regex source, enclosing groups removed.
+
+    None when the source does not split cleanly (unbalanced, a class holding a
+    bracket), which the caller treats as "cannot prefilter".
+    """
+    while (
+        source.startswith("(")
+        and not source.startswith("(?")
+        and _closing_paren(source, 0) == len(source) - 1
+    ):
+        source = source[1:-1]
+
+    parts, current, depth, escaped = [], [], 0, False
+    for char in source:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            parts.append("".join(current))
+            current = []
+            continue
+        current.append(char)
+    if depth != 0:
+        return None
+    parts.append("".join(current))
+    return parts
+
+
+def literal_prefixes(source: str) -> tuple[str, ...] | None:
+    """Literals one of which every match of source must start with.
+
+    None when the source cannot be split or some alternative opens with a
+    metacharacter, in which case the pattern runs unfiltered. A literal followed
+    by an optional quantifier loses its last character, which may be absent.
+    """
+    alternatives = _split_alternatives(source)
+    if alternatives is None:
+        return None
+    prefixes = []
+    for alternative in alternatives:
+        literal = []
+        for char in alternative:
+            if char in _REGEX_META:
+                if char in "?*{" and literal:
+                    literal.pop()
+                break
+            literal.append(char)
+        if not literal:
+            return None
+        prefixes.append("".join(literal).lower())
+    return tuple(prefixes)
+
+
+class TriggerEngine:
+    """Every trigger pattern, composite flag and --no-mcp matched in one scan.
+
+    check_triggers used to run each TRIGGER_MAP pattern over the whole prompt,
+    then a substring scan per composite flag and one more for --no-mcp — about
+    twenty regex passes over a prompt that is often a pasted log or diff, nearly
+    all of them finding nothing. Every alternative of every entry starts with a
+    literal (`--`, `/sc:`, a word), and a match has to start where one of them
+    occurs. So the literals are searched first with str.find, which is a C
+    memchr scan, and an entry's regex runs only when one of its literals is in
+    the prompt — and then only from the first occurrence on.
+
+    Folding everything into one alternation was measured first and was twice as
+    slow as the loop: Python's re tries every branch at every position.
+
+    The result is exactly what the per-entry loop produced; an entry whose
+    literals cannot be derived simply runs unfiltered.
+    """
+
+    _NO_MCP = "--no-mcp"
+
+    def __init__(
+        self,
+        triggers: list[tuple[re.Pattern, str, int]],
+        composite_flags: dict[str, list[tuple[str, int]]],
+    ) -> None:
+        # (kind, key, compiled pattern or None for a plain literal, prefixes)
+        self._entries: list[tuple[str, str | int, re.Pattern | None, tuple | None]]
+        self._entries = [
+            ("composite", flag, None, (flag.lower(),)) for flag in composite_flags
+        ]
+        for i, (pattern, _, _) in enumerate(triggers):
+            self._entries.append(
+                ("trigger", i, pattern, literal_prefixes(pattern.pattern))
+            )
+        self._entries.append(("no_mcp", self._NO_MCP, None, (self._NO_MCP,)))
+
+    def scan(self, text: str) -> TriggerHits:
+        """Match every entry against text, which must already be lowercased."""
+        first_seen: dict[str, int] = {}
+        composite = set()
+        triggers = set()
+        no_mcp = False
+        for kind, key, pattern, prefixes in self._entries:
+            start = 0
+            if prefixes is not None:
+                positions = []
+                for prefix in prefixes:
+                    if prefix not in first_seen:
+                        first_seen[prefix] = text.find(prefix)
+                    if first_seen[prefix] >= 0:
+                        positions.append(first_seen[prefix])
+                if not positions:
+                    continue
+                start = min(positions)
+            if pattern is not None and not pattern.search(text, start):
+                continue
+            if kind == "composite":
+                composite.add(key)
+            elif kind == "trigger":
+                triggers.add(key)
+            else:
+                no_mcp = True
+        return TriggerHits(frozenset(composite), frozenset(triggers), no_mcp)
+
+
+TRIGGER_ENGINE = TriggerEngine(TRIGGER_MAP, COMPOSITE_FLAGS)
+
 # v3.1: Hybrid Injection Map
 # Only entries reachable by _get_injection_tier() belong here:
 #   - Behavioral MCPs (Serena, Tavily) → Tier 1 via _BEHAVIORAL_MCPS check
@@ -298,6 +472,9 @@ _EXTERNAL_RUNNERS = frozenset(
 )
 
 
+_FLAG_TOKEN_RE = re.compile(r"--([a-zA-Z][\w-]*)")
+
+
 def scannable_prompt(prompt: str) -> str:
     """The prompt with mentioned-not-used regions blanked out.
 
@@ -391,20 +568,19 @@ RETIRED_FLAGS: dict[str, str] = {
 }
 
 
-def resolve_flags(prompt: str) -> tuple[str, list[str]]:
+def resolve_flags(prompt: "str | ParsedPrompt") -> tuple[str, list[str]]:
     """Resolve flag aliases and typos in a prompt.
 
     Returns:
         Tuple of (corrected_prompt, list of notification messages)
     """
+    parsed = ParsedPrompt.of(prompt)
     notifications: list[str] = []
-    corrected = prompt
-    scannable = scannable_prompt(prompt)
+    corrected = parsed.raw
 
-    # Find all --flag patterns (flags may have values after them)
-    flag_pattern = re.compile(r"--([a-zA-Z][\w-]*)")
-    for match in flag_pattern.finditer(scannable):
-        flag = match.group(1).lower()
+    # Every --flag token (flags may have values after them)
+    for typed, _offset in parsed.flags:
+        flag = typed.lower()
 
         # Skip already-valid flags
         if flag in VALID_FLAGS:
@@ -418,7 +594,7 @@ def resolve_flags(prompt: str) -> tuple[str, list[str]]:
         if flag in FLAG_ALIASES:
             replacements = FLAG_ALIASES[flag]
             replacement_str = " ".join(f"--{r}" for r in replacements)
-            corrected = corrected.replace(f"--{match.group(1)}", replacement_str, 1)
+            corrected = corrected.replace(f"--{typed}", replacement_str, 1)
             notifications.append(
                 f"--{flag} → auto-corrected to {replacement_str} (alias)"
             )
@@ -485,7 +661,7 @@ def _known_command_names() -> set[str]:
     return set()
 
 
-def resolve_command_name(prompt: str) -> tuple[list[str], set[str]]:
+def resolve_command_name(prompt: "str | ParsedPrompt") -> tuple[list[str], set[str]]:
     """Check the /sc: name in a prompt against what is installed.
 
     Never rewrites the prompt. A wrong name gets one comment naming what it
@@ -505,9 +681,7 @@ def resolve_command_name(prompt: str) -> tuple[list[str], set[str]]:
 
     notifications: list[str] = []
     unresolved: set[str] = set()
-    for name in dict.fromkeys(
-        m.group(1).lower() for m in _COMMAND_TOKEN_RE.finditer(prompt)
-    ):
+    for name in dict.fromkeys(ParsedPrompt.of(prompt).commands):
         if name in known:
             continue
 
@@ -584,59 +758,96 @@ def format_skills_summary(skills: list["TokenEstimate"]) -> str:
     return f"<!-- {len(skills)} skills installed ({skill_names}). ~{total_full} tokens full load. Use /sc:help for details. -->"
 
 
+def _read_ledger(path: Path) -> tuple[set[str], bool]:
+    """Markers in the ledger file, compacting it first if it has grown slack.
+
+    Returns:
+        (markers, whether the file ends without a newline) — files written
+        before the ledger was append-only have no trailing newline
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return set(), False
+    lines = [line for line in text.split("\n") if line]
+    markers = set(lines)
+    if len(lines) - len(markers) > LEDGER_COMPACT_SLACK:
+        # A marker appended by another run between the read above and the
+        # replace is lost with the old file; that costs one re-injection.
+        try:
+            atomic_write_text(path, "".join(f"{m}\n" for m in sorted(markers)))
+            return markers, False
+        except OSError:
+            pass
+    return markers, bool(text) and not text.endswith("\n")
+
+
+def _ledger() -> tuple[Path, set[str], bool]:
+    global _LEDGER
+    path = cache_file()
+    if _LEDGER is None or _LEDGER[0] != path:
+        _LEDGER = (path, *_read_ledger(path))
+    return _LEDGER
+
+
 def get_loaded_contexts() -> set:
     """Read the contexts already injected into this session."""
-    if cache_file().exists():
-        return set(cache_file().read_text().strip().split("\n"))
-    return set()
+    return set(_ledger()[1])
 
 
 def mark_as_loaded(contexts: str | list[str]) -> None:
-    """Mark context(s) as loaded in session cache. Accepts single or batch."""
-    loaded = get_loaded_contexts()
+    """Mark context(s) as loaded in session cache. Accepts single or batch.
+
+    The ledger is append-only: one O_APPEND write for the new markers, never a
+    rewrite. Rewriting the whole file on every call — up to four times a prompt
+    — raced with a concurrent run on the same session, and the last writer
+    dropped whatever the other had just recorded.
+    """
+    global _LEDGER
+    path, loaded, partial = _ledger()
     if isinstance(contexts, str):
-        loaded.add(contexts)
-    else:
-        loaded.update(contexts)
+        contexts = [contexts]
+    new = [c for c in dict.fromkeys(contexts) if c not in loaded]
+    if not new:
+        return
     # Created here rather than at import: importing this module used to mkdir in
     # the developer's real home during pytest collection, before any fixture had
     # redirected HOME.
-    path = cache_file()
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text("\n".join(loaded))
-
-
-def estimate_tokens(content: str) -> int:
-    """Estimate token count from character count."""
-    return len(content) // CHARS_PER_TOKEN
+    payload = ("\n" if partial else "") + "".join(f"{c}\n" for c in new)
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, payload.encode("utf-8"))
+    finally:
+        os.close(fd)
+    _LEDGER = (path, loaded | set(new), False)
 
 
-def check_triggers(prompt: str) -> list[tuple[str, int]]:
+def check_triggers(prompt: "str | ParsedPrompt") -> list[tuple[str, int]]:
     """Check prompt against triggers and return contexts to load with priorities."""
     contexts_to_load = []
     loaded = get_loaded_contexts()
-    prompt_lower = prompt.lower()
-
-    # --no-mcp: suppress all MCP context loading
-    no_mcp = bool(re.search(r"--no-mcp", prompt_lower))
+    lowered = prompt.lowered if isinstance(prompt, ParsedPrompt) else prompt.lower()
+    hits = TRIGGER_ENGINE.scan(lowered)
 
     def _add_context(context_file: str, priority: int) -> None:
         if context_file in loaded:
             return
-        if no_mcp and context_file.startswith("mcp/"):
+        # --no-mcp: suppress all MCP context loading
+        if hits.no_mcp and context_file.startswith("mcp/"):
             return
         contexts_to_load.append((context_file, priority))
         loaded.add(context_file)
 
-    # Composite flags (one flag → multiple files)
+    # Composite flags (one flag → multiple files), then standard triggers — in
+    # table order, which is what decides order among equal priorities
     for flag, files in COMPOSITE_FLAGS.items():
-        if flag in prompt_lower:
+        if flag in hits.composite_flags:
             for context_file, priority in files:
                 _add_context(context_file, priority)
 
-    # Standard trigger matching
-    for pattern, context_file, priority in TRIGGER_MAP:
-        if pattern.search(prompt_lower):
+    for i, (_pattern, context_file, priority) in enumerate(TRIGGER_MAP):
+        if i in hits.triggers:
             _add_context(context_file, priority)
 
     # Batch write to cache (single I/O instead of per-context)
@@ -713,9 +924,171 @@ def _get_injection_tier(context_file: str, verbose: bool) -> int:
     return 2  # Unmapped files get full injection
 
 
+# How much one context is worth to the budget planner. Each priority step takes
+# the value to two thirds, so one P1 file outweighs any single P2 file but not
+# two of them (486 < 2 × 324) — the scheme TRIGGER_MAP's priorities already
+# describe. Halving would make one P1 and two P2s a tie. Each tier a file is
+# downgraded by costs the same step again: a P1 mode cut to its summary is
+# worth a P2 at full strength. Integer powers keep the planner exact.
+_VALUE_STEPS = 6
+
+
+def _context_value(priority: int, downgrade_steps: int) -> int:
+    steps = min(max(priority, 0) + downgrade_steps, _VALUE_STEPS)
+    return 3 ** (_VALUE_STEPS - steps) * 2**steps
+
+
+@dataclass(frozen=True)
+class BudgetItem:
+    """One triggered context and the forms it can be injected in.
+
+    options holds (tier, tokens), the tier _get_injection_tier() chose first and
+    then each cheaper form the file has: Tier 1 when INSTRUCTION_MAP has an
+    entry, Tier 0 when TIER_0_MAP does.
+    """
+
+    context_file: str
+    priority: int
+    options: tuple[tuple[int, int], ...]
+
+
+@dataclass(frozen=True)
+class BudgetPlan:
+    """What plan_budget() decided: a tier per kept file, and what it cost."""
+
+    tiers: dict[str, int]
+    downgraded: tuple[tuple[str, int, int], ...]  # (file, from tier, to tier)
+    dropped: tuple[tuple[str, int], ...]  # (file, tokens at its chosen tier)
+    tokens: int
+
+
+def plan_budget(items: list[BudgetItem], budget: int) -> BudgetPlan:
+    """Pick a tier, or nothing, for each item to maximise value within budget.
+
+    output_inject_mode used to fill the budget greedily in priority order, so
+    one large file could crowd out two smaller ones of the same or higher
+    priority that together were worth more, and a file with a compact summary
+    was dropped whole rather than cut to it. This is the exact multiple-choice
+    knapsack: a Pareto frontier of (tokens, value) over the items, which for
+    the handful of contexts one prompt triggers stays a few dozen states.
+
+    With the budget large enough, every item gets the tier it asked for. Among
+    plans of equal value the cheapest wins, and among equal cost the earliest
+    enumerated — so the result is deterministic.
+    """
+    # (tokens, value, one choice per item so far: option index or None)
+    frontier: list[tuple[int, int, tuple]] = [(0, 0, ())]
+    for item in items:
+        top = item.options[0][0] if item.options else 0
+        candidates = []
+        for tokens, value, choices in frontier:
+            for i, (tier, cost) in enumerate(item.options):
+                if tokens + cost <= budget:
+                    candidates.append(
+                        (
+                            tokens + cost,
+                            value + _context_value(item.priority, top - tier),
+                            choices + (i,),
+                        )
+                    )
+            candidates.append((tokens, value, choices + (None,)))
+        candidates.sort(key=lambda state: (state[0], -state[1]))
+        frontier = []
+        for state in candidates:
+            if not frontier or state[1] > frontier[-1][1]:
+                frontier.append(state)
+
+    tokens, _value, choices = frontier[-1]
+    tiers: dict[str, int] = {}
+    downgraded = []
+    dropped = []
+    for item, choice in zip(items, choices):
+        if choice is None:
+            if item.options:
+                dropped.append((item.context_file, item.options[0][1]))
+            continue
+        tier = item.options[choice][0]
+        tiers[item.context_file] = tier
+        if choice:
+            downgraded.append((item.context_file, item.options[0][0], tier))
+    return BudgetPlan(tiers, tuple(downgraded), tuple(dropped), tokens)
+
+
+def format_budget_plan(plan: BudgetPlan, budget: int) -> str | None:
+    """The summary comment line for a plan that had to give something up."""
+    if not plan.downgraded and not plan.dropped:
+        return None
+    parts = []
+    if plan.downgraded:
+        parts.append(
+            "downgraded "
+            + ", ".join(f"{f} (Tier {a}→{b})" for f, a, b in plan.downgraded)
+        )
+    if plan.dropped:
+        parts.append(
+            "skipped " + ", ".join(f"{f} (~{t} tokens)" for f, t in plan.dropped)
+        )
+    return f"<!-- ⚠️ Budget ~{budget} tokens: {'; '.join(parts)} -->"
+
+
+def _context_installed(index: ContentIndex | None, context_file: str) -> bool:
+    if index is not None and index.covers(context_file):
+        return context_file in index
+    return (BASE_PATH / context_file).exists()
+
+
+def _read_context(
+    index: ContentIndex | None, context_file: str
+) -> tuple[str, int] | None:
+    """(content, token estimate) for a context file, or None if unreadable."""
+    if index is not None and index.covers(context_file):
+        content = index.read_text(context_file)
+        if content is None:
+            return None
+        return content, index.tokens(context_file)
+
+    file_path = BASE_PATH / context_file
+    if not file_path.exists():
+        return None
+    try:
+        content = file_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    return content, estimate_tokens(content)
+
+
+def _injection_options(
+    index: ContentIndex | None, context_file: str, tier: int
+) -> list[tuple[int, int, str]]:
+    """(tier, tokens, text) for the chosen tier and each cheaper form, best first.
+
+    Empty when the backing file is missing: a hint for an uninstalled file would
+    advertise something that is not there, and a summary standing in for a file
+    that could not be read is the same thing. A Tier 1 file with no
+    INSTRUCTION_MAP entry has no compact form, so it is read in full instead.
+    """
+    if tier == 1 and context_file not in INSTRUCTION_MAP:
+        tier = 2
+    options = []
+    if tier == 2:
+        read = _read_context(index, context_file)
+        if read is None:
+            return []
+        options.append((2, read[1], read[0]))
+    elif tier == 0 and not _context_installed(index, context_file):
+        return []
+    if tier >= 1 and context_file in INSTRUCTION_MAP:
+        instruction = INSTRUCTION_MAP[context_file]
+        options.append((1, estimate_tokens(instruction), instruction))
+    if tier != 1 and context_file in TIER_0_MAP:
+        hint = TIER_0_MAP[context_file]
+        options.append((0, estimate_tokens(hint), hint))
+    return options
+
+
 def output_inject_mode(
     contexts: list[tuple[str, int]],
-    prompt: str = "",
+    prompt: "str | ParsedPrompt" = "",
     session_id: str | None = None,
 ) -> None:
     """Output context for triggered files.
@@ -725,15 +1098,10 @@ def output_inject_mode(
     (behavioral rules, symbol tables, tool matrices need complete content).
     v3.2: --verbose-context forces full .md injection for all contexts.
     Set CLAUDE_CONTEXT_USE_INSTRUCTIONS=0 to inject full .md files for everything.
+    What fits MAX_TOKENS_ESTIMATE, and at which tier, is plan_budget()'s call.
     """
-    total_tokens = 0
-    loaded_files = []
-    skipped_files = []
-
     # v3.2: --verbose-context overrides INSTRUCTION_MAP (force full .md)
-    verbose = bool(
-        re.search(r"--verbose-context", scannable_prompt(prompt), re.IGNORECASE)
-    )
+    verbose = ParsedPrompt.of(prompt).mentions("--verbose-context")
     if verbose:
         print(
             "<!-- SuperClaude --verbose-context: forcing full .md injection for "
@@ -748,67 +1116,59 @@ def output_inject_mode(
     if fallback_notifications:
         print()
 
-    for context_file, priority in contexts:
-        tier = _get_injection_tier(context_file, verbose)
+    # One open of the install's content index instead of a stat and a read per
+    # file; None (no index, e.g. SUPERCLAUDE_PATH at a source tree) reads disk
+    index = load_index(BASE_PATH)
 
-        # Tier 0: 1-line hint (tool MCPs, core)
-        if tier == 0 and context_file in TIER_0_MAP:
-            # Defensive: skip hint if backing file is missing (avoids advertising deleted MCPs)
-            if not (BASE_PATH / context_file).exists():
-                print(f"<!-- skip {context_file}: backing file not installed -->")
-                print()
+    items = []
+    texts: dict[tuple[str, int], str] = {}
+    try:
+        for context_file, priority in contexts:
+            tier = _get_injection_tier(context_file, verbose)
+            options = _injection_options(index, context_file, tier)
+            if not options:
+                if tier == 0:
+                    print(f"<!-- skip {context_file}: backing file not installed -->")
+                    print()
                 continue
-            hint = TIER_0_MAP[context_file]
-            tokens = estimate_tokens(hint)
-            total_tokens += tokens
-            loaded_files.append((context_file, tokens))
-            print(f'<sc-context-hint src="{context_file}">{hint}</sc-context-hint>')
-            print()
+            for option_tier, _tokens, text in options:
+                texts[(context_file, option_tier)] = text
+            items.append(
+                BudgetItem(context_file, priority, tuple((t, n) for t, n, _ in options))
+            )
+    finally:
+        if index is not None:
+            index.close()
+
+    plan = plan_budget(items, MAX_TOKENS_ESTIMATE)
+    loaded = 0
+    for item in items:
+        tier = plan.tiers.get(item.context_file)
+        if tier is None:
             continue
-
-        # Tier 1: compact instruction (behavioral MCPs, core with INSTRUCTION_MAP)
-        if tier <= 1 and context_file in INSTRUCTION_MAP:
-            instruction = INSTRUCTION_MAP[context_file]
-            tokens = estimate_tokens(instruction)
-            total_tokens += tokens
-            loaded_files.append((context_file, tokens))
-            print(f'<sc-context src="{context_file}">')
-            print(instruction)
+        loaded += 1
+        text = texts[(item.context_file, tier)]
+        if tier == 0:
+            print(
+                f'<sc-context-hint src="{item.context_file}">{text}</sc-context-hint>'
+            )
+        elif tier == 1:
+            print(f'<sc-context src="{item.context_file}">')
+            print(text)
             print("</sc-context>")
-            print()
-            continue
-
-        # Tier 2: full .md injection (modes, --verbose-context, unmapped files)
-        file_path = BASE_PATH / context_file
-        if not file_path.exists():
-            continue
-
-        try:
-            content = file_path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
-            continue
-        tokens = estimate_tokens(content)
-
-        # Check token budget
-        if total_tokens + tokens > MAX_TOKENS_ESTIMATE:
-            skipped_files.append((context_file, tokens, priority))
-            continue
-
-        total_tokens += tokens
-        loaded_files.append((context_file, tokens))
-        print(f'<context-inject file="{context_file}" tokens="~{tokens}">')
-        print(content)
-        print("</context-inject>")
+        else:
+            tokens = dict(item.options)[2]
+            print(f'<context-inject file="{item.context_file}" tokens="~{tokens}">')
+            print(text)
+            print("</context-inject>")
         print()
 
     # Summary
-    if loaded_files or skipped_files:
-        print(
-            f"<!-- Context loaded: {len(loaded_files)} files (~{total_tokens} tokens) -->"
-        )
-        if skipped_files:
-            skipped_names = ", ".join(f for f, _, _ in skipped_files)
-            print(f"<!-- ⚠️ Budget exceeded: skipped {skipped_names} -->")
+    if items:
+        print(f"<!-- Context loaded: {loaded} files (~{plan.tokens} tokens) -->")
+        decision = format_budget_plan(plan, MAX_TOKENS_ESTIMATE)
+        if decision:
+            print(decision)
 
 
 # Execution flag patterns and their behavioral directives
@@ -853,16 +1213,71 @@ _EXECUTION_DIRECTIVES = {
 }
 
 
-def _emit_execution_directives(prompt: str) -> None:
+@dataclass(frozen=True)
+class ParsedPrompt:
+    """One prompt, parsed once for every stage of a hook run.
+
+    resolve_flags, the execution directives, --verbose-context, the --no-mcp
+    notice and command resolution each used to call scannable_prompt() and run
+    their own regex over the result. On a pasted log that is the fence, inline
+    code and blockquote passes plus the per-line runner scan four or five times
+    over for one prompt. main() builds this once and hands it to each of them;
+    they still accept a plain string, which is parsed on the spot.
+    """
+
+    raw: str
+    # raw with mentioned-not-used regions blanked — see scannable_prompt()
+    scannable: str
+    # raw.lower(), which the trigger table matches against: triggers look at
+    # the whole prompt, quoted text included
+    lowered: str
+    scannable_lowered: str
+    # (flag as typed without the dashes, offset into scannable)
+    flags: tuple[tuple[str, int], ...]
+    # /sc: names, lowercased, in prompt order
+    commands: tuple[str, ...]
+    # (pattern, match) for each _EXECUTION_DIRECTIVES pattern found in scannable
+    execution_flags: tuple[tuple[re.Pattern, re.Match], ...]
+
+    @classmethod
+    def parse(cls, prompt: str) -> "ParsedPrompt":
+        scannable = scannable_prompt(prompt)
+        execution_flags = []
+        for pattern in _EXECUTION_DIRECTIVES:
+            match = pattern.search(scannable)
+            if match:
+                execution_flags.append((pattern, match))
+        return cls(
+            raw=prompt,
+            scannable=scannable,
+            lowered=prompt.lower(),
+            scannable_lowered=scannable.lower(),
+            flags=tuple(
+                (m.group(1), m.start()) for m in _FLAG_TOKEN_RE.finditer(scannable)
+            ),
+            commands=tuple(
+                m.group(1).lower() for m in _COMMAND_TOKEN_RE.finditer(prompt)
+            ),
+            execution_flags=tuple(execution_flags),
+        )
+
+    @classmethod
+    def of(cls, prompt: "str | ParsedPrompt") -> "ParsedPrompt":
+        """prompt itself if already parsed, else a fresh parse of it."""
+        return prompt if isinstance(prompt, cls) else cls.parse(prompt)
+
+    def mentions(self, text: str) -> bool:
+        """Whether text occurs, case-insensitively, outside quoted regions."""
+        return text.lower() in self.scannable_lowered
+
+
+def _emit_execution_directives(prompt: "str | ParsedPrompt") -> None:
     """Emit inline behavioral directives for execution flags.
     Session-deduped: each (pattern, matched-flag) combo emits once per session."""
     loaded = get_loaded_contexts()
     new_marks = []
-    scannable = scannable_prompt(prompt)
-    for pattern, directive_fn in _EXECUTION_DIRECTIVES.items():
-        match = pattern.search(scannable)
-        if not match:
-            continue
+    for pattern, match in ParsedPrompt.of(prompt).execution_flags:
+        directive_fn = _EXECUTION_DIRECTIVES[pattern]
         marker = f"_directive:{pattern.pattern}:{match.group(0).lower()}"
         if marker in loaded:
             continue
@@ -910,8 +1325,13 @@ def main() -> None:
     if not prompt or not prompt.strip():
         return
 
+    # Parsed once; every stage below reads this rather than re-scanning
+    parsed = ParsedPrompt.parse(prompt)
+
     # v3.2: Resolve flag aliases and typos before processing
-    prompt, flag_notifications = resolve_flags(prompt)
+    prompt, flag_notifications = resolve_flags(parsed)
+    if prompt != parsed.raw:  # an alias was rewritten
+        parsed = ParsedPrompt.parse(prompt)
     if flag_notifications:
         for note in flag_notifications:
             print(f"<!-- SuperClaude flag: {note} -->")
@@ -928,24 +1348,25 @@ def main() -> None:
                 mark_as_loaded("_skills_summary")
 
     # Execution flag directives (inline behavioral hints — no file injection)
-    _emit_execution_directives(prompt)
+    _emit_execution_directives(parsed)
 
     # An unknown /sc: name must not read as a real command
-    command_notes, unresolved_commands = resolve_command_name(prompt)
+    command_notes, unresolved_commands = resolve_command_name(parsed)
     for note in command_notes:
         print(f"<!-- SuperClaude command: {note} -->")
     if command_notes:
         print()
 
     # Check triggers and get contexts to load
-    trigger_prompt = strip_unresolved_commands(prompt, unresolved_commands)
-    contexts = check_triggers(trigger_prompt)
+    if unresolved_commands:
+        contexts = check_triggers(
+            strip_unresolved_commands(prompt, unresolved_commands)
+        )
+    else:
+        contexts = check_triggers(parsed)
 
     # --no-mcp notification — once per session
-    if (
-        "--no-mcp" in scannable_prompt(prompt).lower()
-        and "_notice:--no-mcp" not in get_loaded_contexts()
-    ):
+    if parsed.mentions("--no-mcp") and "_notice:--no-mcp" not in get_loaded_contexts():
         print(
             "<!-- --no-mcp: MCP contexts suppressed. Using native tools + WebSearch. -->"
         )
@@ -957,7 +1378,7 @@ def main() -> None:
 
     # Output based on mode
     if INJECT_MODE:
-        output_inject_mode(contexts, prompt=prompt, session_id=session_id)
+        output_inject_mode(contexts, prompt=parsed, session_id=session_id)
     else:
         output_directive_mode(contexts)
 
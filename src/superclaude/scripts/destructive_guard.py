@@ -95,6 +95,28 @@ def is_warn(command: str) -> bool:
     return _WARN.search(command) is not None
 
 
+def evaluate(data: dict) -> dict:
+    """PreToolUse decision for one parsed hook payload."""
+    if os.environ.get("SUPERCLAUDE_DESTRUCTIVE_GUARD", "1") == "0":
+        return {"decision": "approve"}
+
+    command = data.get("tool_input", {}).get("command", "")
+
+    if is_destructive(command):
+        return {"decision": "block", "reason": _BLOCK_REASON}
+
+    if is_warn(command):
+        return {
+            "hookSpecificOutput": {
+                "hookEventName": "PreToolUse",
+                "permissionDecision": "ask",
+                "permissionDecisionReason": _WARN_REASON,
+            }
+        }
+
+    return {"decision": "approve"}
+
+
 def main() -> None:
     # Respect opt-out env var
     if os.environ.get("SUPERCLAUDE_DESTRUCTIVE_GUARD", "1") == "0":
@@ -107,28 +129,7 @@ def main() -> None:
             print(json.dumps({"decision": "approve"}))
             return
 
-        data = json.loads(stdin_data)
-        command = data.get("tool_input", {}).get("command", "")
-
-        if is_destructive(command):
-            print(json.dumps({"decision": "block", "reason": _BLOCK_REASON}))
-            return
-
-        if is_warn(command):
-            print(
-                json.dumps(
-                    {
-                        "hookSpecificOutput": {
-                            "hookEventName": "PreToolUse",
-                            "permissionDecision": "ask",
-                            "permissionDecisionReason": _WARN_REASON,
-                        }
-                    }
-                )
-            )
-            return
-
-        print(json.dumps({"decision": "approve"}))
+        print(json.dumps(evaluate(json.loads(stdin_data))))
 
     except json.JSONDecodeError:
         # Malformed hook input — fail open (consistent with file_size_guard/loop_guard)
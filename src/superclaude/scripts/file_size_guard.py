@@ -91,68 +91,66 @@ def _block_message(size: int, ext: str) -> str:
     )
 
 
-def main() -> None:
-    # Respect opt-out env var
+def evaluate(data: dict) -> dict:
+    """PreToolUse decision for one parsed hook payload."""
     if os.environ.get("SUPERCLAUDE_SIZE_GUARD", "1") == "0":
-        print(json.dumps({"decision": "approve"}))
-        return
+        return {"decision": "approve"}
+
+    tool_input = data.get("tool_input", {})
+
+    file_path = tool_input.get("file_path", "")
+    has_limit = tool_input.get("limit") is not None
+    has_pages = tool_input.get("pages") is not None
+
+    # If limit or pages is set, caller is paginating — allow
+    if has_limit or has_pages:
+        return {"decision": "approve"}
+
+    if not file_path:
+        return {"decision": "approve"}
 
+    ext = Path(file_path).suffix.lower()
+
+    # Skip binary files
+    if ext in BINARY_EXTENSIONS:
+        return {"decision": "approve"}
+
+    # Check file size
     try:
-        stdin_data = sys.stdin.read() if not sys.stdin.isatty() else ""
-        if not stdin_data:
-            print(json.dumps({"decision": "approve"}))
-            return
+        if not os.path.isfile(file_path):
+            return {"decision": "approve"}
+        size = os.path.getsize(file_path)
+    except OSError:
+        return {"decision": "approve"}
 
-        data = json.loads(stdin_data)
-        tool_input = data.get("tool_input", {})
+    # Small files exempt unconditionally
+    if size < SMALL_FILE_THRESHOLD:
+        return {"decision": "approve"}
 
-        file_path = tool_input.get("file_path", "")
-        has_limit = tool_input.get("limit") is not None
-        has_pages = tool_input.get("pages") is not None
+    # Config extensions exempt below threshold
+    if ext in CONFIG_EXTENSIONS and size < SIZE_THRESHOLD:
+        return {"decision": "approve"}
 
-        # If limit or pages is set, caller is paginating — allow
-        if has_limit or has_pages:
-            print(json.dumps({"decision": "approve"}))
-            return
+    # Block files above threshold
+    if size >= SIZE_THRESHOLD:
+        return {"decision": "block", "reason": _block_message(size, ext)}
 
-        if not file_path:
-            print(json.dumps({"decision": "approve"}))
-            return
+    return {"decision": "approve"}
 
-        ext = Path(file_path).suffix.lower()
 
-        # Skip binary files
-        if ext in BINARY_EXTENSIONS:
+def main() -> None:
+    # Respect opt-out env var
+    if os.environ.get("SUPERCLAUDE_SIZE_GUARD", "1") == "0":
+        print(json.dumps({"decision": "approve"}))
+        return
+
+    try:
+        stdin_data = sys.stdin.read() if not sys.stdin.isatty() else ""
+        if not stdin_data:
             print(json.dumps({"decision": "approve"}))
             return
 
-        # Check file size
-        if os.path.isfile(file_path):
-            size = os.path.getsize(file_path)
-
-            # Small files exempt unconditionally
-            if size < SMALL_FILE_THRESHOLD:
-                print(json.dumps({"decision": "approve"}))
-                return
-
-            # Config extensions exempt below threshold
-            if ext in CONFIG_EXTENSIONS and size < SIZE_THRESHOLD:
-                print(json.dumps({"decision": "approve"}))
-                return
-
-            # Block files above threshold
-            if size >= SIZE_THRESHOLD:
-                print(
-                    json.dumps(
-                        {
-                            "decision": "block",
-                            "reason": _block_message(size, ext),
-                        }
-                    )
-                )
-                return
-
-        print(json.dumps({"decision": "approve"}))
+        print(json.dumps(evaluate(json.loads(stdin_data))))
 
     except json.JSONDecodeError:
         # Don't block on hook errors — fail open
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""PreToolUse entry point that runs every safety guard in one process.
+
+hooks.json used to register each guard on its own matcher, so a single Bash
+call started two interpreters (destructive_guard, loop_guard), each reading
+stdin, parsing the payload and importing its dependencies before doing a
+microsecond of matching. This script is registered once for
+``Read|Edit|Write|Bash``, parses the payload once, and calls the ``evaluate()``
+of each guard that applies to the tool:
+
+  - Read         → file_size_guard
+  - Bash         → destructive_guard, loop_guard
+  - Edit / Write → loop_guard
+
+The decisions merge strictest-first: block > ask > approve. Between two of the
+same strength the first guard in the list above wins, so a destructive command
+that is also looping reports as destructive.
+
+The guards stay standalone scripts with their own ``main()`` — loop_guard is
+still registered directly for PostToolUse, and the hook daemon serves all of
+them — and each keeps its opt-out (``SUPERCLAUDE_SIZE_GUARD=0``,
+``SUPERCLAUDE_DESTRUCTIVE_GUARD=0``, ``SUPERCLAUDE_LOOP_GUARD=0``). A guard is
+imported only when the tool needs it, and one that raises counts as approve:
+fail open, per guard, never for the whole hook.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import sys
+
+# Guards per tool, in merge order. Module paths rather than imports so a Read
+# never pays for loop_guard's state resolution.
+GUARDS = {
+    "Read": ("superclaude.scripts.file_size_guard",),
+    "Bash": (
+        "superclaude.scripts.destructive_guard",
+        "superclaude.scripts.loop_guard",
+    ),
+    "Edit": ("superclaude.scripts.loop_guard",),
+    "Write": ("superclaude.scripts.loop_guard",),
+}
+
+_APPROVE = {"decision": "approve"}
+
+
+def _strength(decision: dict) -> int:
+    """2 for block, 1 for ask, 0 for anything else."""
+    if decision.get("decision") == "block":
+        return 2
+    specific = decision.get("hookSpecificOutput")
+    if isinstance(specific, dict) and specific.get("permissionDecision") == "ask":
+        return 1
+    return 0
+
+
+def dispatch(data: dict) -> dict:
+    """Strictest decision of the guards that apply to data's tool."""
+    strictest = _APPROVE
+    for module_name in GUARDS.get(data.get("tool_name", ""), ()):
+        try:
+            decision = importlib.import_module(module_name).evaluate(data)
+        except Exception:
+            continue
+        if _strength(decision) > _strength(strictest):
+            strictest = decision
+    return strictest
+
+
+def main() -> None:
+    try:
+        stdin_data = sys.stdin.read() if not sys.stdin.isatty() else ""
+        data = json.loads(stdin_data) if stdin_data.strip() else {}
+    except json.JSONDecodeError:
+        data = {}
+    if not isinstance(data, dict):
+        data = {}
+    print(json.dumps(dispatch(data)))
+
+
+if __name__ == "__main__":
+    main()
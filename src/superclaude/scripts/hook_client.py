@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Hook client shim for the opt-in hook daemon (``superclaude hookd``).
+
+Installed in place of the direct script call when ``superclaude install
+--hook-daemon`` is used:
+
+    {{PYTHON_BIN}} {{SCRIPTS_PATH}}/hook_client.py {{SCRIPTS_PATH}}/loop_guard.py
+
+Forwards the hook payload to the project's daemon socket and replays its
+stdout, stderr and exit code. With no daemon listening — never started, idle
+exit, AF_UNIX unavailable — or a daemon too busy to start the hook, it runs
+the named script in this same process, so the hook behaves exactly as the
+direct call would, minus one interpreter start.
+
+Deliberately small: everything this file imports is paid on every hook, daemon
+or not, so it takes the standard library and superclaude.utils for the socket
+path, nothing else.
+"""
+
+import io
+import json
+import os
+import runpy
+import socket
+import sys
+from pathlib import Path
+
+from superclaude.utils import hookd_socket_path
+
+CONNECT_TIMEOUT = 0.25
+
+# Under the 5s timeout the served hooks are registered with, so a wedged
+# daemon surfaces here rather than as a Claude Code hook timeout.
+REPLY_TIMEOUT = 4.5
+
+_FORWARDED_ENV_PREFIXES = ("CLAUDE_", "SUPERCLAUDE_")
+
+
+def _connect() -> socket.socket | None:
+    """Connect to the daemon, or None when nothing is listening."""
+    if not hasattr(socket, "AF_UNIX") or os.environ.get("SUPERCLAUDE_HOOKD") == "0":
+        return None
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.settimeout(CONNECT_TIMEOUT)
+    try:
+        conn.connect(str(hookd_socket_path()))
+    except OSError:
+        conn.close()
+        return None
+    return conn
+
+
+def _ask_daemon(conn: socket.socket, script: str, argv: list[str], stdin: str) -> dict:
+    env = {k: v for k, v in os.environ.items() if k.startswith(_FORWARDED_ENV_PREFIXES)}
+    request = {"script": script, "argv": argv, "stdin": stdin, "env": env}
+    conn.settimeout(REPLY_TIMEOUT)
+    conn.sendall(json.dumps(request).encode("utf-8") + b"\n")
+    return json.loads(conn.makefile("rb").readline())
+
+
+def _run_locally(script_path: Path, argv: list[str], stdin: str) -> None:
+    sys.stdin = io.StringIO(stdin)
+    sys.argv = [str(script_path), *argv]
+    runpy.run_path(str(script_path), run_name="__main__")
+
+
+def main() -> None:
+    if len(sys.argv) < 2:
+        print("usage: hook_client.py <script.py> [args...]", file=sys.stderr)
+        sys.exit(2)
+    script_path = Path(sys.argv[1])
+    argv = sys.argv[2:]
+    stdin = sys.stdin.read() if not sys.stdin.isatty() else ""
+
+    conn = _connect()
+    if conn is None:
+        _run_locally(script_path, argv, stdin)
+        return
+
+    # Once the payload is sent the daemon may already have acted on it — a
+    # loop_guard Post has recorded its error — so a failure past this point is
+    # not retried locally. It fails open, like every hook here. A daemon busy
+    # with another hook says so before acting ({"served": false}), which is
+    # what keeps a queued guard from timing out into an allow.
+    try:
+        with conn:
+            reply = _ask_daemon(conn, script_path.stem, argv, stdin)
+    except (OSError, ValueError):
+        return
+    if reply.get("served") is False:
+        _run_locally(script_path, argv, stdin)
+        return
+    sys.stdout.write(reply.get("stdout", ""))
+    sys.stderr.write(reply.get("stderr", ""))
+    sys.exit(reply.get("exit", 0))
+
+
+if __name__ == "__main__":
+    main()
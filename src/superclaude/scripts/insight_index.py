@@ -0,0 +1,324 @@
+"""Sidecar index over .claude/insights.jsonl for insight_writer's read paths.
+
+``list``, ``query`` and ``stats`` used to pipe the whole history through a jq
+subprocess — ``list`` then kept the last N of the lines jq had formatted — and
+every annotation append scanned the file line by line for its target. Long-lived
+repositories reach tens of thousands of entries, and jq was one more thing to
+install. The index maps each entry to the byte offset of its line and posts it
+under its ``type``, ``tags``, ``author`` and ``ts``, so a lookup reads the
+matching lines and nothing else.
+
+It lives in hook state, not next to the history: insights.jsonl is user data,
+often committed, while the index is a cache any run can rebuild. It is a small
+SQLite database — a ``lines`` table of offsets and a ``postings`` table indexed
+on (field, key) — so opening it, catching up with an append and answering a
+lookup each cost the appended lines plus a B-tree descent, never a pass over
+the whole history. Each open compares the history's inode, size and first bytes
+with the recorded mark. Appended bytes are indexed incrementally; anything else
+— a rewrite, a truncation, a checkout of another branch — rebuilds from scratch.
+
+Stdlib-only, like the rest of what the hooks import. A Python built without
+sqlite3 indexes the history in memory on every open instead.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Iterable, Iterator
+
+try:
+    import sqlite3
+except ImportError:  # pragma: no cover - CPython builds without _sqlite3
+    sqlite3 = None
+
+INDEX_VERSION = 2
+
+# Entry fields with a posting list. Anything else is answered by a scan.
+INDEXED_FIELDS = ("type", "tags", "author", "ts")
+
+# Bytes hashed to recognise the file the index was built from.
+_HEAD_BYTES = 4096
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mark (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS lines (
+    number INTEGER PRIMARY KEY,
+    offset INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    field TEXT NOT NULL,
+    key TEXT NOT NULL,
+    number INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS postings_key ON postings (field, key, number);
+"""
+
+
+def _head_digest(path: Path, length: int) -> str:
+    with path.open("rb") as f:
+        return hashlib.sha256(f.read(min(length, _HEAD_BYTES))).hexdigest()
+
+
+def read_appended(
+    path: Path, mark: dict | None
+) -> tuple[dict, list[tuple[int, dict]], bool]:
+    """Entries appended to a JSONL file since mark, with their byte offsets.
+
+    mark is what the previous call returned: ``{"inode", "end", "head"}``. When
+    it no longer describes the start of the file — another inode, a shorter
+    file, different leading bytes — reading starts over from byte 0. An
+    unfinished last line is left for the next call; malformed lines and
+    non-objects are skipped.
+
+    Returns:
+        (new mark, [(offset, entry), ...], whether reading started over)
+    """
+    stat = path.stat()
+    restart = True
+    if mark and mark.get("inode") == stat.st_ino and stat.st_size >= mark["end"]:
+        try:
+            restart = _head_digest(path, mark["end"]) != mark["head"]
+        except OSError:
+            pass
+    offset = 0 if restart else mark["end"]
+    entries: list[tuple[int, dict]] = []
+    with path.open("rb") as f:
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break  # an append still in progress; read next time
+            start, offset = offset, offset + len(line)
+            try:
+                entry = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            if isinstance(entry, dict):
+                entries.append((start, entry))
+    new_mark = {"inode": stat.st_ino, "end": offset, "head": _head_digest(path, offset)}
+    return new_mark, entries, restart
+
+
+def _keys(field: str, value) -> list[str]:
+    """Posting keys of one field value: tags post per tag, the rest as-is.
+
+    Only strings are posted, matching what ``query key=value`` can ask for.
+    """
+    if field == "tags":
+        if not isinstance(value, list):
+            return []
+        return list(dict.fromkeys(t for t in value if isinstance(t, str)))
+    return [value] if isinstance(value, str) else []
+
+
+def _connect(path: Path):
+    """A connection with the current schema, or None if path holds another."""
+    conn = sqlite3.connect(path, timeout=5, isolation_level=None)
+    try:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, INDEX_VERSION):
+            conn.close()
+            return None
+        if version == 0:  # setting it rewrites the header, so only when new
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+    except BaseException:
+        conn.close()
+        raise
+    return conn
+
+
+class InsightIndex:
+    """Offsets and posting lists for one insights.jsonl; use open() to get one."""
+
+    def __init__(self, source: Path, conn) -> None:
+        self.source = Path(source)
+        self.conn = conn
+
+    @classmethod
+    def open(cls, source: Path, sidecar: Path) -> InsightIndex:
+        """Open the index for source, brought up to date with the history.
+
+        A sidecar from another version, or one that is not a database at all,
+        is deleted and rebuilt: it holds nothing insights.jsonl does not.
+        """
+        if sqlite3 is None:
+            conn = None
+        else:
+            sidecar = Path(sidecar)
+            sidecar.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                conn = _connect(sidecar)
+            except sqlite3.DatabaseError:  # not a database: a corrupt cache
+                conn = None
+            if conn is None:
+                sidecar.unlink(missing_ok=True)
+                conn = _connect(sidecar)
+        if conn is None:
+            return _MemoryIndex(source)
+        index = cls(source, conn)
+        index.refresh()
+        return index
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> InsightIndex:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def refresh(self) -> bool:
+        """Index lines appended since the last refresh; rebuild if rewritten.
+
+        One write transaction from reading the mark to storing the new one,
+        so two processes appending at once do not index the same lines twice.
+
+        Returns:
+            Whether the index changed
+        """
+        conn = self.conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT value FROM mark WHERE id = 0").fetchone()
+            mark = json.loads(row[0]) if row else None
+            try:
+                new_mark, appended, restart = read_appended(self.source, mark)
+            except OSError:  # no history (yet)
+                new_mark, appended, restart = None, [], True
+            if not restart and new_mark == mark:
+                conn.execute("ROLLBACK")
+                return False
+            if restart:
+                if mark is None and new_mark is None:
+                    conn.execute("ROLLBACK")
+                    return False
+                for table in ("mark", "lines", "postings"):
+                    conn.execute(f"DELETE FROM {table}")
+            number = len(self)
+            for start, entry in appended:
+                conn.execute(
+                    "INSERT INTO lines (number, offset) VALUES (?, ?)", (number, start)
+                )
+                conn.executemany(
+                    "INSERT INTO postings (field, key, number) VALUES (?, ?, ?)",
+                    [
+                        (field, key, number)
+                        for field in INDEXED_FIELDS
+                        for key in _keys(field, entry.get(field))
+                    ],
+                )
+                number += 1
+            if new_mark is not None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO mark (id, value) VALUES (0, ?)",
+                    (json.dumps(new_mark),),
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return True
+
+    def __len__(self) -> int:
+        # Numbers are dense from 0, so the largest one counts them.
+        row = self.conn.execute("SELECT max(number) FROM lines").fetchone()
+        return 0 if row[0] is None else row[0] + 1
+
+    def _offsets(self, numbers: Iterable[int]) -> list[int]:
+        return [
+            row[0]
+            for number in numbers
+            for row in self.conn.execute(
+                "SELECT offset FROM lines WHERE number = ?", (number,)
+            )
+        ]
+
+    def _read(self, offsets: list[int]) -> Iterator[dict]:
+        with self.source.open("rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                yield json.loads(f.readline())
+
+    def entries(self, numbers: Iterable[int]) -> Iterator[dict]:
+        """The entries with the given numbers, in that order, read by offset."""
+        return self._read(self._offsets(numbers))
+
+    def last(self, limit: int) -> list[dict]:
+        """The newest limit entries, oldest first."""
+        rows = self.conn.execute(
+            "SELECT offset FROM lines ORDER BY number DESC LIMIT ?", (limit,)
+        ).fetchall()
+        return list(self._read([row[0] for row in reversed(rows)]))
+
+    def lookup(self, field: str, value: str) -> list[int]:
+        """Numbers of the entries whose field holds value, in file order."""
+        rows = self.conn.execute(
+            "SELECT number FROM postings WHERE field = ? AND key = ? ORDER BY number",
+            (field, value),
+        )
+        return [row[0] for row in rows]
+
+    def counts(self, field: str) -> dict[str, int]:
+        """Entries per value of field, in order of first appearance."""
+        rows = self.conn.execute(
+            "SELECT key, count(*) FROM postings WHERE field = ?"
+            " GROUP BY key ORDER BY min(number)",
+            (field,),
+        )
+        return dict(rows.fetchall())
+
+    def scan(self) -> Iterator[dict]:
+        """Every entry in file order, for fields without a posting list."""
+        rows = self.conn.execute("SELECT offset FROM lines ORDER BY number")
+        return self._read([row[0] for row in rows])
+
+
+class _MemoryIndex(InsightIndex):
+    """The same index built in memory on each open, for Pythons without sqlite3."""
+
+    def __init__(self, source: Path) -> None:
+        super().__init__(source, None)
+        self._offsets_list: list[int] = []
+        self._postings: dict[str, dict[str, list[int]]] = {
+            field: {} for field in INDEXED_FIELDS
+        }
+        try:
+            _mark, appended, _restart = read_appended(self.source, None)
+        except OSError:
+            appended = []
+        for number, (start, entry) in enumerate(appended):
+            self._offsets_list.append(start)
+            for field in INDEXED_FIELDS:
+                for key in _keys(field, entry.get(field)):
+                    self._postings[field].setdefault(key, []).append(number)
+
+    def close(self) -> None:
+        pass
+
+    def refresh(self) -> bool:
+        return False
+
+    def __len__(self) -> int:
+        return len(self._offsets_list)
+
+    def _offsets(self, numbers: Iterable[int]) -> list[int]:
+        return [self._offsets_list[number] for number in numbers]
+
+    def last(self, limit: int) -> list[dict]:
+        count = len(self)
+        return list(self.entries(range(max(0, count - limit), count)))
+
+    def lookup(self, field: str, value: str) -> list[int]:
+        return list(self._postings[field].get(value, ()))
+
+    def counts(self, field: str) -> dict[str, int]:
+        return {value: len(nums) for value, nums in self._postings[field].items()}
+
+    def scan(self) -> Iterator[dict]:
+        return self.entries(range(len(self)))
@@ -0,0 +1,299 @@
+"""Optional SQLite mirror of the insight files, for ranked full-text search.
+
+``insights.jsonl`` and ``insights.pending.jsonl`` stay the source of truth —
+append-only, git-diffable, readable without any of this. The store is a cache
+in hook state that copies them into SQLite: one ``entries`` row per line,
+indexed on ts, type and session_id; a ``entry_tags`` table indexed on tag; and
+an FTS5 table over the text (``insight`` for promoted entries, ``raw_text`` for
+pending markers). ``insight_writer search`` ranks matches with bm25, which a
+line scan cannot do, over years of history in milliseconds.
+
+Sync is lazy and incremental: each ``open_store()`` copies only the lines
+appended since the last one, tracked per file with the same inode/end/head
+mark the sidecar index uses (``insight_index.read_appended``). A file that was
+rewritten — the pending file after every promote — is re-copied whole.
+
+Optional: an interpreter built without sqlite3 or FTS5 raises
+``InsightStoreUnavailableError``, and search falls back to an unranked scan.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from superclaude.scripts.insight_index import read_appended
+
+try:
+    import sqlite3
+except ImportError:  # pragma: no cover - CPython builds without _sqlite3
+    sqlite3 = None
+
+SCHEMA_VERSION = 1
+
+# Source names, one per mirrored file.
+INSIGHTS = "insights"
+PENDING = "pending"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    name TEXT PRIMARY KEY,
+    mark TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    ts TEXT,
+    type TEXT,
+    author TEXT,
+    session_id TEXT,
+    text TEXT NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_ts ON entries (source, ts);
+CREATE INDEX IF NOT EXISTS entries_type ON entries (type);
+CREATE INDEX IF NOT EXISTS entries_session ON entries (session_id);
+CREATE TABLE IF NOT EXISTS entry_tags (
+    entry_id INTEGER NOT NULL,
+    tag TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entry_tags_tag ON entry_tags (tag, entry_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5 (text);
+"""
+
+
+class InsightStoreUnavailableError(Exception):
+    """Raised when this Python has no sqlite3 module or no FTS5 in it."""
+
+
+# What an open store raises when it is locked, corrupt or cannot run a query.
+# Empty without sqlite3, so ``except StoreError`` is always valid.
+StoreError: tuple[type[Exception], ...] = (sqlite3.Error,) if sqlite3 else ()
+
+
+def is_corrupt(error: Exception) -> bool:
+    """Whether error says the file is damaged, not just busy or misused."""
+    return isinstance(error, sqlite3.DatabaseError) and not isinstance(
+        error, sqlite3.OperationalError
+    )
+
+
+def _text(value) -> str:
+    return value if isinstance(value, str) else ""
+
+
+def _tags(entry: dict) -> list[str]:
+    tags = entry.get("tags")
+    if not isinstance(tags, list):
+        return []
+    return list(dict.fromkeys(t for t in tags if isinstance(t, str)))
+
+
+def entry_ts(entry: dict) -> str | None:
+    """When an entry was written; pending rows carry user_ts / harvested_at."""
+    for field in ("ts", "user_ts", "harvested_at"):
+        if _text(entry.get(field)):
+            return entry[field]
+    return None
+
+
+def fts_query(terms: str) -> str:
+    """Every word of terms as a quoted FTS5 phrase, all required.
+
+    Quoting keeps user text out of the query syntax: ``AND``, ``-``, ``:`` or
+    an unbalanced quote in a search would otherwise be an FTS5 syntax error.
+    """
+    return " ".join('"' + word.replace('"', '""') + '"' for word in terms.split())
+
+
+class InsightStore:
+    """A synced connection to the store; use open_store() to get one."""
+
+    def __init__(self, conn) -> None:
+        self.conn = conn
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> InsightStore:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _changes(self, name: str, path: Path) -> tuple | None:
+        """(new mark, appended, restart) since the stored mark; None if unchanged."""
+        row = self.conn.execute(
+            "SELECT mark FROM sources WHERE name = ?", (name,)
+        ).fetchone()
+        mark = json.loads(row[0]) if row else None
+        try:
+            new_mark, appended, restart = read_appended(path, mark)
+        except OSError:  # the file does not exist (any more)
+            new_mark, appended, restart = None, [], True
+        if not restart and not appended and new_mark == mark:
+            return None
+        if restart and mark is None and new_mark is None:
+            return None
+        return new_mark, appended, restart
+
+    def sync(self, name: str, path: Path) -> int:
+        """Copy lines appended to path since the last sync; re-copy if rewritten.
+
+        The mark is read again under BEGIN IMMEDIATE before anything is copied,
+        so two processes opening the store at once do not both copy the same
+        lines. The first, unlocked read spares an unchanged file the write lock.
+
+        Returns:
+            Number of entries copied
+        """
+        if self._changes(name, path) is None:
+            return 0
+        conn = self.conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            changes = self._changes(name, path)
+            if changes is None:  # another process synced it meanwhile
+                conn.execute("ROLLBACK")
+                return 0
+            new_mark, appended, restart = changes
+            if restart:
+                self._drop(name)
+            for _offset, entry in appended:
+                self._insert(name, entry)
+            if new_mark is None:
+                conn.execute("DELETE FROM sources WHERE name = ?", (name,))
+            else:
+                conn.execute(
+                    "INSERT OR REPLACE INTO sources (name, mark) VALUES (?, ?)",
+                    (name, json.dumps(new_mark)),
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return len(appended)
+
+    def _drop(self, name: str) -> None:
+        ids = "SELECT id FROM entries WHERE source = ?"
+        self.conn.execute(f"DELETE FROM entries_fts WHERE rowid IN ({ids})", (name,))
+        self.conn.execute(f"DELETE FROM entry_tags WHERE entry_id IN ({ids})", (name,))
+        self.conn.execute("DELETE FROM entries WHERE source = ?", (name,))
+
+    def _insert(self, name: str, entry: dict) -> None:
+        text = _text(entry.get("insight")) or _text(entry.get("raw_text"))
+        cursor = self.conn.execute(
+            "INSERT INTO entries (source, ts, type, author, session_id, text, body)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                name,
+                entry_ts(entry),
+                _text(entry.get("type")) or None,
+                _text(entry.get("author")) or None,
+                _text(entry.get("session_id")) or None,
+                text,
+                json.dumps(entry, ensure_ascii=False),
+            ),
+        )
+        entry_id = cursor.lastrowid
+        self.conn.execute(
+            "INSERT INTO entries_fts (rowid, text) VALUES (?, ?)", (entry_id, text)
+        )
+        self.conn.executemany(
+            "INSERT INTO entry_tags (entry_id, tag) VALUES (?, ?)",
+            [(entry_id, tag) for tag in _tags(entry)],
+        )
+
+    def search(
+        self,
+        terms: str,
+        *,
+        type: str | None = None,
+        tag: str | None = None,
+        since: str | None = None,
+        sources: tuple[str, ...] = (INSIGHTS,),
+        limit: int = 20,
+    ) -> list[tuple[str, dict]]:
+        """Entries matching every word of terms, best bm25 rank first.
+
+        Args:
+            terms: Words to find in the insight / raw_text
+            type: Only entries of this type
+            tag: Only entries carrying this tag
+            since: Only entries whose ts sorts at or after this ISO prefix
+            sources: Which files to search (INSIGHTS, PENDING)
+            limit: Most results returned
+
+        Returns:
+            (source, entry) pairs
+        """
+        query = fts_query(terms)
+        if not query:
+            return []
+        sql = [
+            "SELECT e.source, e.body FROM entries_fts",
+            "JOIN entries e ON e.id = entries_fts.rowid",
+            "WHERE entries_fts MATCH ?",
+            f"AND e.source IN ({', '.join('?' * len(sources))})",
+        ]
+        params: list = [query, *sources]
+        if type:
+            sql.append("AND e.type = ?")
+            params.append(type)
+        if tag:
+            sql.append("AND e.id IN (SELECT entry_id FROM entry_tags WHERE tag = ?)")
+            params.append(tag)
+        if since:
+            sql.append("AND e.ts >= ?")
+            params.append(since)
+        sql.append("ORDER BY bm25(entries_fts), e.id DESC LIMIT ?")
+        params.append(limit)
+        rows = self.conn.execute(" ".join(sql), params).fetchall()
+        return [(source, json.loads(body)) for source, body in rows]
+
+
+def _connect(db_path: Path):
+    """A connection with the current schema, or None if db_path holds another."""
+    conn = sqlite3.connect(db_path, timeout=5, isolation_level=None)
+    try:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            conn.close()
+            return None
+        if version == 0:  # a write; an up-to-date store is only read
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    except BaseException:
+        conn.close()
+        raise
+    return conn
+
+
+def open_store(db_path: Path, files: dict[str, Path]) -> InsightStore:
+    """Open the store at db_path and sync it with files (source name → path).
+
+    A store from another schema version, or one that is not a database at all,
+    is deleted and rebuilt: it holds nothing the JSONL files do not.
+
+    Raises:
+        InsightStoreUnavailableError: No sqlite3, or SQLite built without FTS5
+    """
+    if sqlite3 is None:
+        raise InsightStoreUnavailableError("this Python has no sqlite3 module")
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        conn = _connect(db_path)
+    except sqlite3.OperationalError as e:
+        if "fts5" in str(e).lower():
+            raise InsightStoreUnavailableError("SQLite was built without FTS5") from e
+        raise
+    except sqlite3.DatabaseError:  # not a database: a corrupt cache
+        conn = None
+    if conn is None:
+        db_path.unlink(missing_ok=True)
+        conn = _connect(db_path)
+    store = InsightStore(conn)
+    for name, path in files.items():
+        store.sync(name, Path(path))
+    return store
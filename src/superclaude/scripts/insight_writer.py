@@ -3,16 +3,17 @@
 
 Subcommands:
     append      Write a structured insight to .claude/insights.jsonl (stdin or --json)
-    list        Show recent insights (jq required)
-    query       Filter insights by key=value (jq required)
-    stats       Type/tag distribution (jq required)
+    list        Show recent insights
+    query       Filter insights by key=value
+    stats       Type distribution
     harvest     Scan current session transcript for INSIGHT: markers → pending
     review      List entries in .claude/insights.pending.jsonl
-    promote     Move a pending entry to insights.jsonl as a structured insight
+    promote     Move pending entries (--index, --ids, --all, --filter) to insights.jsonl
     pending-count   Print count of pending entries (for SessionStart notice)
+    search      Ranked full-text search over insights (and --pending markers)
 
-Read paths require jq; write paths are pure Python. Missing jq prints install
-hint to stderr and exits 1.
+Pure Python throughout. Read paths and the annotation check go through the
+sidecar index in insight_index.py rather than scanning the history.
 
 Hook integration:
     SessionEnd / PreCompact → harvest-from-hook (stdin JSON: reason/trigger + cwd)
@@ -30,12 +31,14 @@ import hashlib
 import json
 import os
 import re
-import shutil
 import subprocess
 import sys
 from pathlib import Path
 
+from superclaude.scripts import insight_store, tree_status
+from superclaude.scripts.insight_index import INDEXED_FIELDS, InsightIndex
 from superclaude.utils import (
+    atomic_write_json,
     hook_state_dir,
     project_key,
     project_root,
@@ -58,6 +61,33 @@ def _pending_file() -> Path:
     return project_root() / ".claude" / "insights.pending.jsonl"
 
 
+def _insight_index() -> InsightIndex:
+    """The history's sidecar index, caught up with anything appended since."""
+    return InsightIndex.open(
+        _insight_file(),
+        hook_state_dir() / f"insight_index_{project_key()}.sqlite3",
+    )
+
+
+def _insight_store_file() -> Path:
+    return hook_state_dir() / f"insight_store_{project_key()}.sqlite3"
+
+
+def _insight_store() -> insight_store.InsightStore:
+    """The SQLite search mirror, synced with both insight files.
+
+    Raises:
+        insight_store.InsightStoreUnavailableError: No sqlite3 / FTS5 here
+    """
+    return insight_store.open_store(
+        _insight_store_file(),
+        {
+            insight_store.INSIGHTS: _insight_file(),
+            insight_store.PENDING: _pending_file(),
+        },
+    )
+
+
 VALID_TYPES = {"feedback", "decision", "discovery", "pattern", "metric", "annotation"}
 # Match INSIGHT: at line start OR inline ('text INSIGHT: rest'). Word boundary
 # prevents matching 'INSIGHTS:' or 'INSIGHTFUL:'. Lazy + lookahead lets multiple
@@ -67,7 +97,9 @@ MARKER_RE = re.compile(
     r"\bINSIGHT\s*:\s*(.+?)(?=\s*\bINSIGHT\s*:|$)",
     re.MULTILINE,
 )
-# Cap transcript scan to keep hook within 10s timeout on huge sessions.
+# Cap the first scan of a transcript to keep the hook within its 10s timeout on
+# huge sessions. Later harvests resume from a byte cursor and read everything
+# written since, however far back that is.
 TRANSCRIPT_TAIL_BYTES = 5 * 1024 * 1024  # 5 MB
 
 
@@ -78,13 +110,33 @@ def _ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def _now_iso() -> str:
+def _iso(moment: _dt.datetime) -> str:
     """ISO 8601 with second precision and colon offset (matches existing schema)."""
-    now = _dt.datetime.now().astimezone()
-    s = now.strftime("%Y-%m-%dT%H:%M:%S%z")
+    s = moment.strftime("%Y-%m-%dT%H:%M:%S%z")
     return s[:-2] + ":" + s[-2:] if s[-5] in "+-" else s
 
 
+def _now_iso() -> str:
+    return _iso(_dt.datetime.now().astimezone())
+
+
+def _unused_timestamps(count: int) -> list[str]:
+    """count distinct timestamps from now on that no insight already carries.
+
+    ts is what an annotation's ref_ts names, so entries sharing one second
+    would all be annotated at once. Each taken second moves on to the next.
+    """
+    moment = _dt.datetime.now().astimezone()
+    stamps: list[str] = []
+    with _insight_index() as index:
+        while len(stamps) < count:
+            ts = _iso(moment)
+            if ts not in stamps and not index.lookup("ts", ts):
+                stamps.append(ts)
+            moment += _dt.timedelta(seconds=1)
+    return stamps
+
+
 def _git_user() -> str:
     try:
         r = subprocess.run(
@@ -97,17 +149,6 @@ def _git_user() -> str:
     return os.environ.get("USER") or os.environ.get("USERNAME") or "unknown"
 
 
-def _require_jq() -> str:
-    jq = shutil.which("jq")
-    if not jq:
-        print(
-            "jq not found — install: https://jqlang.github.io/jq/download/",
-            file=sys.stderr,
-        )
-        sys.exit(1)
-    return jq
-
-
 def _encode_cwd(cwd: str) -> str:
     """Replicate Claude Code's projects-dir encoding: each [:\\/] → '-' (no coalescing).
 
@@ -192,6 +233,7 @@ def cmd_append(args: argparse.Namespace) -> int:
     with _insight_file().open("a", encoding="utf-8") as f:
         for entry in cleaned:
             f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    _insight_index().close()  # index the new lines while they are in the page cache
 
     print(f"appended {len(cleaned)} insight(s) to {_insight_file()}")
     return 0
@@ -200,41 +242,31 @@ def cmd_append(args: argparse.Namespace) -> int:
 def _annotation_target_exists(ref_ts: str) -> bool:
     if not _insight_file().exists():
         return False
-    with _insight_file().open(encoding="utf-8") as f:
-        for line in f:
-            try:
-                d = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if d.get("ts") == ref_ts and d.get("type") != "annotation":
-                return True
-    return False
+    with _insight_index() as index:
+        targets = index.entries(index.lookup("ts", ref_ts))
+    return any(d.get("type") != "annotation" for d in targets)
 
 
-# ---------- read paths (jq) ----------
+# ---------- read paths ----------
+
+
+def _field_text(value) -> str:
+    """A field as jq's string interpolation rendered it: strings bare, else JSON."""
+    return value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
 
 
 def cmd_list(args: argparse.Namespace) -> int:
     if not _insight_file().exists():
         print("(no insights yet)")
         return 0
-    jq = _require_jq()
-    r = subprocess.run(
-        [
-            jq,
-            "-r",
-            r'"\(.ts) [\(.author // "unknown")] [\(.type)] \(.insight)"',
-            str(_insight_file()),
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if r.returncode != 0:
-        print(r.stderr, file=sys.stderr)
-        return r.returncode
-    lines = r.stdout.strip().split("\n")
-    for line in lines[-args.limit :]:
-        print(line)
+    with _insight_index() as index:
+        newest = index.last(args.limit)
+    for d in newest:
+        author = d.get("author")
+        print(
+            f"{_field_text(d.get('ts'))} [{_field_text(author or 'unknown')}] "
+            f"[{_field_text(d.get('type'))}] {_field_text(d.get('insight'))}"
+        )
     return 0
 
 
@@ -249,34 +281,24 @@ def cmd_query(args: argparse.Namespace) -> int:
     if not key.isidentifier():
         print(f"query: invalid key '{key}' (must be identifier)", file=sys.stderr)
         return 2
-    jq = _require_jq()
-    # Pass value via --arg to prevent jq-syntax injection from model-supplied text.
-    if key == "tags":
-        filt = "select(.tags // [] | index($v))"
-    else:
-        filt = f"select(.{key}==$v)"
-    r = subprocess.run([jq, "--arg", "v", value, filt, str(_insight_file())], text=True)
-    return r.returncode
+    with _insight_index() as index:
+        if key in INDEXED_FIELDS:
+            matches = index.entries(index.lookup(key, value))
+        else:
+            matches = (d for d in index.scan() if d.get(key) == value)
+    for d in matches:
+        print(json.dumps(d, indent=2, ensure_ascii=False))
+    return 0
 
 
 def cmd_stats(args: argparse.Namespace) -> int:
     if not _insight_file().exists():
         print("(no insights yet)")
         return 0
-    jq = _require_jq()
-    type_filt = ".type" if args.all else 'select(.type != "annotation") | .type'
-    r = subprocess.run(
-        [jq, "-r", type_filt, str(_insight_file())],
-        capture_output=True,
-        text=True,
-    )
-    if r.returncode != 0:
-        print(r.stderr, file=sys.stderr)
-        return r.returncode
-    counts: dict[str, int] = {}
-    for line in r.stdout.strip().split("\n"):
-        if line:
-            counts[line] = counts.get(line, 0) + 1
+    with _insight_index() as index:
+        counts = index.counts("type")
+    if not args.all:
+        counts.pop("annotation", None)
     print("Type distribution:")
     for t, n in sorted(counts.items(), key=lambda x: -x[1]):
         print(f"  {n:>4}  {t}")
@@ -284,6 +306,82 @@ def cmd_stats(args: argparse.Namespace) -> int:
     return 0
 
 
+def _scan_matches(args: argparse.Namespace) -> list[tuple[str, dict]]:
+    """search without the store: every word as a case-insensitive substring.
+
+    Unranked — newest first instead — and a full read of both files, but the
+    same filters, so a Python without FTS5 still gets an answer.
+    """
+    words = args.terms.casefold().split()
+    with _insight_index() as index:
+        sources = [(insight_store.INSIGHTS, index.scan())]
+    if args.pending:
+        sources.append((insight_store.PENDING, iter(_read_pending())))
+    matches = []
+    for source, entries in sources:
+        for d in entries:
+            text = d.get("insight") or d.get("raw_text")
+            if not isinstance(text, str) or not words:
+                continue
+            if not all(w in text.casefold() for w in words):
+                continue
+            if args.type and d.get("type") != args.type:
+                continue
+            tags = d.get("tags")
+            if args.tag and not (isinstance(tags, list) and args.tag in tags):
+                continue
+            ts = insight_store.entry_ts(d)
+            if args.since and (ts is None or ts < args.since):
+                continue
+            matches.append((source, d))
+    matches.reverse()
+    return matches[: args.limit]
+
+
+def cmd_search(args: argparse.Namespace) -> int:
+    if not _insight_file().exists() and not (args.pending and _pending_file().exists()):
+        print("(no insights yet)")
+        return 0
+    try:
+        with _insight_store() as store:
+            matches = store.search(
+                args.terms,
+                type=args.type,
+                tag=args.tag,
+                since=args.since,
+                sources=(insight_store.INSIGHTS, insight_store.PENDING)
+                if args.pending
+                else (insight_store.INSIGHTS,),
+                limit=args.limit,
+            )
+    except insight_store.InsightStoreUnavailableError as e:
+        print(f"search: {e}; falling back to an unranked scan", file=sys.stderr)
+        matches = _scan_matches(args)
+    except insight_store.StoreError as e:
+        # Locked by another process, or damaged. The store only mirrors the
+        # JSONL files, so scan those, and drop a damaged one to be rebuilt.
+        if insight_store.is_corrupt(e):
+            _insight_store_file().unlink(missing_ok=True)
+        print(
+            f"search: index error ({e}); falling back to an unranked scan",
+            file=sys.stderr,
+        )
+        matches = _scan_matches(args)
+    if not matches:
+        print("(no matches)")
+    for source, d in matches:
+        if source == insight_store.PENDING:
+            ts = insight_store.entry_ts(d)
+            text = _field_text(d.get("raw_text")).replace("\n", " ")
+            print(f"{_field_text(ts)} [pending] {text}")
+            continue
+        print(
+            f"{_field_text(d.get('ts'))} [{_field_text(d.get('author') or 'unknown')}] "
+            f"[{_field_text(d.get('type'))}] {_field_text(d.get('insight'))}"
+        )
+    return 0
+
+
 # ---------- harvest ----------
 
 
@@ -321,6 +419,71 @@ def _extend_harvest_ledger(marker_ids: list[str]) -> None:
         pass  # a lost ledger costs a duplicate, never a crash
 
 
+# Where the last harvest of each transcript stopped: byte offset of the first
+# line it did not read, plus the inode and size it saw. PreCompact, SessionEnd
+# and every /sc:insight harvest used to re-decode the last 5MB from scratch —
+# harvest time grew with the session, and a marker older than the window was
+# never seen. Now each harvest reads only what was appended since the last one.
+# Also carries request_seen, which spans the two reads: a reply is harvested
+# because an earlier record asked for it.
+HARVEST_CURSORS_MAX = 64
+
+
+def _harvest_cursor_file() -> Path:
+    return hook_state_dir() / f"insight_cursors_{project_key()}.json"
+
+
+def _read_harvest_cursors() -> dict[str, dict]:
+    try:
+        data = json.loads(_harvest_cursor_file().read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _harvest_cursor(transcript: Path, stat: os.stat_result) -> dict | None:
+    """The saved cursor for transcript, or None when it must be read afresh.
+
+    A different inode means the file was replaced, a smaller size that it was
+    truncated or rewritten; either way the saved offset points at nothing.
+    """
+    cursor = _read_harvest_cursors().get(str(transcript))
+    if not isinstance(cursor, dict):
+        return None
+    try:
+        offset, inode, size = cursor["offset"], cursor["inode"], cursor["size"]
+    except KeyError:
+        return None
+    if inode != stat.st_ino or stat.st_size < size or not 0 <= offset <= size:
+        return None
+    return cursor
+
+
+def _save_harvest_cursor(transcript: Path, cursor: dict) -> None:
+    cursors = _read_harvest_cursors()
+    cursors.pop(str(transcript), None)
+    cursors[str(transcript)] = cursor  # most recent last, so trimming drops oldest
+    kept = dict(list(cursors.items())[-HARVEST_CURSORS_MAX:])
+    try:
+        _harvest_cursor_file().parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_json(_harvest_cursor_file(), kept)
+    except OSError:
+        pass  # a lost cursor costs one capped rescan, deduped by the ledger
+
+
+def _harvested_ids(pending_path: Path) -> set[str]:
+    """Marker ids already filed: the ledger plus whatever is still pending."""
+    existing_uuids: set[str] = set(_read_harvest_ledger())
+    if pending_path.exists():
+        with pending_path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    existing_uuids.add(json.loads(line).get("uuid", ""))
+                except json.JSONDecodeError:
+                    continue
+    return existing_uuids
+
+
 def cmd_harvest(args: argparse.Namespace) -> int:
     """Scan transcript for INSIGHT: markers → append unique entries to pending.
 
@@ -340,33 +503,44 @@ def cmd_harvest(args: argparse.Namespace) -> int:
     if not transcript:
         return 0  # silent: no transcript yet (e.g., first session)
 
-    pending_path = _pending_file()
+    stat = transcript.stat()
+    cursor = _harvest_cursor(transcript, stat)
+    if cursor is not None and cursor["offset"] == stat.st_size:
+        return 0  # nothing written since the last harvest
 
-    existing_uuids: set[str] = set(_read_harvest_ledger())
-    if pending_path.exists():
-        with pending_path.open(encoding="utf-8") as f:
-            for line in f:
-                try:
-                    existing_uuids.add(json.loads(line).get("uuid", ""))
-                except json.JSONDecodeError:
-                    continue
+    pending_path = _pending_file()
+    # Loaded on the first marker: most harvests find none, and then the pending
+    # file and the ledger are never opened.
+    existing_uuids: set[str] | None = None
+    # Records that could matter mention the marker or the request; everything
+    # else — tool output, most of any transcript — is skipped undecoded.
+    # JSON never escapes either ASCII string, so a byte test is exact.
+    needles = (b"INSIGHT", REQUEST_SENTINEL.encode("utf-8"))
 
     new_entries: list[dict] = []
-    request_seen = False
+    request_seen = bool(cursor and cursor.get("request_seen"))
     with transcript.open("rb") as raw_f:
-        # Tail-only scan for huge transcripts. Small files read in full.
-        size = transcript.stat().st_size
-        if size > TRANSCRIPT_TAIL_BYTES:
-            seek_pos = size - TRANSCRIPT_TAIL_BYTES
+        if cursor is not None:
+            raw_f.seek(cursor["offset"])
+        elif stat.st_size > TRANSCRIPT_TAIL_BYTES:
+            # First sight of a huge transcript: tail only. Small files in full.
+            seek_pos = stat.st_size - TRANSCRIPT_TAIL_BYTES
             # Only discard the first line if we landed mid-line. Peek the byte
             # before seek_pos: if it's '\n', we're already at line start.
             raw_f.seek(seek_pos - 1)
             prev = raw_f.read(1)
             if prev != b"\n":
                 raw_f.readline()  # discard partial line
-        # Decode after seek so we don't break inside a multi-byte sequence.
-        f = (line.decode("utf-8", errors="replace") for line in raw_f)
-        for raw in f:
+        offset = raw_f.tell()
+        for line in raw_f:
+            # A last line with no newline may still be being written: read it,
+            # but leave the cursor before it so the next harvest sees it whole.
+            if line.endswith(b"\n"):
+                offset += len(line)
+            if not any(needle in line for needle in needles):
+                continue
+            # Decode after seek so we don't break inside a multi-byte sequence.
+            raw = line.decode("utf-8", errors="replace")
             try:
                 rec = json.loads(raw)
             except json.JSONDecodeError:
@@ -418,6 +592,8 @@ def cmd_harvest(args: argparse.Namespace) -> int:
                 # Per-marker uuid: message uuid + offset hash for stable dedup
                 base_uuid = rec.get("uuid", "")
                 marker_id = f"{base_uuid}:{hashlib.md5(marker_text.encode('utf-8')).hexdigest()[:8]}"
+                if existing_uuids is None:
+                    existing_uuids = _harvested_ids(pending_path)
                 if marker_id in existing_uuids:
                     continue
                 existing_uuids.add(marker_id)
@@ -433,15 +609,28 @@ def cmd_harvest(args: argparse.Namespace) -> int:
                     }
                 )
 
+    # Entries first, cursor last: a harvest cut short in between rescans the
+    # same bytes next time, and the ledger drops what was already filed.
+    if new_entries:
+        _ensure_parent(pending_path)
+        with pending_path.open("a", encoding="utf-8") as f:
+            for e in new_entries:
+                f.write(json.dumps(e, ensure_ascii=False) + "\n")
+        _extend_harvest_ledger([e["uuid"] for e in new_entries])
+    _save_harvest_cursor(
+        transcript,
+        {
+            "offset": offset,
+            "inode": stat.st_ino,
+            # The read ran to EOF, past the size stat'ed before it whenever
+            # the session wrote on meanwhile; the file is at least offset long.
+            "size": max(stat.st_size, offset),
+            "request_seen": request_seen,
+        },
+    )
     if not new_entries:
         return 0
 
-    _ensure_parent(pending_path)
-    with pending_path.open("a", encoding="utf-8") as f:
-        for e in new_entries:
-            f.write(json.dumps(e, ensure_ascii=False) + "\n")
-    _extend_harvest_ledger([e["uuid"] for e in new_entries])
-
     if not getattr(args, "quiet", False):
         print(f"🟡 harvested {len(new_entries)} pending insight(s) — /sc:insight --review")
     return 0
@@ -481,7 +670,7 @@ def cmd_review(args: argparse.Namespace) -> int:
         print("(no pending insights)")
         return 0
     print(
-        f"# {len(pending)} pending insight(s) — promote with: insight_writer.py promote --index N --type TYPE"
+        f"# {len(pending)} pending insight(s) — promote with: insight_writer.py promote --index N|--ids N,M|--all --type TYPE"
     )
     for i, e in enumerate(pending):
         ts = e.get("user_ts") or e.get("harvested_at", "")
@@ -492,44 +681,113 @@ def cmd_review(args: argparse.Namespace) -> int:
     return 0
 
 
-def cmd_promote(args: argparse.Namespace) -> int:
-    pending = _read_pending()
+def _promote_selection(
+    args: argparse.Namespace, pending: list[dict]
+) -> list[int] | None:
+    """Indices of the pending entries args selects, in file order.
+
+    --index N and --ids take review's indices; --ids also takes marker uuids.
+    --filter key=value matches pending fields the way query matches insights.
+
+    Returns:
+        The indices, or None after printing why the selection is invalid
+    """
+    if getattr(args, "all", False):
+        return list(range(len(pending)))
+    if getattr(args, "filter", None):
+        key, sep, value = args.filter.partition("=")
+        if not sep or not key.isidentifier():
+            print("promote: --filter expects key=value", file=sys.stderr)
+            return None
+        return [i for i, e in enumerate(pending) if e.get(key) == value]
+    if getattr(args, "ids", None):
+        by_uuid = {e.get("uuid"): i for i, e in enumerate(pending)}
+        selected = set()
+        for token in (t.strip() for t in args.ids.split(",")):
+            if not token:
+                continue
+            index = int(token) if token.isdigit() else by_uuid.get(token)
+            if index is None or index >= len(pending):
+                print(
+                    f"promote: no pending entry '{token}' (have {len(pending)})",
+                    file=sys.stderr,
+                )
+                return None
+            selected.add(index)
+        return sorted(selected)
     if args.index < 0 or args.index >= len(pending):
         print(
             f"promote: index {args.index} out of range (have {len(pending)})",
             file=sys.stderr,
         )
-        return 2
-    p = pending[args.index]
-    insight_text = (args.insight or p.get("raw_text", "")).strip()
-    if not insight_text:
+        return None
+    return [args.index]
+
+
+def cmd_promote(args: argparse.Namespace) -> int:
+    """Move pending entries to insights.jsonl: one read, one append, one rewrite.
+
+    Promoting a long session's markers one --index at a time re-read and
+    rewrote the whole pending file per marker, each with its own append and
+    index refresh. --all / --ids / --filter promote the whole selection in one
+    pass; --index N is the one-entry case of the same path.
+    """
+    pending = _read_pending()
+    single = args.index is not None
+    if args.insight and not single:
         print(
-            f'promote: pending entry {args.index} has empty raw_text; pass --insight "..."',
+            "promote: --insight rewrites one entry; use it with --index",
             file=sys.stderr,
         )
         return 2
-    entry = {
-        "ts": _now_iso(),
-        "type": args.type,
-        "insight": insight_text,
-        "author": _git_user(),
-        "context": f"harvested from session {p.get('session_id', '?')} ({p.get('source', '?')})",
-    }
-    if args.tags:
-        entry["tags"] = [t.strip() for t in args.tags.split(",") if t.strip()]
-
-    payload = json.dumps(entry, ensure_ascii=False)
+    selected = _promote_selection(args, pending)
+    if selected is None:
+        return 2
+
+    tags = [t.strip() for t in args.tags.split(",") if t.strip()] if args.tags else []
+    author = _git_user()
+    stamps = iter(_unused_timestamps(len(selected)))
+    promoted: list[int] = []
+    entries: list[dict] = []
+    for i in selected:
+        p = pending[i]
+        insight_text = (args.insight or p.get("raw_text", "")).strip()
+        if not insight_text:
+            if single:
+                print(
+                    f'promote: pending entry {i} has empty raw_text; pass --insight "..."',
+                    file=sys.stderr,
+                )
+                return 2
+            print(f"promote: skipped entry {i}, empty raw_text", file=sys.stderr)
+            continue
+        entry = {
+            "ts": next(stamps),
+            "type": args.type,
+            "insight": insight_text,
+            "author": author,
+            "context": f"harvested from session {p.get('session_id', '?')} ({p.get('source', '?')})",
+        }
+        if tags:
+            entry["tags"] = tags
+        promoted.append(i)
+        entries.append(entry)
+    if not entries:
+        print("(no pending insights selected)")
+        return 0
+
+    payload = json.dumps(entries, ensure_ascii=False)
     rc = cmd_append(argparse.Namespace(json=payload))
     if rc != 0:
         # Append failed (validation error): preserve pending so user can retry.
         return rc
 
     # Append succeeded — only now is it safe to remove from pending.
-    pending.pop(args.index)
+    drop = set(promoted)
+    pending = [e for i, e in enumerate(pending) if i not in drop]
     _write_pending(pending)
-    print(
-        f"promoted index {args.index} → {_insight_file()} (remaining pending: {len(pending)})"
-    )
+    what = f"index {promoted[0]}" if single else f"{len(promoted)} entries"
+    print(f"promoted {what} → {_insight_file()} (remaining pending: {len(pending)})")
     return 0
 
 
@@ -583,30 +841,23 @@ _FRAMEWORK_OWNED_PATHS = (
 )
 
 
-def _status_lines() -> list[str] | None:
-    """Sorted `git status --porcelain` lines, framework-owned paths removed.
+def _status_lines(share_as: str | None = None) -> list[str] | None:
+    """Sorted `git status --porcelain -uall` lines, framework-owned paths removed.
+
+    -uall because without it git collapses an untracked directory to a single
+    `?? .claude/` line, and a framework-owned path inside it can no longer be
+    recognised or filtered. The one git run of the event goes through
+    tree_status; share_as lets the other SessionStart hook reuse it.
 
     Returns None when git cannot answer at all — no repository, no git on PATH,
     a timeout — which every caller treats as "do not prompt".
     """
-    try:
-        result = subprocess.run(
-            # -uall: without it git collapses an untracked directory to a
-            # single `?? .claude/` line, and a framework-owned path inside it
-            # can no longer be recognised or filtered.
-            ["git", "status", "--porcelain", "-uall"],
-            cwd=str(project_root()),
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-    except (OSError, subprocess.SubprocessError):
-        return None
-    if result.returncode != 0:
+    snapshot = tree_status.status(project_root(), share_as=share_as)
+    if snapshot is None:
         return None
 
     lines = []
-    for raw in result.stdout.splitlines():
+    for raw in snapshot.lines:
         if len(raw) < 4:
             continue
         path = raw[3:]
@@ -628,12 +879,12 @@ def _working_tree_changed() -> bool:
     return bool(_status_lines())
 
 
-def _tree_fingerprint() -> str | None:
+def _tree_fingerprint(share_as: str | None = None) -> str | None:
     """A hash of the working tree's status, or None when git cannot answer."""
-    lines = _status_lines()
+    lines = _status_lines(share_as)
     if lines is None:
         return None
-    return hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+    return tree_status.fingerprint(lines)
 
 
 def _session_baseline_file(session_id: str | None) -> Path:
@@ -650,7 +901,7 @@ def cmd_session_baseline(args: argparse.Namespace) -> int:
     turn — spending the one request a session gets on a turn that changed
     nothing.
     """
-    fingerprint = _tree_fingerprint()
+    fingerprint = _tree_fingerprint(share_as="SessionStart")
     if fingerprint is None:
         return 0
     path = _session_baseline_file(getattr(args, "session_id", None))
@@ -666,10 +917,14 @@ def cmd_session_baseline(args: argparse.Namespace) -> int:
 
 
 def _session_changed_code(session_id: str | None) -> bool:
-    """Did *this* session change code, rather than "is the tree dirty"."""
-    current = _tree_fingerprint()
-    if current is None:
+    """Did *this* session change code, rather than "is the tree dirty".
+
+    One git status answers both the fingerprint and the no-baseline fallback.
+    """
+    lines = _status_lines()
+    if lines is None:
         return False
+    current = tree_status.fingerprint(lines)
     try:
         recorded = json.loads(
             _session_baseline_file(session_id).read_text(encoding="utf-8")
@@ -677,7 +932,7 @@ def _session_changed_code(session_id: str | None) -> bool:
     except (OSError, json.JSONDecodeError, AttributeError):
         recorded = None
     if not recorded:
-        return bool(_status_lines())
+        return bool(lines)
     return current != recorded
 
 
@@ -785,6 +1040,15 @@ def build_parser() -> argparse.ArgumentParser:
     s.add_argument("--all", action="store_true", help="include annotations")
     s.set_defaults(fn=cmd_stats)
 
+    se = sub.add_parser("search")
+    se.add_argument("terms", help="words that must all appear (ranked by relevance)")
+    se.add_argument("--type", choices=sorted(VALID_TYPES))
+    se.add_argument("--tag")
+    se.add_argument("--since", help="ISO timestamp or prefix, e.g. 2026-01")
+    se.add_argument("--limit", type=int, default=20)
+    se.add_argument("--pending", action="store_true", help="include pending markers")
+    se.set_defaults(fn=cmd_search)
+
     h = sub.add_parser("harvest")
     h.add_argument(
         "--source", default="other", help="hook source (clear|compact|other|...)"
@@ -798,9 +1062,13 @@ def build_parser() -> argparse.ArgumentParser:
     r.set_defaults(fn=cmd_review)
 
     pr = sub.add_parser("promote")
-    pr.add_argument("--index", type=int, required=True)
+    which = pr.add_mutually_exclusive_group(required=True)
+    which.add_argument("--index", type=int)
+    which.add_argument("--ids", help="comma-separated review indices or marker uuids")
+    which.add_argument("--all", action="store_true", help="every pending entry")
+    which.add_argument("--filter", help="key=value on pending fields (source=...)")
     pr.add_argument("--type", required=True, choices=sorted(VALID_TYPES))
-    pr.add_argument("--insight", help="override raw_text")
+    pr.add_argument("--insight", help="override raw_text (--index only)")
     pr.add_argument("--tags", help="comma-separated tags")
     pr.set_defaults(fn=cmd_promote)
 
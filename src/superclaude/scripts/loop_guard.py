@@ -8,17 +8,27 @@ Contract:
   >=5 error entries within a 15-minute window, block and prompt for a
   change of approach.
 
-State lives at <claude_base>/.superclaude_hooks/loop_guard_<project_key>.json —
-ephemeral, regenerable, and removed by ``superclaude uninstall`` with the rest of
-the scope. Fail-open on any error. Opt out with SUPERCLAUDE_LOOP_GUARD=0.
+State lives under <claude_base>/.superclaude_hooks/loop_guard_<project_key>/ —
+one append-only log per signature, named by the signature's hash. Ephemeral,
+regenerable, and removed by ``superclaude uninstall`` with the rest of the
+scope. Fail-open on any error. Opt out with SUPERCLAUDE_LOOP_GUARD=0.
+
+The store used to be one JSON file that Pre and Post each loaded whole, pruned,
+scanned and rewrote through mkstemp + os.replace — twice per Edit/Write/Bash
+call. Atomic replace stopped torn files but not lost updates: under sub-agent
+fan-out two Posts read the same state, and whichever replaced the file last
+dropped the other's error record, so a loop spread over parallel agents never
+reached the threshold. Now Pre reads the tail of one small file, and Post is a
+single O_APPEND write, which concurrent writers cannot clobber. A successful
+call appends a reset marker instead of deleting anything.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import sys
-import tempfile
 import time
 from pathlib import Path
 
@@ -27,17 +37,34 @@ from superclaude.utils import hook_state_dir, project_key
 BLOCK_THRESHOLD = 5
 WINDOW_SECONDS = 15 * 60
 
+# Pre reads at most this much of a signature's log, from the end — about 200
+# records, far past the threshold, however long the log has grown.
+TAIL_BYTES = 4096
+
+_ERROR = "e"
+_RESET = "ok"
+
+# Marks when the log directory was last swept for expired signatures.
+_SWEEP_MARKER = ".swept"
+
 
 def _state_path() -> Path:
+    """Directory holding one log per signature."""
+    return hook_state_dir() / f"loop_guard_{project_key()}"
+
+
+def _legacy_state_path() -> Path:
+    """The single JSON file the store replaced, migrated on first sight."""
     return hook_state_dir() / f"loop_guard_{project_key()}.json"
 
 
-def _approve() -> None:
-    print(json.dumps({"decision": "approve"}))
+def _log_path(signature: str) -> Path:
+    digest = hashlib.sha256(signature.encode("utf-8")).hexdigest()[:32]
+    return _state_path() / f"{digest}.log"
 
 
-def _block(reason: str) -> None:
-    print(json.dumps({"decision": "block", "reason": reason}))
+def _approve() -> None:
+    print(json.dumps({"decision": "approve"}))
 
 
 def _load_state(path: Path) -> dict:
@@ -55,29 +82,106 @@ def _load_state(path: Path) -> dict:
         return {"entries": []}
 
 
-def _save_state(path: Path, state: dict) -> None:
+def _append(path: Path, kind: str, ts: float, create: bool = True) -> None:
+    """Append one record with a single write(); O_APPEND keeps racers whole.
+
+    With create=False a missing log is left missing: a success on a signature
+    that never failed has nothing to reset, and creating a file for every
+    successful call would fill the directory.
+    """
+    flags = os.O_WRONLY | os.O_APPEND | (os.O_CREAT if create else 0)
     try:
+        fd = os.open(path, flags, 0o644)
+    except FileNotFoundError:
+        if not create:
+            return
         path.parent.mkdir(parents=True, exist_ok=True)
-        # Atomic write: serialize to a temp file in the same directory, then
-        # os.replace (atomic on POSIX and Windows). Under concurrent same-cwd
-        # subagent fan-out this guarantees a reader/competing writer never sees a
-        # half-written (torn) state file — which would otherwise parse-fail and
-        # silently reset the circuit breaker's error history.
-        fd, tmp = tempfile.mkstemp(
-            dir=str(path.parent), prefix=".loop_guard_", suffix=".tmp"
-        )
+        fd = os.open(path, flags, 0o644)
+    try:
+        os.write(fd, f"{ts:.3f} {kind}\n".encode("ascii"))
+    finally:
+        os.close(fd)
+
+
+def _error_count(path: Path, now: float) -> int:
+    """Errors in the window since the signature's last reset."""
+    try:
+        with path.open("rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - TAIL_BYTES))
+            lines = f.read().split(b"\n")
+    except OSError:
+        return 0
+    if size > TAIL_BYTES:
+        lines = lines[1:]  # the first line read is probably cut
+
+    cutoff = now - WINDOW_SECONDS
+    count = 0
+    for line in reversed(lines):
+        parts = line.split()
+        if len(parts) != 2:
+            continue
         try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                json.dump(state, f)
-            os.replace(tmp, path)
+            ts = float(parts[0])
+        except ValueError:
+            continue
+        if parts[1] == _RESET.encode():
+            break
+        if parts[1] == _ERROR.encode() and ts >= cutoff:
+            count += 1
+    return count
+
+
+def _migrate_legacy_state(now: float) -> None:
+    """Move in-window errors from the old JSON file into the logs, once.
+
+    The file is claimed by rename first, so of two runs racing here exactly
+    one imports it.
+    """
+    legacy = _legacy_state_path()
+    claimed = legacy.with_name(f".{legacy.name}.{os.getpid()}.migrating")
+    try:
+        os.rename(legacy, claimed)
+    except OSError:
+        return
+    try:
+        for entry in _prune(_load_state(claimed)["entries"], now):
+            signature = entry.get("signature")
+            if entry.get("kind") == "error" and isinstance(signature, str):
+                _append(_log_path(signature), _ERROR, entry["ts"])
+    except OSError:
+        pass
+    finally:
+        try:
+            claimed.unlink()
         except OSError:
+            pass
+
+
+def _sweep(now: float) -> None:
+    """Delete logs untouched for a whole window, at most once per window.
+
+    A log past the window holds nothing that can count. The one record at
+    risk is an append racing the unlink of a log idle for 15 minutes — the
+    first error of a new run, which then needs one more repeat to block.
+    """
+    directory = _state_path()
+    marker = directory / _SWEEP_MARKER
+    try:
+        if marker.stat().st_mtime >= now - WINDOW_SECONDS:
+            return
+    except FileNotFoundError:
+        pass
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+        for log in directory.glob("*.log"):
             try:
-                os.unlink(tmp)
+                if log.stat().st_mtime < now - WINDOW_SECONDS:
+                    log.unlink()
             except OSError:
-                pass
-            raise
+                continue
     except OSError:
-        # Fail open — don't crash the hook on write failure
         pass
 
 
@@ -137,40 +241,49 @@ def _handle_post(data: dict) -> None:
     tool_input = data.get("tool_input", {}) or {}
     tool_response = data.get("tool_response", {})
     sig = _signature(tool_name, tool_input)
-    path = _state_path()
-    state = _load_state(path)
     now = time.time()
-    entries = _prune(state.get("entries", []), now)
-    if _is_error(tool_response):
-        entries.append({"signature": sig, "ts": now, "kind": "error"})
-    else:
-        # Successful call on this signature clears its error entries
-        entries = [e for e in entries if e.get("signature") != sig]
-    state["entries"] = entries
-    _save_state(path, state)
+    _migrate_legacy_state(now)
+    try:
+        if _is_error(tool_response):
+            _append(_log_path(sig), _ERROR, now)
+            _sweep(now)
+        else:
+            # Successful call on this signature clears its error entries
+            _append(_log_path(sig), _RESET, now, create=False)
+    except OSError:
+        # Fail open — don't crash the hook on write failure
+        pass
     _approve()
 
 
-def _handle_pre(data: dict) -> None:
+def _handle_pre(data: dict) -> dict:
     tool_name = data.get("tool_name", "")
     tool_input = data.get("tool_input", {}) or {}
     sig = _signature(tool_name, tool_input)
-    path = _state_path()
-    state = _load_state(path)
     now = time.time()
-    entries = _prune(state.get("entries", []), now)
-    count = sum(
-        1 for e in entries if e.get("signature") == sig and e.get("kind") == "error"
-    )
+    _migrate_legacy_state(now)
+    count = _error_count(_log_path(sig), now)
     if count >= BLOCK_THRESHOLD:
-        _block(
-            f"Circuit breaker: same tool call signature failed {count} times "
-            f"in the last 15 min. Change your approach — try a different "
-            f"tool, a different file/command, or ask the user for guidance "
-            f"before retrying. (Set SUPERCLAUDE_LOOP_GUARD=0 to disable.)"
-        )
-        return
-    _approve()
+        return {
+            "decision": "block",
+            "reason": (
+                f"Circuit breaker: same tool call signature failed {count} times "
+                f"in the last 15 min. Change your approach — try a different "
+                f"tool, a different file/command, or ask the user for guidance "
+                f"before retrying. (Set SUPERCLAUDE_LOOP_GUARD=0 to disable.)"
+            ),
+        }
+    return {"decision": "approve"}
+
+
+def evaluate(data: dict) -> dict:
+    """PreToolUse decision for one parsed hook payload; fails open."""
+    if os.environ.get("SUPERCLAUDE_LOOP_GUARD", "1") == "0":
+        return {"decision": "approve"}
+    try:
+        return _handle_pre(data)
+    except Exception:
+        return {"decision": "approve"}
 
 
 def main() -> None:
@@ -192,7 +305,7 @@ def main() -> None:
 
         event = data.get("hook_event_name", "")
         if event == "PreToolUse":
-            _handle_pre(data)
+            print(json.dumps(_handle_pre(data)))
         elif event == "PostToolUse":
             _handle_post(data)
         else:
@@ -18,6 +18,7 @@ import sys
 from datetime import date, datetime
 from pathlib import Path
 
+from superclaude.scripts.projects_index import listing
 from superclaude.utils import project_root
 
 DEFAULT_THRESHOLD_DAYS = 90
@@ -70,22 +71,32 @@ def _parse_verified(text: str) -> date | None:
         return None
 
 
+def _verified_field(path: Path) -> dict:
+    """The `verified:` date of one memory file, as cached by projects_index."""
+    try:
+        verified = _parse_verified(path.read_text(encoding="utf-8"))
+    except OSError:
+        verified = None
+    return {"verified": verified.isoformat() if verified else None}
+
+
 def scan_stale_entries(memory_dir: Path, threshold_days: int) -> list[Path]:
-    """Return memory files whose `verified:` is older than `threshold_days`."""
+    """Return memory files whose `verified:` is older than `threshold_days`.
+
+    Dates come from the projects_index listing: a file is read and parsed only
+    when its mtime or size changed since the last SessionStart.
+    """
     if not memory_dir.is_dir():
         return []
     today = date.today()
+    entries = listing(memory_dir, ".md", parse=_verified_field, recheck=None)
     stale: list[Path] = []
-    for path in sorted(memory_dir.glob("*.md")):
-        try:
-            text = path.read_text(encoding="utf-8")
-        except OSError:
-            continue
-        verified = _parse_verified(text)
+    for name in sorted(entries):
+        verified = entries[name].get("verified")
         if verified is None:
             continue
-        if (today - verified).days > threshold_days:
-            stale.append(path)
+        if (today - date.fromisoformat(verified)).days > threshold_days:
+            stale.append(memory_dir / name)
     return stale
 
 
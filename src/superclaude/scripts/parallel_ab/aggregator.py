@@ -1,12 +1,25 @@
-"""Aggregate N variant observations into matrix.md + decision.md."""
+"""Aggregate variant observations into matrix.md + decision.md.
+
+Observations come from a scenario × variant × repetition grid. A spec with one
+scenario run once gets one matrix row per variant. A larger grid gets, per
+scenario, a summary of each variant's runs followed by the runs themselves,
+then a pooled summary over all scenarios.
+
+The leader is the variant with the best pooled summary. decision.md names it
+the winner only when it beats every other variant in a paired test (see
+stats.py); otherwise it reports no significant winner, with the effect sizes.
+"""
 
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass
 from pathlib import Path
+from statistics import median
 from typing import Iterable
 
 from .observation import Observation, validate
+from .stats import ALPHA, CONFIDENCE, Comparison, rank
 
 FIXED_COLS = (
     "variant",
@@ -18,6 +31,36 @@ FIXED_COLS = (
     "sha",
 )
 
+SUMMARY_COLS = (
+    "variant",
+    "ok",
+    "wall_s median [min–max]",
+    "input_tok median",
+    "output_tok median",
+)
+
+
+@dataclass(frozen=True)
+class VariantStats:
+    """One variant's runs within a set of observations.
+
+    The samples hold the runs that exited ok; the others count in ``runs``.
+    """
+
+    variant_id: str
+    runs: int
+    wall_seconds: tuple[float, ...] = ()
+    input_tokens: tuple[int, ...] = ()
+    output_tokens: tuple[int, ...] = ()
+
+    @property
+    def ok(self) -> int:
+        return len(self.wall_seconds)
+
+    @property
+    def pass_rate(self) -> float:
+        return self.ok / self.runs if self.runs else 0.0
+
 
 def aggregate(obs_dir: Path) -> tuple[Path, Path]:
     """Read every ``obs-*.json`` under *obs_dir* and emit matrix.md + decision.md.
@@ -34,7 +77,7 @@ def aggregate(obs_dir: Path) -> tuple[Path, Path]:
     for p in obs_paths:
         data = json.loads(p.read_text(encoding="utf-8"))
         obs_list.append(validate(data))
-    obs_list.sort(key=lambda o: o.variant_id)
+    obs_list.sort(key=lambda o: (o.scenario_id, o.variant_id, o.rep))
 
     matrix_path = obs_dir / "matrix.md"
     decision_path = obs_dir / "decision.md"
@@ -43,6 +86,36 @@ def aggregate(obs_dir: Path) -> tuple[Path, Path]:
     return matrix_path, decision_path
 
 
+def variant_stats(obs_list: Iterable[Observation]) -> list[VariantStats]:
+    """Per-variant samples of *obs_list*, sorted by variant id."""
+    by_variant: dict[str, list[Observation]] = {}
+    for o in obs_list:
+        by_variant.setdefault(o.variant_id, []).append(o)
+    stats = []
+    for vid in sorted(by_variant):
+        runs = by_variant[vid]
+        ok = [o for o in runs if o.exit_status == "ok"]
+        stats.append(
+            VariantStats(
+                variant_id=vid,
+                runs=len(runs),
+                wall_seconds=tuple(o.wall_seconds for o in ok),
+                input_tokens=tuple(o.tokens.input for o in ok),
+                output_tokens=tuple(o.tokens.output for o in ok),
+            )
+        )
+    return stats
+
+
+def _scenario_ids(obs_list: Iterable[Observation]) -> list[str]:
+    return sorted({o.scenario_id for o in obs_list})
+
+
+def _is_grid(obs_list: list[Observation]) -> bool:
+    """More than one scenario or more than one run per variant."""
+    return len(_scenario_ids(obs_list)) > 1 or any(o.rep for o in obs_list)
+
+
 def _axes_columns(obs_list: Iterable[Observation]) -> list[str]:
     keys: set[str] = set()
     for o in obs_list:
@@ -56,7 +129,7 @@ def _tools_summary(obs: Observation) -> str:
     return ", ".join(f"{tc.name}×{tc.count}" for tc in obs.tool_calls)
 
 
-def _row(obs: Observation, axes_cols: list[str]) -> str:
+def _row(obs: Observation, axes_cols: list[str], with_rep: bool = False) -> str:
     sha_short = obs.final_output_sha256[:8] if obs.final_output_sha256 else "—"
     cells = [
         obs.variant_id,
@@ -67,39 +140,161 @@ def _row(obs: Observation, axes_cols: list[str]) -> str:
         _tools_summary(obs),
         sha_short,
     ]
+    if with_rep:
+        cells.insert(1, str(obs.rep))
     for col in axes_cols:
         cells.append(obs.axes.get(col, "—"))
     return "| " + " | ".join(cells) + " |"
 
 
-def _render_matrix(obs_list: list[Observation]) -> str:
-    axes_cols = _axes_columns(obs_list)
-    header_cells = list(FIXED_COLS) + axes_cols
+def _table(header_cells: list[str], rows: list[str]) -> str:
     header = "| " + " | ".join(header_cells) + " |"
     sep = "|" + "|".join(["---"] * len(header_cells)) + "|"
-    rows = [_row(o, axes_cols) for o in obs_list]
     return "\n".join([header, sep, *rows]) + "\n"
 
 
-def _render_decision(obs_list: list[Observation]) -> str:
-    passing = [o for o in obs_list if o.exit_status == "ok"]
+def _render_runs(obs_list: list[Observation], with_rep: bool = False) -> str:
+    axes_cols = _axes_columns(obs_list)
+    header_cells = list(FIXED_COLS) + axes_cols
+    if with_rep:
+        header_cells.insert(1, "rep")
+    return _table(header_cells, [_row(o, axes_cols, with_rep) for o in obs_list])
+
+
+def _summary_row(s: VariantStats) -> str:
+    cells = [s.variant_id, f"{s.ok}/{s.runs}"]
+    if s.ok:
+        cells += [
+            f"{median(s.wall_seconds):.1f} "
+            f"[{min(s.wall_seconds):.1f}–{max(s.wall_seconds):.1f}]",
+            f"{median(s.input_tokens):.0f}",
+            f"{median(s.output_tokens):.0f}",
+        ]
+    else:
+        cells += ["—"] * 3
+    return "| " + " | ".join(cells) + " |"
+
+
+def _render_summary(stats: list[VariantStats]) -> str:
+    return _table(list(SUMMARY_COLS), [_summary_row(s) for s in stats])
+
+
+def _render_matrix(obs_list: list[Observation]) -> str:
+    if not _is_grid(obs_list):
+        return _render_runs(obs_list)
+    scenarios = _scenario_ids(obs_list)
+    parts: list[str] = []
+    for sid in scenarios:
+        group = [o for o in obs_list if o.scenario_id == sid]
+        if len(scenarios) > 1:
+            parts.append(f"## Scenario {sid}\n")
+        parts.append(_render_summary(variant_stats(group)))
+        parts.append(_render_runs(group, with_rep=True))
+    if len(scenarios) > 1:
+        parts.append(f"## Pooled ({len(scenarios)} scenarios)\n")
+        parts.append(_render_summary(variant_stats(obs_list)))
+    return "\n".join(parts)
+
+
+def _pick_winner(stats: list[VariantStats]) -> VariantStats | None:
+    """Highest pass rate, then fastest median wall, then fewest output tokens."""
+    passing = [s for s in stats if s.ok]
     if not passing:
+        return None
+    return min(
+        passing,
+        key=lambda s: (
+            -s.pass_rate,
+            median(s.wall_seconds),
+            median(s.output_tokens),
+            s.variant_id,
+        ),
+    )
+
+
+def _render_comparisons(comparisons: list[Comparison]) -> str:
+    leader = comparisons[0].leader
+    rows = []
+    for c in comparisons:
+        # + 0.0 turns -0.0 into 0.0
+        delta = "—" if c.wall_delta is None else f"{c.wall_delta + 0.0:+.1f}"
+        rows.append(
+            f"| {c.other} | {c.pairs} | {c.wins}–{c.losses} | "
+            f"{c.dominance + 0.0:+.2f} "
+            f"[{c.ci_low + 0.0:+.2f}, {c.ci_high + 0.0:+.2f}] | {delta} | "
+            f"{c.p_value:.3f} | {'✓' if c.significant else '—'} |"
+        )
+    return (
+        f"Paired runs (same scenario and repetition) against {leader}: "
+        f"δ = (runs {leader} won − runs it lost) / pairs, with a "
+        f"{CONFIDENCE:.0%} bootstrap interval; a failed run loses to an ok one. "
+        f"p is an exact two-sided sign test on wins against losses, ties left "
+        f"out; ✓ marks p < {ALPHA:g} in {leader}'s favour.\n\n"
+        + _table(
+            [
+                "variant",
+                "pairs",
+                "won–lost",
+                f"δ for {leader}",
+                "median Δ wall_s",
+                "p",
+                "significant",
+            ],
+            rows,
+        )
+    )
+
+
+def _render_decision(obs_list: list[Observation]) -> str:
+    stats = variant_stats(obs_list)
+    winner = _pick_winner(stats)
+    if winner is None:
         return (
             "## Decision\n\n"
             "No clear winner — all variants failed "
             f"(N={len(obs_list)}). Inspect matrix.md for individual exit statuses.\n"
         )
-    # cheapest = fastest wall, then fewest output tokens
-    winner = min(
-        passing,
-        key=lambda o: (o.wall_seconds, o.tokens.output, o.variant_id),
+    comparisons = rank(obs_list, winner.variant_id)
+    unresolved = [c.other for c in comparisons if not c.significant]
+    summary = (
+        f"**{winner.variant_id}** "
+        f"(ok {winner.ok}/{winner.runs}, median {median(winner.wall_seconds):.1f}s, "
+        f"median {median(winner.output_tokens):.0f} output tokens)"
     )
-    losers = [o.variant_id for o in obs_list if o.variant_id != winner.variant_id]
-    return (
+    if unresolved:
+        verdict = (
+            f"No significant winner. Leading: {summary}, but the paired runs "
+            f"do not separate it from {', '.join(unresolved)}. "
+        )
+    else:
+        verdict = f"Recommended winner: {summary}. "
+    losers = [s.variant_id for s in stats if s.variant_id != winner.variant_id]
+    basis = ""
+    if _is_grid(obs_list):
+        scenarios = _scenario_ids(obs_list)
+        reps = max(o.rep for o in obs_list) + 1
+        per_scenario = []
+        for sid in scenarios:
+            best = _pick_winner(
+                variant_stats(o for o in obs_list if o.scenario_id == sid)
+            )
+            per_scenario.append(f"{sid} → {best.variant_id if best else 'none'}")
+        basis = (
+            "Led on pass rate, then median wall time and output tokens, "
+            f"pooled over {len(scenarios)} scenario(s) × {reps} repetition(s)"
+        )
+        basis += (
+            f"; per scenario: {', '.join(per_scenario)}. "
+            if len(scenarios) > 1
+            else ". "
+        )
+    text = (
         "## Decision\n\n"
-        f"Recommended winner: **{winner.variant_id}** "
-        f"({winner.wall_seconds:.1f}s, {winner.tokens.output} output tokens, "
-        f"{len(winner.tool_calls)} tool-call kinds). "
+        f"{verdict}"
         f"Other variants: {', '.join(losers) if losers else '—'}. "
+        f"{basis}"
         "See matrix.md for full side-by-side comparison.\n"
     )
+    if comparisons:
+        text += "\n" + _render_comparisons(comparisons)
+    return text
@@ -25,6 +25,8 @@ KNOWN_KEYS = {
     "wall_seconds",
     "final_output_sha256",
     "axes",
+    "scenario_id",
+    "rep",
 }
 
 
@@ -55,6 +57,20 @@ class Observation:
     wall_seconds: float = 0.0
     final_output_sha256: str = ""
     axes: dict[str, str] = field(default_factory=dict)
+    # Grid position: scenario id ("" in a single-scenario spec) and 0-based rep.
+    scenario_id: str = ""
+    rep: int = 0
+
+
+def obs_filename(variant_id: str, scenario_id: str = "", rep: int = 0) -> str:
+    """``obs-<scenario>--<variant>--r<rep>.json``, each part only when it is set.
+
+    A single-scenario, single-run spec keeps the plain ``obs-<variant>.json``.
+    """
+    parts = [p for p in (scenario_id, variant_id) if p]
+    if rep:
+        parts.append(f"r{rep}")
+    return f"obs-{'--'.join(parts)}.json"
 
 
 def compute_sha256(text: str) -> str:
@@ -114,11 +130,13 @@ def validate(d: dict[str, Any]) -> Observation:
         wall_seconds=float(d.get("wall_seconds", 0.0)),
         final_output_sha256=str(d.get("final_output_sha256", "")),
         axes=dict(d.get("axes") or {}),
+        scenario_id=str(d.get("scenario_id", "")),
+        rep=int(d.get("rep", 0)),
     )
 
 
 def _to_dict(obs: Observation) -> dict[str, Any]:
-    return {
+    d = {
         "variant_id": obs.variant_id,
         "exit_status": obs.exit_status,
         "tool_calls": [asdict(tc) for tc in obs.tool_calls],
@@ -129,6 +147,12 @@ def _to_dict(obs: Observation) -> dict[str, Any]:
         "final_output_sha256": obs.final_output_sha256,
         "axes": dict(obs.axes),
     }
+    # Written only off the default, so a single-run spec's files are unchanged.
+    if obs.scenario_id:
+        d["scenario_id"] = obs.scenario_id
+    if obs.rep:
+        d["rep"] = obs.rep
+    return d
 
 
 def emit(obs: Observation, path: Path) -> None:
@@ -1,4 +1,12 @@
-"""Orchestrate N parallel variant runners + aggregate results."""
+"""Orchestrate N parallel variant runners + aggregate results.
+
+A spec is a grid: every variant runs ``repetitions`` times against every
+scenario. All of its runs share one pool — at most ``AB_MAX_PARALLEL``
+(default 8) in flight, the rest waiting on a semaphore — and a progress line
+goes to stderr as each finishes. Runs start repetition by repetition, so every
+variant gets its first sample before any gets its second and a drift in API
+latency over the batch falls on all variants alike.
+"""
 
 from __future__ import annotations
 
@@ -10,7 +18,7 @@ from pathlib import Path
 from typing import Awaitable, Callable
 
 from .aggregator import aggregate
-from .observation import Observation, emit
+from .observation import Observation, emit, obs_filename
 from .runner import run_variant
 from .spec_loader import ABSpec, RunnerCfg, Scenario, Variant, load_spec
 
@@ -20,7 +28,7 @@ RunnerFn = Callable[..., Awaitable[Observation]]
 
 
 class OrchestratorError(RuntimeError):
-    """Raised on orchestration-level failures (e.g., AB_MAX_PARALLEL exceeded)."""
+    """Raised on orchestration-level failures."""
 
 
 def _resolve_max_parallel() -> int:
@@ -47,16 +55,33 @@ async def _run_one(
     runner_fn: RunnerFn,
     variant: Variant,
     scenario: Scenario,
+    rep: int,
     cfg: RunnerCfg,
     out_dir: Path,
+    slots: asyncio.Semaphore,
 ) -> Observation:
-    try:
-        return await runner_fn(variant, scenario, cfg, out_dir)
-    except Exception as exc:  # noqa: BLE001 — preserve batch even when one runner crashes
-        sys.stderr.write(f"[parallel-ab] variant {variant.id} crashed: {exc!r}\n")
-        obs = Observation(variant_id=variant.id, exit_status="error")
-        emit(obs, out_dir / f"obs-{variant.id}.json")
-        return obs
+    async with slots:
+        try:
+            return await runner_fn(variant, scenario, cfg, out_dir, rep=rep)
+        except Exception as exc:  # noqa: BLE001 — preserve batch even when one runner crashes
+            sys.stderr.write(f"[parallel-ab] variant {variant.id} crashed: {exc!r}\n")
+            obs = Observation(
+                variant_id=variant.id,
+                exit_status="error",
+                scenario_id=scenario.id,
+                rep=rep,
+            )
+            emit(obs, out_dir / obs_filename(variant.id, scenario.id, rep))
+            return obs
+
+
+def _label(obs: Observation) -> str:
+    label = f"variant {obs.variant_id}"
+    if obs.scenario_id:
+        label += f" scenario {obs.scenario_id}"
+    if obs.rep:
+        label += f" rep {obs.rep}"
+    return label
 
 
 async def orchestrate(
@@ -65,26 +90,35 @@ async def orchestrate(
     out_dir: Path | None = None,
     runner_fn: RunnerFn = run_variant,
 ) -> Path:
-    """Run every variant in *spec_path* and aggregate observations.
+    """Run the scenario × variant × repetition grid in *spec_path* and
+    aggregate observations.
 
     Returns the path to ``decision.md``.
     """
     spec: ABSpec = load_spec(Path(spec_path))
-    max_parallel = _resolve_max_parallel()
-    if len(spec.variants) > max_parallel:
-        raise OrchestratorError(
-            f"AB_MAX_PARALLEL={max_parallel} exceeded by spec with "
-            f"{len(spec.variants)} variants"
-        )
+    slots = asyncio.Semaphore(_resolve_max_parallel())
 
     runner_cfg = _resolve_timeout(spec.runner)
     out = Path(out_dir) if out_dir is not None else Path(spec_path).parent
     out.mkdir(parents=True, exist_ok=True)
+    # A previous run of a larger grid would leave observations the aggregator
+    # pools with this one's.
+    for stale in out.glob("obs-*.json"):
+        stale.unlink()
 
+    # Tasks, not bare coroutines: as_completed would start those in set order.
     tasks = [
-        _run_one(runner_fn, v, spec.scenario, runner_cfg, out) for v in spec.variants
+        asyncio.create_task(_run_one(runner_fn, v, s, rep, runner_cfg, out, slots))
+        for rep in range(spec.repetitions)
+        for s in spec.scenarios
+        for v in spec.variants
     ]
-    await asyncio.gather(*tasks)
+    for done, next_obs in enumerate(asyncio.as_completed(tasks), 1):
+        obs = await next_obs
+        sys.stderr.write(
+            f"[parallel-ab] {done}/{len(tasks)} {_label(obs)}: "
+            f"{obs.exit_status} ({obs.wall_seconds:.1f}s)\n"
+        )
 
     _matrix, decision = aggregate(out)
     return decision
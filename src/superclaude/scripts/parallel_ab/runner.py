@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import random
 import re
 import sys
 import time
@@ -17,6 +18,7 @@ from .observation import (
     ToolCall,
     compute_sha256,
     emit,
+    obs_filename,
 )
 from .spec_loader import RunnerCfg, Scenario, Variant
 
@@ -24,6 +26,10 @@ _AUTH_PATTERNS = re.compile(
     r"authent|credential|api[\s\-]?key|unauthor|login",
     re.IGNORECASE,
 )
+_RATE_LIMIT_PATTERNS = re.compile(
+    r"rate[\s_\-]?limit|overloaded|too many requests|\b429\b|\b529\b",
+    re.IGNORECASE,
+)
 
 
 @dataclass(frozen=True)
@@ -44,6 +50,7 @@ class ParsedResult:
 
 
 Spawner = Callable[[list[str], int], Awaitable[SpawnResult]]
+Sleeper = Callable[[float], Awaitable[None]]
 
 
 async def _default_spawn(cmd: list[str], timeout_s: int) -> SpawnResult:
@@ -95,6 +102,19 @@ def _looks_like_auth_fail(stderr: bytes) -> bool:
     return bool(_AUTH_PATTERNS.search(text))
 
 
+def _looks_like_rate_limit(parsed: ParsedResult) -> bool:
+    """True for an ``is_error`` result the API gave for load, not the prompt."""
+    return parsed.is_error and bool(_RATE_LIMIT_PATTERNS.search(parsed.text))
+
+
+def _backoff_delay(base: float, attempt: int) -> float:
+    """Exponential backoff for retry *attempt* (1-based), with up to 50% jitter.
+
+    Variants rate-limited together would otherwise retry together.
+    """
+    return base * 2 ** (attempt - 1) * random.uniform(1.0, 1.5)
+
+
 def _parse_output(stdout: bytes) -> ParsedResult:
     text = stdout.decode("utf-8", errors="replace")
     try:
@@ -120,6 +140,31 @@ def _parse_output(stdout: bytes) -> ParsedResult:
     )
 
 
+async def _spawn(
+    cmd: list[str],
+    variant: Variant,
+    runner_cfg: RunnerCfg,
+    spawner: Spawner,
+) -> tuple[SpawnResult, list[str]]:
+    """Spawn *cmd*; returns the result and the command that produced it."""
+    result = await spawner(cmd, runner_cfg.timeout_seconds)
+
+    # Auth-fallback retry: drop --bare and try again once.
+    if (
+        result.returncode != 0
+        and "--bare" in cmd
+        and runner_cfg.oauth_fallback
+        and _looks_like_auth_fail(result.stderr)
+    ):
+        sys.stderr.write(
+            f"[parallel-ab] variant {variant.id}: auth-like failure; "
+            f"retrying without --bare\n"
+        )
+        cmd = [c for c in cmd if c != "--bare"]
+        result = await spawner(cmd, runner_cfg.timeout_seconds)
+    return result, cmd
+
+
 async def run_variant(
     variant: Variant,
     scenario: Scenario,
@@ -127,8 +172,18 @@ async def run_variant(
     out_dir: Path,
     *,
     spawner: Spawner = _default_spawn,
+    sleep: Sleeper = asyncio.sleep,
+    rep: int = 0,
 ) -> Observation:
-    """Run a single variant via ``claude -p`` and write its observation JSON."""
+    """Run a single variant via ``claude -p`` and write its observation JSON.
+
+    *rep* is the repetition index recorded with the observation.
+
+    A rate-limited ``is_error`` result is retried up to
+    ``runner_cfg.max_retries`` times with exponential backoff. The observation
+    describes the last attempt only: its wall_seconds excludes earlier
+    attempts and the time spent backing off.
+    """
     out_dir = Path(out_dir)
     cmd = _build_cmd(variant, scenario, runner_cfg)
     if runner_cfg.bare and _is_slash_command(scenario.input):
@@ -136,45 +191,34 @@ async def run_variant(
             f"[parallel-ab] variant {variant.id}: --bare suppressed — "
             f"slash-command input needs skills loaded\n"
         )
-    t0 = time.monotonic()
 
-    try:
-        result = await spawner(cmd, runner_cfg.timeout_seconds)
-    except asyncio.TimeoutError:
-        return _write_obs(
-            Observation(
-                variant_id=variant.id,
-                exit_status="timeout",
-                wall_seconds=time.monotonic() - t0,
-            ),
-            out_dir,
-        )
-
-    # Auth-fallback retry: drop --bare and try again once.
-    if (
-        result.returncode != 0
-        and runner_cfg.bare
-        and runner_cfg.oauth_fallback
-        and _looks_like_auth_fail(result.stderr)
-    ):
-        sys.stderr.write(
-            f"[parallel-ab] variant {variant.id}: auth-like failure; "
-            f"retrying without --bare\n"
-        )
-        retry_cmd = [c for c in cmd if c != "--bare"]
+    attempt = 0
+    while True:
+        t0 = time.monotonic()
         try:
-            result = await spawner(retry_cmd, runner_cfg.timeout_seconds)
+            result, cmd = await _spawn(cmd, variant, runner_cfg, spawner)
         except asyncio.TimeoutError:
             return _write_obs(
                 Observation(
                     variant_id=variant.id,
                     exit_status="timeout",
                     wall_seconds=time.monotonic() - t0,
+                    scenario_id=scenario.id,
+                    rep=rep,
                 ),
                 out_dir,
             )
+        parsed = _parse_output(result.stdout)
+        if attempt >= runner_cfg.max_retries or not _looks_like_rate_limit(parsed):
+            break
+        attempt += 1
+        delay = _backoff_delay(runner_cfg.retry_backoff_seconds, attempt)
+        sys.stderr.write(
+            f"[parallel-ab] variant {variant.id}: rate limited; "
+            f"retry {attempt}/{runner_cfg.max_retries} in {delay:.1f}s\n"
+        )
+        await sleep(delay)
 
-    parsed = _parse_output(result.stdout)
     # claude -p can return rc=0 with `is_error: true` for API-level failures
     # (rate limit, overload) — treat those as error, not ok.
     ok = result.returncode == 0 and not parsed.is_error
@@ -186,10 +230,12 @@ async def run_variant(
         tool_calls=parsed.tool_calls,
         final_output_sha256=compute_sha256(parsed.text),
         axes=parsed.axes,
+        scenario_id=scenario.id,
+        rep=rep,
     )
     return _write_obs(obs, out_dir)
 
 
 def _write_obs(obs: Observation, out_dir: Path) -> Observation:
-    emit(obs, out_dir / f"obs-{obs.variant_id}.json")
+    emit(obs, out_dir / obs_filename(obs.variant_id, obs.scenario_id, obs.rep))
     return obs
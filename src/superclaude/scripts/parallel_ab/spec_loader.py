@@ -10,6 +10,8 @@ import yaml
 
 ALLOWED_RUNNER_CLI = {"claude -p"}
 DEFAULT_TIMEOUT_SECONDS = 60
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BACKOFF_SECONDS = 5.0
 
 
 class SpecError(ValueError):
@@ -20,6 +22,8 @@ class SpecError(ValueError):
 class Scenario:
     input: str
     baseline_skill: str | None = None
+    # "" for the single ``scenario:`` of a one-scenario spec.
+    id: str = ""
 
 
 @dataclass(frozen=True)
@@ -36,13 +40,24 @@ class RunnerCfg:
     timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS
     bare: bool = True
     oauth_fallback: bool = True
+    # Rate-limited runs are retried with exponential backoff from this base.
+    max_retries: int = DEFAULT_MAX_RETRIES
+    retry_backoff_seconds: float = DEFAULT_RETRY_BACKOFF_SECONDS
 
 
 @dataclass(frozen=True)
 class ABSpec:
-    scenario: Scenario
+    """Every variant runs ``repetitions`` times against every scenario."""
+
+    scenarios: tuple[Scenario, ...]
     variants: tuple[Variant, ...]
     runner: RunnerCfg
+    repetitions: int = 1
+
+    @property
+    def scenario(self) -> Scenario:
+        """The first scenario — the only one in a single-scenario spec."""
+        return self.scenarios[0]
 
 
 def _require(d: dict[str, Any], key: str, ctx: str) -> Any:
@@ -51,6 +66,43 @@ def _require(d: dict[str, Any], key: str, ctx: str) -> Any:
     return d[key]
 
 
+def _load_scenarios(raw: dict[str, Any]) -> tuple[Scenario, ...]:
+    """Either one ``scenario:`` mapping or a ``scenarios:`` list with ids."""
+    if "scenarios" not in raw:
+        scenario_raw = raw.get("scenario") or {}
+        if not isinstance(scenario_raw, dict):
+            raise SpecError("scenario must be a mapping")
+        return (
+            Scenario(
+                input=_require(scenario_raw, "input", "scenario"),
+                baseline_skill=scenario_raw.get("baseline_skill"),
+            ),
+        )
+
+    if "scenario" in raw:
+        raise SpecError("use either scenario or scenarios, not both")
+    scenarios_raw = raw["scenarios"]
+    if not isinstance(scenarios_raw, list) or not scenarios_raw:
+        raise SpecError("scenarios must be a non-empty list")
+    seen: set[str] = set()
+    scenarios: list[Scenario] = []
+    for idx, s in enumerate(scenarios_raw):
+        if not isinstance(s, dict):
+            raise SpecError(f"scenarios[{idx}] must be a mapping")
+        sid = str(_require(s, "id", f"scenarios[{idx}]"))
+        if sid in seen:
+            raise SpecError(f"duplicate scenario id: {sid!r}")
+        seen.add(sid)
+        scenarios.append(
+            Scenario(
+                input=_require(s, "input", f"scenarios[{idx}]"),
+                baseline_skill=s.get("baseline_skill"),
+                id=sid,
+            )
+        )
+    return tuple(scenarios)
+
+
 def load_spec(path: Path) -> ABSpec:
     """Load and validate a ``variants.yaml`` spec file.
 
@@ -60,13 +112,7 @@ def load_spec(path: Path) -> ABSpec:
     if not isinstance(raw, dict):
         raise SpecError("top-level YAML must be a mapping")
 
-    scenario_raw = raw.get("scenario") or {}
-    if not isinstance(scenario_raw, dict):
-        raise SpecError("scenario must be a mapping")
-    scenario = Scenario(
-        input=_require(scenario_raw, "input", "scenario"),
-        baseline_skill=scenario_raw.get("baseline_skill"),
-    )
+    scenarios = _load_scenarios(raw)
 
     variants_raw = raw.get("variants") or []
     if not isinstance(variants_raw, list) or not variants_raw:
@@ -102,6 +148,25 @@ def load_spec(path: Path) -> ABSpec:
         timeout_seconds=int(runner_raw.get("timeout_seconds", DEFAULT_TIMEOUT_SECONDS)),
         bare=bool(runner_raw.get("bare", True)),
         oauth_fallback=bool(runner_raw.get("oauth_fallback", True)),
+        max_retries=int(runner_raw.get("max_retries", DEFAULT_MAX_RETRIES)),
+        retry_backoff_seconds=float(
+            runner_raw.get("retry_backoff_seconds", DEFAULT_RETRY_BACKOFF_SECONDS)
+        ),
+    )
+    if runner.max_retries < 0:
+        raise SpecError("runner.max_retries must be >= 0")
+    if runner.retry_backoff_seconds < 0:
+        raise SpecError("runner.retry_backoff_seconds must be >= 0")
+
+    repetitions = raw.get("repetitions", 1)
+    if isinstance(repetitions, bool) or not isinstance(repetitions, int):
+        raise SpecError("repetitions must be an integer")
+    if repetitions < 1:
+        raise SpecError("repetitions must be >= 1")
+
+    return ABSpec(
+        scenarios=scenarios,
+        variants=tuple(variants),
+        runner=runner,
+        repetitions=repetitions,
     )
-
-    return ABSpec(scenario=scenario, variants=tuple(variants), runner=runner)
@@ -0,0 +1,128 @@
+"""Paired comparison of variants over a scenario × repetition grid.
+
+Runs of two variants in the same (scenario, rep) cell form a pair: same input,
+submitted side by side — the orchestrator starts runs repetition by repetition
+— so within a pair the runs differ by variant and noise, not by scenario or by
+drift in API latency. Each pair is a win for one side (an ok run against a
+failed one, or the faster of two ok runs) or a tie. The effect size is the
+dominance δ = (wins − losses) / pairs, from −1 to +1: Cliff's delta taken over
+pairs, reported with a percentile bootstrap interval over the pairs.
+
+Significance is not read off that interval: on a handful of ±1/0 outcomes the
+bootstrap is far too confident (4 wins and 2 ties give [+0.33, +1.00]). A lead
+is significant when an exact two-sided sign test on wins against losses, ties
+left out, gives p < ALPHA. That takes at least 6 decisive pairs — 6 wins out of
+6 gives p = 0.031, 5 out of 5 or 6 out of 7 do not. Pure Python: the harness
+depends on neither numpy nor scipy.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass
+from statistics import median
+from typing import Iterable
+
+from .observation import Observation
+
+CONFIDENCE = 0.95
+ALPHA = 0.05
+RESAMPLES = 2000
+SEED = 0  # the same observations always give the same decision
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """*leader* against *other*; positive values favour the leader."""
+
+    leader: str
+    other: str
+    pairs: int
+    dominance: float
+    ci_low: float
+    ci_high: float
+    # Median of other − leader wall seconds over pairs where both ran ok.
+    wall_delta: float | None = None
+    wins: int = 0
+    losses: int = 0
+
+    @property
+    def p_value(self) -> float:
+        """Exact two-sided sign test of wins against losses."""
+        return sign_test(self.wins, self.losses)
+
+    @property
+    def significant(self) -> bool:
+        return self.wins > self.losses and self.p_value < ALPHA
+
+
+def _cells(
+    obs_list: Iterable[Observation], variant_id: str
+) -> dict[tuple[str, int], Observation]:
+    return {(o.scenario_id, o.rep): o for o in obs_list if o.variant_id == variant_id}
+
+
+def outcome(a: Observation, b: Observation) -> int:
+    """+1 when *a* beats *b*, -1 when *b* beats *a*, 0 for a tie."""
+    a_ok, b_ok = a.exit_status == "ok", b.exit_status == "ok"
+    if a_ok != b_ok:
+        return 1 if a_ok else -1
+    if not a_ok or a.wall_seconds == b.wall_seconds:
+        return 0
+    return 1 if a.wall_seconds < b.wall_seconds else -1
+
+
+def sign_test(wins: int, losses: int) -> float:
+    """Two-sided exact binomial p-value for wins vs losses at even odds."""
+    n = wins + losses
+    if not n:
+        return 1.0
+    tail = sum(math.comb(n, k) for k in range(min(wins, losses) + 1))
+    return min(1.0, 2 * tail / 2**n)
+
+
+def bootstrap_interval(values: list[float], rng: random.Random) -> tuple[float, float]:
+    """Percentile bootstrap interval for the mean of *values*."""
+    n = len(values)
+    means = sorted(sum(rng.choices(values, k=n)) / n for _ in range(RESAMPLES))
+    tail = (1 - CONFIDENCE) / 2
+    return (
+        means[round(tail * (RESAMPLES - 1))],
+        means[round((1 - tail) * (RESAMPLES - 1))],
+    )
+
+
+def compare(
+    obs_list: list[Observation], leader: str, other: str, rng: random.Random
+) -> Comparison:
+    """Paired dominance of *leader* over *other* with its bootstrap interval."""
+    a, b = _cells(obs_list, leader), _cells(obs_list, other)
+    keys = sorted(a.keys() & b.keys())
+    if not keys:
+        return Comparison(leader, other, 0, 0.0, -1.0, 1.0)
+    outcomes = [outcome(a[k], b[k]) for k in keys]
+    low, high = bootstrap_interval(outcomes, rng)
+    deltas = [
+        b[k].wall_seconds - a[k].wall_seconds
+        for k in keys
+        if a[k].exit_status == "ok" and b[k].exit_status == "ok"
+    ]
+    return Comparison(
+        leader=leader,
+        other=other,
+        pairs=len(keys),
+        dominance=sum(outcomes) / len(keys),
+        ci_low=low,
+        ci_high=high,
+        wall_delta=median(deltas) if deltas else None,
+        wins=outcomes.count(1),
+        losses=outcomes.count(-1),
+    )
+
+
+def rank(obs_list: list[Observation], leader: str) -> list[Comparison]:
+    """*leader* compared with every other variant, by variant id."""
+    rng = random.Random(SEED)
+    others = sorted({o.variant_id for o in obs_list} - {leader})
+    return [compare(obs_list, leader, other, rng) for other in others]
@@ -0,0 +1,144 @@
+"""Cached listings of Claude Code's ~/.claude/projects directories.
+
+memory_staleness reads and regex-parses every memory ``*.md`` of a project on
+SessionStart, though memories rarely change between sessions. The listing
+saves the reads, not the stats: every file is still stat'ed to notice edits.
+Where a caller needs nothing but stats — the insight harvest's newest-transcript
+fallback — a plain scan is cheaper than loading and rewriting a sidecar, so it
+does not use this module.
+
+``listing()`` keeps, per directory, a sidecar in hook state with each matching
+file's name, mtime, size and whatever its ``parse`` callback extracted. A
+directory's own mtime changes whenever an entry is created, removed or renamed,
+so while it matches the sidecar the set of names is known without listing
+anything. Contents are another matter — appending to a transcript or editing a
+memory in place leaves the directory untouched — so a cached listing re-stats
+its files: all of them by default, or only the ``recheck`` newest where a
+caller can live with stale mtimes on the rest. A file whose mtime and size are
+unchanged keeps its parsed fields without being read.
+
+Like git's racy-index check, a directory modified within the last two seconds
+is not trusted: a file created later in the same timestamp tick would not move
+its mtime. Such a listing is saved but rescanned on the next call.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable
+
+from superclaude.utils import atomic_write_json, hook_state_dir
+
+INDEX_VERSION = 1
+
+# A directory mtime this recent (ns) may still be shared by a later change.
+_RACY_NS = 2_000_000_000
+
+
+def _sidecar(directory: Path, suffix: str) -> Path:
+    key = hashlib.sha256(f"{directory}\0{suffix}".encode("utf-8")).hexdigest()[:16]
+    return hook_state_dir() / f"projects_index_{key}.json"
+
+
+def _load(sidecar: Path) -> dict | None:
+    try:
+        data = json.loads(sidecar.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return None
+    return data
+
+
+def _entry(path: Path, stat: os.stat_result, parse) -> dict:
+    entry = {"mtime": stat.st_mtime_ns, "size": stat.st_size}
+    if parse is not None:
+        entry.update(parse(path))
+    return entry
+
+
+def _unchanged(entry: dict, stat: os.stat_result) -> bool:
+    return entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size
+
+
+def listing(
+    directory: Path,
+    suffix: str,
+    *,
+    parse: Callable[[Path], dict] | None = None,
+    recheck: int | None = None,
+) -> dict[str, dict]:
+    """The files in directory ending with suffix, from the sidecar when valid.
+
+    Args:
+        directory: Directory to list (not recursive; dotfiles skipped)
+        suffix: Filename suffix to keep, e.g. ".jsonl"
+        parse: Extra JSON-able fields per file, called only when it changed
+        recheck: How many of the newest cached files to re-stat; None for all
+
+    Returns:
+        {name: {"mtime": ns, "size": bytes, **parse(path)}}; {} if no directory
+    """
+    directory = Path(directory)
+    try:
+        dir_mtime = directory.stat().st_mtime_ns
+    except OSError:
+        return {}
+    sidecar = _sidecar(directory, suffix)
+    cached = _load(sidecar)
+    changed = False
+
+    if cached and cached["dir_mtime"] == dir_mtime:
+        entries = cached["entries"]
+        names = sorted(entries, key=lambda n: entries[n]["mtime"], reverse=True)
+        for name in names if recheck is None else names[:recheck]:
+            path = directory / name
+            try:
+                stat = path.stat()
+            except OSError:
+                del entries[name]
+                changed = True
+                continue
+            if not _unchanged(entries[name], stat):
+                entries[name] = _entry(path, stat, parse)
+                changed = True
+    else:
+        previous = cached["entries"] if cached else {}
+        entries = {}
+        with os.scandir(directory) as it:
+            for child in it:
+                name = child.name
+                if name.startswith(".") or not name.endswith(suffix):
+                    continue
+                try:
+                    if not child.is_file():
+                        continue
+                    stat = child.stat()
+                except OSError:
+                    continue
+                old = previous.get(name)
+                if old is not None and _unchanged(old, stat):
+                    entries[name] = old
+                else:
+                    entries[name] = _entry(Path(child.path), stat, parse)
+        changed = True
+
+    if changed:
+        racy = time.time_ns() - dir_mtime < _RACY_NS
+        try:
+            atomic_write_json(
+                sidecar,
+                {
+                    "version": INDEX_VERSION,
+                    "dir_mtime": None if racy else dir_mtime,
+                    "entries": entries,
+                },
+                indent=None,
+            )
+        except OSError:
+            pass  # the next call lists the directory again
+    return entries
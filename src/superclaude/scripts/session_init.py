@@ -11,6 +11,10 @@ v2.1.0 Features:
 v2.2.0 Features (Claude Code 2.1.20 Integration):
 - PR review status indicator display
 - Multi-directory CLAUDE.md awareness
+
+The probes run concurrently, each with its own deadline (see PROBES): they
+used to run one after another, so startup waited for their sum and a slow
+`gh pr view` alone could use up the hook's 10s budget.
 """
 
 from __future__ import annotations
@@ -18,6 +22,8 @@ from __future__ import annotations
 import json
 import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
 
 
@@ -32,10 +38,7 @@ def get_install_status() -> str:
     Returns:
         A single status line, never empty
     """
-    try:
-        from superclaude.utils import claude_base
-    except ImportError:
-        return "⚠️ SuperClaude: install status unavailable"
+    from superclaude.utils import claude_base
 
     base = claude_base()
     scope = "user" if base == Path.home() / ".claude" else "project"
@@ -60,71 +63,91 @@ def get_install_status() -> str:
     return f"🛠️ SuperClaude: {commands} commands, {agents} {agent_word} ({scope} scope)"
 
 
-def init_hook_tracker() -> str | None:
+def init_hook_tracker() -> str:
     """Initialize hook tracker and cleanup old sessions.
 
     Returns:
-        Session ID or None if tracker unavailable
+        Session ID
     """
-    try:
-        from superclaude.hooks.hook_tracker import (
-            cleanup_old_sessions,
-            get_session_id,
-        )
+    from superclaude.hooks.hook_tracker import cleanup_old_sessions, get_session_id
 
-        # Cleanup old sessions (>24h)
-        cleaned = cleanup_old_sessions()
-        if cleaned > 0:
-            print(f"🧹 Cleaned {cleaned} old hook session(s)", file=sys.stderr)
+    # Cleanup old sessions (>24h)
+    cleaned = cleanup_old_sessions()
+    if cleaned > 0:
+        print(f"🧹 Cleaned {cleaned} old hook session(s)", file=sys.stderr)
 
-        # Get/create current session
-        session_id = get_session_id()
-        return session_id
-    except ImportError:
-        return None
+    # Get/create current session
+    return get_session_id()
 
 
 def get_git_status() -> str:
-    """Check git status and return formatted string."""
+    """Check git status and return formatted string.
+
+    The status comes from tree_status, shared with insight_writer's session
+    baseline — the other SessionStart hook — so the event runs git once.
+    """
+    from superclaude.scripts import tree_status
+    from superclaude.utils import project_root
+
+    snapshot = tree_status.status(project_root(), share_as="SessionStart")
+    if snapshot is None:
+        return "📊 Git: not a repo"
+    if not snapshot.lines:
+        return "📊 Git: clean"
+    return f"📊 Git: {len(snapshot.lines)} files"
+
+
+# How long a cached PR status line is shown before a refresh is started.
+PR_STATUS_TTL_SECONDS = 300
+
+# A refresh started this recently is still running (or died): do not start
+# another. Longer than gh's own timeout.
+PR_REFRESH_GRACE_SECONDS = 60
+
+# Branches remembered per project, most recently refreshed first.
+PR_CACHE_MAX_BRANCHES = 32
+
+
+def _current_branch() -> str:
+    """The checked-out branch, or "" when detached or not in a repository."""
     try:
         result = subprocess.run(
-            ["git", "status", "--porcelain"],
+            ["git", "branch", "--show-current"],
             capture_output=True,
             text=True,
             timeout=5,
         )
-        if result.returncode == 0:
-            status = result.stdout.strip()
-            if not status:
-                return "📊 Git: clean"
-            count = len([line for line in status.split("\n") if line])
-            return f"📊 Git: {count} files"
-        return "📊 Git: not a repo"
-    except (subprocess.TimeoutExpired, subprocess.CalledProcessError, OSError):
-        return "📊 Git: not a repo"
+    except (subprocess.SubprocessError, OSError):
+        return ""
+    return result.stdout.strip() if result.returncode == 0 else ""
 
 
-def get_pr_status() -> str:
+def _pr_cache_file() -> Path:
+    from superclaude.utils import hook_state_dir, project_key
+
+    return hook_state_dir() / f"pr_status_{project_key()}.json"
+
+
+def _read_pr_cache() -> dict:
+    try:
+        cache = json.loads(_pr_cache_file().read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def query_pr_status(branch: str | None = None) -> str:
     """
-    Get PR review status for current branch.
+    Ask GitHub for the PR review status of a branch (default: the current one).
 
-    Integrates with Claude Code 2.1.20's PR status indicator feature.
+    Blocks on `gh pr view`; SessionStart reads the cache get_pr_status() keeps
+    instead, and only the detached refresh calls this.
 
     Returns:
         Formatted PR status string with colored indicator
     """
     try:
-        # Get current branch
-        branch_result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if branch_result.returncode != 0:
-            return ""
-
-        current_branch = branch_result.stdout.strip()
+        current_branch = _current_branch() if branch is None else branch
         if not current_branch or current_branch in ("main", "master"):
             return ""
 
@@ -175,6 +198,84 @@ def get_pr_status() -> str:
         return ""
 
 
+def refresh_pr_status() -> None:
+    """Query the current branch's PR status and store it for the next session."""
+    from superclaude.utils import atomic_write_json
+
+    try:
+        branch = _current_branch()
+        if not branch or branch in ("main", "master"):
+            return
+        line = query_pr_status(branch)
+        cache = _read_pr_cache()
+        cache[branch] = {"line": line, "at": time.time()}
+        recent = sorted(cache.items(), key=lambda kv: -kv[1].get("at", 0))
+        atomic_write_json(_pr_cache_file(), dict(recent[:PR_CACHE_MAX_BRANCHES]))
+    except (OSError, AttributeError, TypeError):
+        pass
+    finally:
+        try:
+            _pr_cache_file().with_suffix(".refreshing").unlink()
+        except OSError:
+            pass
+
+
+def _start_pr_refresh() -> None:
+    """Run refresh_pr_status() in a detached process, unless one is running."""
+    marker = _pr_cache_file().with_suffix(".refreshing")
+    try:
+        if time.time() - marker.stat().st_mtime < PR_REFRESH_GRACE_SECONDS:
+            return
+    except OSError:
+        pass
+    try:
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+        if sys.platform == "win32":
+            detach = {
+                "creationflags": subprocess.DETACHED_PROCESS
+                | subprocess.CREATE_NEW_PROCESS_GROUP
+            }
+        else:
+            detach = {"start_new_session": True}
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "--refresh-pr"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            **detach,
+        )
+    except OSError:
+        pass
+
+
+def get_pr_status() -> str:
+    """
+    Get PR review status for current branch.
+
+    Integrates with Claude Code 2.1.20's PR status indicator feature. Answered
+    from a per-branch cache in hook state, never from GitHub: a `gh pr view`
+    round trip on every startup put the API's latency on the session's. A
+    missing or older-than-PR_STATUS_TTL_SECONDS entry starts a detached refresh,
+    which the next session start reads — so a branch's first session shows no
+    PR line, and every later one shows a status at most one refresh old.
+
+    Returns:
+        Formatted PR status string with colored indicator
+    """
+    branch = _current_branch()
+    if not branch or branch in ("main", "master"):
+        return ""
+    entry = _read_pr_cache().get(branch)
+    if not isinstance(entry, dict):
+        entry = {}
+    at = entry.get("at")
+    if not isinstance(at, (int, float)) or time.time() - at > PR_STATUS_TTL_SECONDS:
+        _start_pr_refresh()
+    line = entry.get("line")
+    return line if isinstance(line, str) else ""
+
+
 def get_additional_dirs_status() -> str:
     """
     Check for additional CLAUDE.md directories (monorepo support).
@@ -204,35 +305,77 @@ def get_additional_dirs_status() -> str:
     return ""
 
 
-def main() -> None:
-    # The context cache reset belongs to context_reset.py, the other SessionStart
-    # hook: it reads the session id off stdin, and this one does not. Calling it
-    # from here passed no id, so it deleted the project-only fallback cache that
-    # a concurrent session without an id is using.
-
-    # 1. Initialize hook tracker (cleanup old sessions)
+def _hook_tracker_probe() -> str:
+    """init_hook_tracker as a probe: it reports on stderr, not in the banner."""
     init_hook_tracker()
+    return ""
 
-    # 2. Check git status
-    print(get_git_status())
 
-    # 3. Check PR status (Claude Code 2.1.20+)
-    pr_status = get_pr_status()
-    if pr_status:
-        print(pr_status)
+def _budget_reminder() -> str:
+    return "💡 Use /context to confirm token budget."
 
-    # 4. Check for additional directories (monorepo)
-    additional_dirs = get_additional_dirs_status()
-    if additional_dirs:
-        print(additional_dirs)
 
-    # 5. Remind token budget
-    print("💡 Use /context to confirm token budget.")
+# Probes in output order: (label, function name, deadline in seconds from the
+# start of the hook). Named rather than referenced so the module attribute is
+# what runs. The longest deadline bounds the hook well inside its 10s timeout.
+PROBES = (
+    ("hook cleanup", "_hook_tracker_probe", 3.0),
+    ("git status", "get_git_status", 6.0),
+    ("PR status", "get_pr_status", 4.0),
+    ("multi-dir scan", "get_additional_dirs_status", 2.0),
+    ("budget reminder", "_budget_reminder", 2.0),
+    ("install status", "get_install_status", 2.0),
+)
+
+# Result of a probe that missed its deadline.
+SKIPPED = object()
+
+
+def run_probes(probes) -> list:
+    """Run every probe at once; results in probe order, SKIPPED when late.
+
+    Daemon threads rather than an executor: a probe stuck past its deadline
+    must not hold the interpreter open at exit, and an executor joins its
+    workers. A probe that raises yields "" — the banner fails open per line.
+    """
+    start = time.monotonic()
+    results: list = [SKIPPED] * len(probes)
+    threads = []
+    for i, (_label, name, _deadline) in enumerate(probes):
+        probe = globals()[name]
 
-    # 6. What is actually installed
-    print(get_install_status())
+        def run(i=i, probe=probe) -> None:
+            try:
+                results[i] = probe()
+            except Exception:
+                results[i] = ""
+
+        thread = threading.Thread(target=run, name=f"probe-{name}", daemon=True)
+        thread.start()
+        threads.append(thread)
+
+    done = []
+    for (_label, _name, deadline), thread in zip(probes, threads):
+        thread.join(max(0.0, start + deadline - time.monotonic()))
+        done.append(not thread.is_alive())
+    return [result if ok else SKIPPED for result, ok in zip(results, done)]
+
+
+def main() -> None:
+    # The context cache reset belongs to context_reset.py, the other SessionStart
+    # hook: it reads the session id off stdin, and this one does not. Calling it
+    # from here passed no id, so it deleted the project-only fallback cache that
+    # a concurrent session without an id is using.
+    for (label, _name, deadline), result in zip(PROBES, run_probes(PROBES)):
+        if result is SKIPPED:
+            print(f"⏭️ {label}: skipped (no answer within {deadline:g}s)")
+        elif result:
+            print(result)
 
 
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:] == ["--refresh-pr"]:
+        refresh_pr_status()
+    else:
+        main()
     sys.exit(0)
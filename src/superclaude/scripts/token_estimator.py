@@ -2,18 +2,167 @@
 
 Provides token estimation for skills, commands, and agents.
 Supports frontmatter-only estimation for accurate /context display.
+
+Counting is pluggable. The default is the chars/4 heuristic, which costs
+nothing and is close on English prose but off by about 2x on emoji- and
+symbol-heavy files such as BUSINESS_SYMBOLS.md. Setting
+``SUPERCLAUDE_TOKENIZER=tiktoken`` counts with a local BPE encoding instead,
+when tiktoken is installed; BPE counts are cached on disk by content hash, so an
+unchanged file is tokenised once, not once per report or hook run.
 """
 
 from __future__ import annotations
 
+import atexit
+import hashlib
+import json
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Protocol
+
+from superclaude.utils import atomic_write_json, hook_state_dir
 
 # Token estimation ratio (characters per token)
 CHARS_PER_TOKEN = 4
 
+# Backend selection: "heuristic" (default) or "tiktoken". Opt-in rather than
+# "whenever tiktoken imports": the heuristic is what every budget was tuned
+# against, and loading an encoding costs a hook more than counting saves.
+TOKENIZER_ENV = "SUPERCLAUDE_TOKENIZER"
+
+# Encoding compare_token_usage.py has always measured with.
+TIKTOKEN_ENCODING = "cl100k_base"
+
+TOKEN_CACHE_NAME = "token_counts.json"
+
+# Entries kept on disk. Counts are keyed by content, so an edited file leaves
+# its old count behind; the oldest entries go first.
+MAX_CACHED_COUNTS = 4096
+
+
+class Tokenizer(Protocol):
+    """What estimate_tokens needs from a backend."""
+
+    # Part of the cache key: counts from two backends never mix.
+    name: str
+    # Whether counts are worth caching. Hashing the text costs more than the
+    # heuristic's len() does.
+    cached: bool
+
+    def count(self, text: str) -> int: ...
+
+
+class HeuristicTokenizer:
+    """len(text) // CHARS_PER_TOKEN."""
+
+    name = "chars/4"
+    cached = False
+
+    def count(self, text: str) -> int:
+        return len(text) // CHARS_PER_TOKEN
+
+
+class TiktokenTokenizer:
+    """Local BPE counts via tiktoken.
+
+    Raises:
+        ImportError: tiktoken is not installed
+    """
+
+    cached = True
+
+    def __init__(self, encoding: str = TIKTOKEN_ENCODING) -> None:
+        import tiktoken
+
+        self._encoding = tiktoken.get_encoding(encoding)
+        self.name = f"tiktoken/{encoding}"
+
+    def count(self, text: str) -> int:
+        # Content files quote special-token strings like <|endoftext|> in
+        # prose; they are text here, not control tokens.
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+_BACKENDS = {"heuristic": HeuristicTokenizer, "tiktoken": TiktokenTokenizer}
+_tokenizers: dict[str, Tokenizer] = {}
+
+
+def get_tokenizer() -> Tokenizer:
+    """The backend $SUPERCLAUDE_TOKENIZER names, or the heuristic.
+
+    An unknown name, a missing tiktoken or an encoding that cannot be loaded
+    (tiktoken fetches it on first use) all fall back to the heuristic — a token
+    estimate is never worth failing a hook over.
+    """
+    choice = os.environ.get(TOKENIZER_ENV, "heuristic").strip().lower()
+    if choice not in _tokenizers:
+        try:
+            _tokenizers[choice] = _BACKENDS.get(choice, HeuristicTokenizer)()
+        except Exception:
+            _tokenizers[choice] = HeuristicTokenizer()
+    return _tokenizers[choice]
+
+
+class TokenCountCache:
+    """On-disk counts keyed by (backend, content hash).
+
+    Read once on first use and written back by flush(). Two processes flushing
+    at once lose one side's new entries, which only means counting them again.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._counts: dict[str, int] | None = None
+        self._dirty = False
+
+    def _load(self) -> dict[str, int]:
+        if self._counts is None:
+            self._counts = {}
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if isinstance(data, dict):
+                    self._counts = {k: v for k, v in data.items() if isinstance(v, int)}
+            except (OSError, ValueError):
+                pass
+        return self._counts
+
+    def get(self, key: str) -> int | None:
+        return self._load().get(key)
+
+    def put(self, key: str, count: int) -> None:
+        self._load()[key] = count
+        self._dirty = True
+
+    def flush(self) -> None:
+        if not self._dirty or self._counts is None:
+            return
+        counts = self._counts
+        if len(counts) > MAX_CACHED_COUNTS:
+            counts = dict(list(counts.items())[-MAX_CACHED_COUNTS:])
+            self._counts = counts
+        try:
+            atomic_write_json(self.path, counts, indent=0)
+        except OSError:
+            return
+        self._dirty = False
+
+
+_count_cache: TokenCountCache | None = None
+
+
+def token_count_cache() -> TokenCountCache:
+    """The cache for the active install, created on first use."""
+    global _count_cache
+    path = hook_state_dir() / TOKEN_CACHE_NAME
+    if _count_cache is None or _count_cache.path != path:
+        if _count_cache is not None:
+            _count_cache.flush()
+        _count_cache = TokenCountCache(path)
+        atexit.register(_count_cache.flush)
+    return _count_cache
+
 
 @dataclass
 class TokenEstimate:
@@ -41,7 +190,18 @@ def estimate_tokens(content: str) -> int:
     Returns:
         Estimated token count
     """
-    return len(content) // CHARS_PER_TOKEN
+    tokenizer = get_tokenizer()
+    if not tokenizer.cached:
+        return tokenizer.count(content)
+
+    digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+    key = f"{tokenizer.name}:{digest}"
+    cache = token_count_cache()
+    count = cache.get(key)
+    if count is None:
+        count = tokenizer.count(content)
+        cache.put(key, count)
+    return count
 
 
 def extract_frontmatter(content: str) -> str:
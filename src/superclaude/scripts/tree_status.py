@@ -0,0 +1,232 @@
+"""One ``git status`` per hook event, shared by every hook that needs it.
+
+SessionStart ran ``git status --porcelain`` in session_init and
+``git status --porcelain -uall`` again in insight_writer's session baseline, and
+the Stop gate ran the ``-uall`` form twice when no baseline had been recorded.
+On a large monorepo each run is seconds of a 5-10s hook budget.
+
+``status(root)`` is the one place that runs git status; each hook calls it
+once per event and passes the result around. Hooks of the same event that run
+in separate processes name the event in ``share_as`` and share one result
+through a small cache in hook state, keyed by HEAD and the index's mtime and
+size — read straight from .git, no subprocess. A shared result is reused only
+for ``STATUS_TTL_SECONDS``: editing a file moves neither HEAD nor the index, so
+the key says nothing about the working tree and only a short age bound, within
+one named event, makes reuse safe. Claude Code starts the hooks of an event in
+parallel, so the first one takes a lock and runs git; the others wait briefly
+for its result instead of running their own. The wait comes out of the git
+timeout, so a call never takes longer than one git run could: SessionStart's
+insight_writer hook has 5s in all.
+
+git itself uses ``core.fsmonitor`` and ``core.untrackedCache`` when the
+repository enables them — ``git config core.untrackedCache true`` (and, where
+git ships the builtin daemon, ``git config core.fsmonitor true``) is the way
+to make the one call fast too. They are left to the user's config rather than
+forced with ``-c``: both write state into the repository.
+
+Lines are ``--porcelain -uall``: without ``-uall`` git collapses an untracked
+directory to one line, and insight_writer has to see the paths inside it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from superclaude.utils import atomic_write_json, hook_state_dir
+
+# How long one event's status may be reused by the other hooks of that event.
+# They start together, so this only has to cover interpreter start-up.
+STATUS_TTL_SECONDS = 2.0
+
+GIT_TIMEOUT_SECONDS = 5
+
+# How long a hook waits for another one's git status before running its own,
+# with what is left of GIT_TIMEOUT_SECONDS.
+LOCK_WAIT_SECONDS = 1.0
+_POLL_SECONDS = 0.05
+
+
+@dataclass(frozen=True)
+class TreeStatus:
+    """``git status --porcelain -uall`` of one worktree."""
+
+    head: str
+    lines: tuple[str, ...]
+
+
+def _git_dir(root: Path) -> Path | None:
+    """The .git directory for root, following a worktree's ``gitdir:`` file."""
+    for directory in (root, *root.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            try:
+                text = dot_git.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if not text.startswith("gitdir:"):
+                return None
+            return (directory / text[len("gitdir:") :].strip()).resolve()
+    return None
+
+
+def _read(path: Path) -> str | None:
+    try:
+        return path.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+
+def _head(git_dir: Path) -> str:
+    """HEAD's commit id, or the symbolic ref when it cannot be resolved here."""
+    head = _read(git_dir / "HEAD") or ""
+    if not head.startswith("ref:"):
+        return head
+    ref = head[len("ref:") :].strip()
+    common = _read(git_dir / "commondir")
+    common_dir = (git_dir / common).resolve() if common else git_dir
+    for base in (git_dir, common_dir):
+        oid = _read(base / ref)
+        if oid:
+            return oid
+    packed = _read(common_dir / "packed-refs") or ""
+    for line in packed.splitlines():
+        oid, _, name = line.partition(" ")
+        if name == ref:
+            return oid
+    return head
+
+
+def _key(git_dir: Path) -> dict:
+    try:
+        index = (git_dir / "index").stat()
+        index_key = [index.st_mtime_ns, index.st_size]
+    except OSError:
+        index_key = None
+    return {"head": _head(git_dir), "index": index_key}
+
+
+def _cache_file(root: Path, share_as: str) -> Path:
+    digest = hashlib.sha256(f"{root}\0{share_as}".encode("utf-8")).hexdigest()[:16]
+    return hook_state_dir() / f"tree_status_{digest}.json"
+
+
+def _cached(cache: Path, git_dir: Path) -> TreeStatus | None:
+    try:
+        data = json.loads(cache.read_text(encoding="utf-8"))
+        if data["key"] != _key(git_dir):
+            return None
+        if not 0 <= time.time() - data["at"] < STATUS_TTL_SECONDS:
+            return None
+        return TreeStatus(head=data["key"]["head"], lines=tuple(data["lines"]))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _run_git(
+    root: Path, timeout: float = GIT_TIMEOUT_SECONDS
+) -> tuple[str, ...] | None:
+    try:
+        result = subprocess.run(
+            ["git", "status", "--porcelain", "-uall"],
+            cwd=str(root),
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return tuple(line for line in result.stdout.splitlines() if line)
+
+
+def _lock(cache: Path) -> int | None:
+    """An exclusive lock fd, or None when another hook holds a live lock."""
+    lock = cache.with_suffix(".lock")
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        return os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        try:
+            if time.time() - lock.stat().st_mtime > GIT_TIMEOUT_SECONDS * 2:
+                lock.unlink()  # its owner died; the next caller takes over
+        except OSError:
+            pass
+        return None
+    except OSError:
+        return -1  # cannot lock at all: run git without sharing
+
+
+def _shared(root: Path, git_dir: Path, share_as: str) -> TreeStatus | None:
+    cache = _cache_file(root, share_as)
+    hit = _cached(cache, git_dir)
+    if hit is not None:
+        return hit
+
+    fd = _lock(cache)
+    timeout = GIT_TIMEOUT_SECONDS
+    if fd is None:
+        start = time.monotonic()
+        while time.monotonic() - start < LOCK_WAIT_SECONDS:
+            time.sleep(_POLL_SECONDS)
+            hit = _cached(cache, git_dir)
+            if hit is not None:
+                return hit
+            if not cache.with_suffix(".lock").exists():
+                break
+        timeout -= time.monotonic() - start
+    try:
+        lines = _run_git(root, timeout)
+        if lines is None:
+            return None
+        # Keyed after the run: git status refreshes the index it just read.
+        key = _key(git_dir)
+        try:
+            atomic_write_json(
+                cache, {"key": key, "at": time.time(), "lines": list(lines)}
+            )
+        except OSError:
+            pass
+        return TreeStatus(head=key["head"], lines=lines)
+    finally:
+        if fd is not None and fd >= 0:
+            os.close(fd)
+            try:
+                cache.with_suffix(".lock").unlink()
+            except OSError:
+                pass
+
+
+def status(root: Path, share_as: str | None = None) -> TreeStatus | None:
+    """The working tree's status, or None when git cannot answer.
+
+    None covers no repository, no git on PATH and a timeout alike.
+
+    Args:
+        root: Any directory inside the worktree
+        share_as: Event name (e.g. "SessionStart") under which concurrent
+            hooks share one git run; None always runs git
+    """
+    root = Path(root).resolve()
+    git_dir = _git_dir(root)
+    if git_dir is None:
+        return None
+    if share_as:
+        return _shared(root, git_dir, share_as)
+    lines = _run_git(root)
+    if lines is None:
+        return None
+    return TreeStatus(head=_head(git_dir), lines=lines)
+
+
+def fingerprint(lines) -> str:
+    """A stable digest of status lines, independent of their order."""
+    return hashlib.sha256("\n".join(sorted(lines)).encode("utf-8")).hexdigest()
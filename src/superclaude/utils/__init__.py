@@ -17,6 +17,7 @@ import hashlib
 import json
 import os
 import re
+import shutil
 import tempfile
 import time
 from pathlib import Path
@@ -34,12 +35,22 @@ def atomic_write_json(path: Path, data: Any, indent: int = 2) -> None:
         data: JSON-serializable data
         indent: JSON indentation level
     """
+    atomic_write_text(path, json.dumps(data, indent=indent))
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """Write text atomically using temp file + os.replace.
+
+    Args:
+        path: Target file path
+        text: Content, written as UTF-8
+    """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
     try:
-        with os.fdopen(fd, "w") as f:
-            json.dump(data, f, indent=indent)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
         os.replace(tmp_path, path)
     except BaseException:
         try:
@@ -123,6 +134,13 @@ _PRUNABLE_PREFIXES = (
     "insight_prompt_",
     "insight_baseline_",
     "insight_answered_",
+    "token_counts",  # token_estimator's count cache
+    "insight_cursors_",  # harvest resume offsets; losing one costs a rescan
+    "insight_index_",  # insight_index sidecar, rebuilt from insights.jsonl
+    "insight_store_",  # insight_store SQLite mirror, rebuilt the same way
+    "projects_index_",  # cached ~/.claude/projects listings, relisted on demand
+    "tree_status_",  # one event's shared git status; stale after seconds anyway
+    "pr_status_",  # session_init's per-branch PR line, refreshed in the background
 )
 
 # The fallback ledger is pruned entry by entry, not deleted: one live session's
@@ -144,7 +162,8 @@ def prune_hook_state(max_age_days: float = STATE_MAX_AGE_DAYS) -> int:
     loop_guard already prunes entries *inside* its file; nothing pruned the files
     themselves, so one accumulated per project key and per test run — 50 of them
     in a real user-scope directory, the oldest naming a project that no longer
-    exists.
+    exists. A state *directory* (loop_guard keeps one log per signature) goes
+    as a whole once nothing in it has been touched either.
 
     Args:
         max_age_days: Age past which an untouched state file is collected
@@ -166,6 +185,13 @@ def prune_hook_state(max_age_days: float = STATE_MAX_AGE_DAYS) -> int:
         if not path.name.startswith(_PRUNABLE_PREFIXES):
             continue
         try:
+            if path.is_dir():
+                members = [path, *path.iterdir()]
+                if max(p.stat().st_mtime for p in members) >= cutoff:
+                    continue
+                shutil.rmtree(path)
+                removed += 1
+                continue
             if not path.is_file() or path.stat().st_mtime >= cutoff:
                 continue
             path.unlink()
@@ -283,6 +309,29 @@ def context_cache_file(session_id: str | None = None) -> Path:
     return hook_state_dir() / f"claude_context_{project_key()}{suffix}.txt"
 
 
+# AF_UNIX paths are capped at 104 bytes on macOS and 108 on Linux. A project
+# scope install several directories deep overruns that, so the socket moves to
+# the temp directory rather than failing to bind.
+_MAX_SOCKET_PATH = 100
+
+
+def hookd_socket_path() -> Path:
+    """Unix socket the hook daemon for the active project listens on.
+
+    Resolved identically by ``superclaude hookd`` and the hook client shim, so
+    both ends agree without a rendezvous file. One daemon per project: the
+    scripts it serves resolve content and state from ``project_root()``.
+
+    Returns:
+        <hook_state_dir>/hookd_<project_key>.sock, or a temp-dir path when that
+        would exceed the AF_UNIX length limit
+    """
+    path = hook_state_dir() / f"hookd_{project_key()}.sock"
+    if len(str(path)) <= _MAX_SOCKET_PATH:
+        return path
+    return Path(tempfile.gettempdir()) / f"superclaude_hookd_{project_key()}.sock"
+
+
 def project_key() -> str:
     """Stable short id for the active project, for per-project state filenames.
 
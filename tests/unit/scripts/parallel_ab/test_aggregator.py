@@ -154,3 +154,86 @@ def test_decision_paragraph_non_empty(tmp_path: Path):
     _write_obs(tmp_path / "obs-A.json", _ok_obs("A"))
     _, decision_path = aggregate(tmp_path)
     assert len(decision_path.read_text(encoding="utf-8").strip()) > 20
+
+
+def _grid_obs(
+    dst: Path, sid: str, vid: str, rep: int, wall: float, status: str = "ok"
+) -> None:
+    obs = _ok_obs(vid, wall=wall) if status == "ok" else _err_obs(vid)
+    obs.update(scenario_id=sid, rep=rep)
+    _write_obs(dst / f"obs-{sid}--{vid}--r{rep}.json", obs)
+
+
+def test_grid_matrix_has_per_scenario_and_pooled_sections(tmp_path: Path):
+    for sid in ("s1", "s2"):
+        for vid in ("A", "B"):
+            for rep in range(3):
+                _grid_obs(tmp_path, sid, vid, rep, wall=10.0 + rep)
+    matrix_path, _ = aggregate(tmp_path)
+    text = matrix_path.read_text(encoding="utf-8")
+    sections = text.split("## ")
+    assert [s.splitlines()[0] for s in sections[1:]] == [
+        "Scenario s1",
+        "Scenario s2",
+        "Pooled (2 scenarios)",
+    ]
+    # summary rows: per scenario 3 runs of each variant, pooled 6
+    assert "| A | 3/3 | 11.0 [10.0–12.0] |" in sections[1]
+    assert "| A | 6/6 | 11.0 [10.0–12.0] |" in sections[3]
+    # run rows carry the repetition
+    assert "| B | 2 | ok | 12.0 |" in sections[2]
+
+
+def test_grid_winner_uses_medians_not_one_fast_sample(tmp_path: Path):
+    # A has the single fastest run but is slower typically; B wins on median
+    for rep, (wall_a, wall_b) in enumerate([(1.0, 8.0), (20.0, 8.5), (21.0, 9.0)]):
+        _grid_obs(tmp_path, "s1", "A", rep, wall_a)
+        _grid_obs(tmp_path, "s1", "B", rep, wall_b)
+    _, decision_path = aggregate(tmp_path)
+    text = decision_path.read_text(encoding="utf-8")
+    assert "**B** (ok 3/3, median 8.5s" in text
+
+
+def test_grid_winner_prefers_higher_pass_rate(tmp_path: Path):
+    for rep in range(3):
+        _grid_obs(tmp_path, "s1", "A", rep, 2.0, "error" if rep else "ok")
+        _grid_obs(tmp_path, "s1", "B", rep, 9.0)
+    _, decision_path = aggregate(tmp_path)
+    text = decision_path.read_text(encoding="utf-8")
+    assert "**B** (ok 3/3" in text
+
+
+def test_grid_decision_names_per_scenario_winners(tmp_path: Path):
+    for rep in range(2):
+        _grid_obs(tmp_path, "s1", "A", rep, 5.0)
+        _grid_obs(tmp_path, "s1", "B", rep, 9.0)
+        _grid_obs(tmp_path, "s2", "A", rep, 9.0)
+        _grid_obs(tmp_path, "s2", "B", rep, 6.0)
+    _, decision_path = aggregate(tmp_path)
+    text = decision_path.read_text(encoding="utf-8")
+    assert "2 scenario(s) × 2 repetition(s)" in text
+    assert "s1 → A, s2 → B" in text
+
+
+def test_decision_says_no_significant_winner_on_weak_evidence(tmp_path: Path):
+    # a single sample each: B is faster, but one pair proves nothing
+    _write_obs(tmp_path / "obs-A.json", _ok_obs("A", wall=20.0))
+    _write_obs(tmp_path / "obs-B.json", _ok_obs("B", wall=5.0))
+    _, decision_path = aggregate(tmp_path)
+    text = decision_path.read_text(encoding="utf-8")
+    assert "No significant winner. Leading: **B**" in text
+    assert "Recommended winner" not in text
+    assert "| A | 1 | 1–0 | +1.00 [+1.00, +1.00] | +15.0 | 1.000 | — |" in text
+
+
+def test_decision_recommends_winner_with_consistent_lead(tmp_path: Path):
+    for sid in ("s1", "s2"):
+        for rep in range(4):
+            _grid_obs(tmp_path, sid, "A", rep, 10.0 + rep)
+            _grid_obs(tmp_path, sid, "B", rep, 12.0 + rep)
+            _grid_obs(tmp_path, sid, "C", rep, 11.0 + rep)
+    _, decision_path = aggregate(tmp_path)
+    text = decision_path.read_text(encoding="utf-8")
+    assert "Recommended winner: **A**" in text
+    assert "| B | 8 | 8–0 | +1.00 [+1.00, +1.00] | +2.0 | 0.008 | ✓ |" in text
+    assert "| C | 8 | 8–0 | +1.00 [+1.00, +1.00] | +1.0 | 0.008 | ✓ |" in text
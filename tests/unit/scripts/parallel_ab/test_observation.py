@@ -14,6 +14,7 @@ from superclaude.scripts.parallel_ab.observation import (
     ToolCall,
     compute_sha256,
     emit,
+    obs_filename,
     validate,
 )
 
@@ -132,3 +133,23 @@ def test_files_touched_default_empty_when_missing():
     del d["files_touched"]
     obs = validate(d)
     assert obs.files_touched == ()
+
+
+def test_grid_position_round_trips(tmp_path: Path):
+    obs = validate({**_sample_dict(), "scenario_id": "cache", "rep": 2})
+    assert (obs.scenario_id, obs.rep) == ("cache", 2)
+    out = tmp_path / "obs.json"
+    emit(obs, out)
+    assert validate(json.loads(out.read_text(encoding="utf-8"))) == obs
+
+
+def test_grid_position_defaults_when_missing():
+    obs = validate(_sample_dict())
+    assert (obs.scenario_id, obs.rep) == ("", 0)
+
+
+def test_obs_filename_names_only_set_parts():
+    assert obs_filename("A") == "obs-A.json"
+    assert obs_filename("A", "cache") == "obs-cache--A.json"
+    assert obs_filename("A", "cache", 2) == "obs-cache--A--r2.json"
+    assert obs_filename("A", "", 1) == "obs-A--r1.json"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import subprocess
 import sys
@@ -11,10 +12,14 @@ from typing import Any
 import pytest
 
 from superclaude.scripts.parallel_ab import orchestrator
-from superclaude.scripts.parallel_ab.observation import Observation, Tokens, emit
+from superclaude.scripts.parallel_ab.observation import (
+    Observation,
+    Tokens,
+    emit,
+    obs_filename,
+)
 from superclaude.scripts.parallel_ab.orchestrator import (
     DEFAULT_MAX_PARALLEL,
-    OrchestratorError,
     orchestrate,
 )
 from superclaude.scripts.parallel_ab.spec_loader import RunnerCfg, Scenario, Variant
@@ -47,6 +52,7 @@ def _make_fake_runner(behavior: dict[str, str] | None = None):
         scenario: Scenario,
         runner_cfg: RunnerCfg,
         out_dir: Path,
+        rep: int = 0,
         **_kwargs: Any,
     ) -> Observation:
         kind = behavior.get(variant.id, "ok")
@@ -57,8 +63,10 @@ def _make_fake_runner(behavior: dict[str, str] | None = None):
             exit_status="ok" if kind == "ok" else kind,
             wall_seconds=1.0,
             tokens=Tokens(input=100, output=200),
+            scenario_id=scenario.id,
+            rep=rep,
         )
-        emit(obs, Path(out_dir) / f"obs-{variant.id}.json")
+        emit(obs, Path(out_dir) / obs_filename(variant.id, scenario.id, rep))
         return obs
 
     return fake
@@ -78,11 +86,114 @@ async def test_orchestrate_emits_matrix_and_decision(tmp_path: Path):
 
 
 @pytest.mark.asyncio
-async def test_too_many_variants_raises(tmp_path: Path, monkeypatch):
+async def test_more_variants_than_max_parallel_all_run_bounded(
+    tmp_path: Path, monkeypatch
+):
     monkeypatch.setenv("AB_MAX_PARALLEL", "2")
     spec = _write_spec(tmp_path, n=5)
-    with pytest.raises(OrchestratorError, match="AB_MAX_PARALLEL"):
-        await orchestrate(spec, runner_fn=_make_fake_runner())
+    fake = _make_fake_runner()
+    in_flight = peak = 0
+
+    async def counting_runner(*args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        try:
+            return await fake(*args, **kwargs)
+        finally:
+            in_flight -= 1
+
+    decision = await orchestrate(spec, runner_fn=counting_runner)
+    assert len(list(decision.parent.glob("obs-*.json"))) == 5
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_progress_line_per_finished_variant(tmp_path: Path, capsys):
+    spec = _write_spec(tmp_path, n=3)
+    await orchestrate(spec, runner_fn=_make_fake_runner({"V1": "timeout"}))
+    progress = [
+        line
+        for line in capsys.readouterr().err.splitlines()
+        if line.startswith("[parallel-ab] ") and "/3 variant" in line
+    ]
+    assert [line.split()[1] for line in progress] == ["1/3", "2/3", "3/3"]
+    assert any("variant V1: timeout" in line for line in progress)
+
+
+def _write_grid_spec(tmp_path: Path, reps: int = 2) -> Path:
+    content = (
+        "scenarios:\n"
+        "  - id: s1\n"
+        "    input: /sc:brainstorm one\n"
+        "  - id: s2\n"
+        "    input: /sc:brainstorm two\n"
+        "variants:\n"
+        "  - id: V0\n"
+        "  - id: V1\n"
+        f"repetitions: {reps}\n"
+        "runner:\n"
+        '  cli: "claude -p"\n'
+        "  model: claude-haiku-4-5\n"
+    )
+    p = tmp_path / "variants.yaml"
+    p.write_text(content, encoding="utf-8")
+    return p
+
+
+@pytest.mark.asyncio
+async def test_grid_runs_every_scenario_variant_rep_on_one_pool(
+    tmp_path: Path, monkeypatch
+):
+    monkeypatch.setenv("AB_MAX_PARALLEL", "3")
+    spec = _write_grid_spec(tmp_path, reps=2)
+    fake = _make_fake_runner()
+    started: list[tuple[str, str, int]] = []
+    in_flight = peak = 0
+
+    async def counting_runner(variant, scenario, runner_cfg, out_dir, rep=0, **kw):
+        nonlocal in_flight, peak
+        started.append((scenario.id, variant.id, rep))
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        try:
+            return await fake(variant, scenario, runner_cfg, out_dir, rep=rep)
+        finally:
+            in_flight -= 1
+
+    decision = await orchestrate(spec, runner_fn=counting_runner)
+    keys = {
+        (o["scenario_id"], o["variant_id"], o.get("rep", 0))
+        for o in (
+            json.loads(p.read_text(encoding="utf-8"))
+            for p in decision.parent.glob("obs-*.json")
+        )
+    }
+    assert keys == {
+        (s, v, r) for s in ("s1", "s2") for v in ("V0", "V1") for r in (0, 1)
+    }
+    assert peak == 3
+    # every (scenario, variant) gets its first run before any gets a second
+    assert {r for _, _, r in started[:4]} == {0}
+    assert "## Pooled (2 scenarios)" in (decision.parent / "matrix.md").read_text(
+        encoding="utf-8"
+    )
+
+
+@pytest.mark.asyncio
+async def test_stale_observations_are_removed(tmp_path: Path):
+    spec = _write_spec(tmp_path, n=2)
+    emit(
+        Observation(variant_id="V0", exit_status="ok", rep=4),
+        tmp_path / obs_filename("V0", "", 4),
+    )
+    decision = await orchestrate(spec, runner_fn=_make_fake_runner())
+    assert sorted(p.name for p in decision.parent.glob("obs-*.json")) == [
+        "obs-V0.json",
+        "obs-V1.json",
+    ]
 
 
 @pytest.mark.asyncio
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
@@ -42,11 +43,13 @@ def _json_stdout(
     input_tokens: int = 1240,
     output_tokens: int = 3200,
     tools: list[dict] | None = None,
+    is_error: bool = False,
 ) -> bytes:
     payload = {
         "result": text,
         "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens},
         "tools_used": tools or [],
+        "is_error": is_error,
     }
     return json.dumps(payload).encode("utf-8")
 
@@ -158,6 +161,67 @@ async def test_timeout_produces_timeout_obs(tmp_path: Path):
     assert (tmp_path / "obs-A.json").exists()
 
 
+def _rate_limited() -> SpawnResult:
+    stdout = _json_stdout("API Error: 429 rate_limit_error", 0, 0, is_error=True)
+    return SpawnResult(stdout=stdout, stderr=b"", returncode=0)
+
+
+class _FakeSleep:
+    def __init__(self):
+        self.delays: list[float] = []
+
+    async def __call__(self, delay: float) -> None:
+        self.delays.append(delay)
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_result_is_retried_with_backoff(tmp_path: Path):
+    spawner = _FakeSpawner(
+        [
+            _rate_limited(),
+            _rate_limited(),
+            SpawnResult(stdout=_json_stdout(), stderr=b"", returncode=0),
+        ]
+    )
+    sleep = _FakeSleep()
+    cfg = replace(_cfg(), max_retries=3, retry_backoff_seconds=2.0)
+    obs = await run_variant(
+        _variant(), _scenario(), cfg, tmp_path, spawner=spawner, sleep=sleep
+    )
+    assert obs.exit_status == "ok"
+    assert obs.tokens.output == 3200
+    assert len(spawner.calls) == 3
+    assert len(sleep.delays) == 2
+    assert 2.0 <= sleep.delays[0] <= 3.0
+    assert 4.0 <= sleep.delays[1] <= 6.0
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_retries_are_bounded(tmp_path: Path):
+    spawner = _FakeSpawner([_rate_limited(), _rate_limited()])
+    sleep = _FakeSleep()
+    cfg = replace(_cfg(), max_retries=1)
+    obs = await run_variant(
+        _variant(), _scenario(), cfg, tmp_path, spawner=spawner, sleep=sleep
+    )
+    assert obs.exit_status == "error"
+    assert len(spawner.calls) == 2
+    assert len(sleep.delays) == 1
+
+
+@pytest.mark.asyncio
+async def test_other_is_error_results_are_not_retried(tmp_path: Path):
+    stdout = _json_stdout("Prompt is too long", 0, 0, is_error=True)
+    spawner = _FakeSpawner([SpawnResult(stdout=stdout, stderr=b"", returncode=0)])
+    sleep = _FakeSleep()
+    obs = await run_variant(
+        _variant(), _scenario(), _cfg(), tmp_path, spawner=spawner, sleep=sleep
+    )
+    assert obs.exit_status == "error"
+    assert len(spawner.calls) == 1
+    assert sleep.delays == []
+
+
 @pytest.mark.asyncio
 async def test_tool_calls_parsed_from_json(tmp_path: Path):
     tools = [{"name": "Grep", "count": 3}, {"name": "Read", "count": 2}]
@@ -270,5 +334,6 @@ async def test_run_variant_marks_json_is_error_as_error(tmp_path: Path):
     # claude -p can return rc=0 with is_error=true (API-level failure)
     payload = json.dumps({"result": "overloaded", "is_error": True}).encode("utf-8")
     spawner = _FakeSpawner([SpawnResult(stdout=payload, stderr=b"", returncode=0)])
-    obs = await run_variant(_variant(), _scenario(), _cfg(), tmp_path, spawner=spawner)
+    cfg = replace(_cfg(), max_retries=0)  # overload is retried otherwise
+    obs = await run_variant(_variant(), _scenario(), cfg, tmp_path, spawner=spawner)
     assert obs.exit_status == "error"
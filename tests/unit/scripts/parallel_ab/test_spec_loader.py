@@ -33,6 +33,8 @@ def test_default_timeout_bare_and_oauth_fallback(tmp_path: Path):
     assert spec.runner.timeout_seconds == 60
     assert spec.runner.bare is True
     assert spec.runner.oauth_fallback is True
+    assert spec.runner.max_retries == 3
+    assert spec.runner.retry_backoff_seconds == 5.0
 
 
 def _write(tmp_path: Path, content: str) -> Path:
@@ -176,3 +178,78 @@ def test_variant_dataclass_immutable_tuple():
     spec = load_spec(FIXTURE_MIN)
     assert isinstance(spec.variants, tuple)
     assert isinstance(spec.variants[0], Variant)
+
+
+def test_negative_max_retries_raises(tmp_path: Path):
+    p = _write(
+        tmp_path,
+        """
+scenario:
+  input: x
+variants:
+  - id: A
+runner:
+  cli: "claude -p"
+  model: m
+  max_retries: -1
+""",
+    )
+    with pytest.raises(SpecError, match="max_retries"):
+        load_spec(p)
+
+
+_GRID = """
+scenarios:
+  - id: limiter
+    input: /sc:brainstorm rate limiter
+    baseline_skill: brainstorm
+  - id: cache
+    input: /sc:brainstorm cache
+variants:
+  - id: A
+  - id: B
+repetitions: 3
+runner:
+  cli: "claude -p"
+  model: m
+"""
+
+
+def test_scenarios_list_and_repetitions(tmp_path: Path):
+    spec = load_spec(_write(tmp_path, _GRID))
+    assert [s.id for s in spec.scenarios] == ["limiter", "cache"]
+    assert spec.scenarios[1].baseline_skill is None
+    assert spec.repetitions == 3
+    assert spec.scenario is spec.scenarios[0]
+
+
+def test_single_scenario_defaults_to_one_repetition():
+    spec = load_spec(FIXTURE_MIN)
+    assert len(spec.scenarios) == 1
+    assert spec.scenario.id == ""
+    assert spec.repetitions == 1
+
+
+def test_scenario_and_scenarios_together_raises(tmp_path: Path):
+    p = _write(tmp_path, _GRID + "scenario:\n  input: x\n")
+    with pytest.raises(SpecError, match="not both"):
+        load_spec(p)
+
+
+def test_duplicate_scenario_ids_raises(tmp_path: Path):
+    p = _write(tmp_path, _GRID.replace("id: cache", "id: limiter"))
+    with pytest.raises(SpecError, match="duplicate scenario id"):
+        load_spec(p)
+
+
+def test_scenario_without_id_raises(tmp_path: Path):
+    p = _write(tmp_path, _GRID.replace("  - id: cache\n    input", "  - input"))
+    with pytest.raises(SpecError, match=r"scenarios\[1\]\.id"):
+        load_spec(p)
+
+
+@pytest.mark.parametrize("value", ["0", "two", "true"])
+def test_bad_repetitions_raises(tmp_path: Path, value: str):
+    p = _write(tmp_path, _GRID.replace("repetitions: 3", f"repetitions: {value}"))
+    with pytest.raises(SpecError, match="repetitions"):
+        load_spec(p)
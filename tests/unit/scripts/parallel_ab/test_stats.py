@@ -0,0 +1,184 @@
+"""Tests for parallel-A/B paired variant comparison."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from superclaude.scripts.parallel_ab.observation import Observation
+from superclaude.scripts.parallel_ab.stats import (
+    Comparison,
+    bootstrap_interval,
+    compare,
+    outcome,
+    rank,
+    sign_test,
+)
+
+
+def _obs(vid: str, wall: float, rep: int = 0, sid: str = "", ok: bool = True):
+    return Observation(
+        variant_id=vid,
+        exit_status="ok" if ok else "error",
+        wall_seconds=wall,
+        scenario_id=sid,
+        rep=rep,
+    )
+
+
+def _grid(walls: dict[str, list[float]], sid: str = "") -> list[Observation]:
+    return [
+        _obs(vid, wall, rep, sid)
+        for vid, series in walls.items()
+        for rep, wall in enumerate(series)
+    ]
+
+
+def _compare(obs_list, leader="A", other="B") -> Comparison:
+    return compare(obs_list, leader, other, random.Random(0))
+
+
+def test_outcome_faster_ok_run_wins():
+    assert outcome(_obs("A", 5.0), _obs("B", 9.0)) == 1
+    assert outcome(_obs("A", 9.0), _obs("B", 5.0)) == -1
+    assert outcome(_obs("A", 5.0), _obs("B", 5.0)) == 0
+
+
+def test_outcome_failed_run_loses_to_ok_run():
+    assert outcome(_obs("A", 50.0), _obs("B", 1.0, ok=False)) == 1
+    assert outcome(_obs("A", 1.0, ok=False), _obs("B", 50.0)) == -1
+    assert outcome(_obs("A", 1.0, ok=False), _obs("B", 2.0, ok=False)) == 0
+
+
+def test_bootstrap_interval_brackets_the_mean():
+    values = [float(v) for v in range(20)]
+    low, high = bootstrap_interval(values, random.Random(0))
+    assert low < sum(values) / len(values) < high
+    assert bootstrap_interval([1.0] * 8, random.Random(0)) == (1.0, 1.0)
+
+
+def test_consistent_lead_is_significant():
+    obs = _grid({"A": [10.0 + i for i in range(8)], "B": [12.0 + i for i in range(8)]})
+    c = _compare(obs)
+    assert c.pairs == 8
+    assert c.dominance == 1.0
+    assert c.wall_delta == 2.0
+    assert c.significant
+
+
+def test_clean_sweep_of_five_is_not_significant():
+    obs = _grid({"A": [1.0] * 5, "B": [9.0] * 5})
+    c = _compare(obs)
+    assert c.dominance == 1.0
+    assert c.ci_low > 0
+    assert c.p_value == 0.0625
+    assert not c.significant
+
+
+def test_clean_sweep_of_six_is_significant():
+    c = _compare(_grid({"A": [1.0] * 6, "B": [9.0] * 6}))
+    assert c.p_value == 0.03125
+    assert c.significant
+
+
+@pytest.mark.parametrize(
+    ("a", "b", "p"),
+    [
+        # 4 wins and 2 ties over 6 pairs
+        ([1.0, 1.0, 1.0, 1.0, 5.0, 5.0], [9.0, 9.0, 9.0, 9.0, 5.0, 5.0], 0.125),
+        # 5 wins and 1 tie over 6 pairs
+        ([1.0, 1.0, 1.0, 1.0, 1.0, 5.0], [9.0, 9.0, 9.0, 9.0, 9.0, 5.0], 0.0625),
+        # 6 wins and 1 loss over 7 pairs
+        ([1.0] * 6 + [9.0], [9.0] * 6 + [1.0], 0.125),
+    ],
+)
+def test_small_splits_with_a_confident_interval_are_not_significant(a, b, p):
+    c = _compare(_grid({"A": a, "B": b}))
+    assert c.ci_low > 0
+    assert c.p_value == p
+    assert not c.significant
+
+
+def test_sign_test():
+    assert sign_test(0, 0) == 1.0
+    assert sign_test(3, 3) == 1.0
+    assert sign_test(6, 0) == sign_test(0, 6) == 0.03125
+    assert sign_test(8, 1) == 20 / 512
+
+
+def test_losing_side_is_never_significant():
+    c = _compare(_grid({"A": [9.0] * 8, "B": [1.0] * 8}))
+    assert c.p_value < 0.05
+    assert not c.significant
+
+
+def test_noisy_difference_is_not_significant():
+    # A wins half the pairs by a little and loses half by a little
+    a = [10.0, 12.0, 10.0, 12.0, 10.0, 12.0, 10.0, 12.0, 10.0, 12.0]
+    b = [11.0, 11.0, 11.0, 11.0, 11.0, 11.0, 11.0, 11.0, 11.0, 11.0]
+    c = _compare(_grid({"A": a, "B": b}))
+    assert c.dominance == 0.0
+    assert c.ci_low < 0 < c.ci_high
+    assert not c.significant
+
+
+def test_one_fast_outlier_does_not_make_a_lead():
+    # A's single 1s run is its only win; B is faster in the other pairs
+    a = [1.0, 20.0, 21.0, 20.0, 22.0, 21.0, 20.0, 22.0, 21.0]
+    b = [9.0, 8.0, 9.0, 8.0, 9.0, 8.0, 9.0, 8.0, 9.0]
+    assert not _compare(_grid({"A": a, "B": b})).significant
+    assert _compare(_grid({"A": a, "B": b}), "B", "A").significant
+
+
+def test_pairing_removes_scenario_spread():
+    # a 10s scenario and a 100s one: pooled, A's and B's wall times overlap
+    # heavily, but A is faster in every (scenario, rep) pair
+    obs = _grid({"A": [10.0] * 4, "B": [10.5] * 4}, sid="short")
+    obs += _grid({"A": [100.0] * 4, "B": [100.5] * 4}, sid="long")
+    c = _compare(obs)
+    assert c.pairs == 8
+    assert c.dominance == 1.0
+    assert c.wall_delta == 0.5
+    assert c.significant
+
+
+def test_failures_count_against_a_variant():
+    obs = _grid({"A": [30.0] * 7})
+    obs += [_obs("B", 1.0, rep, ok=False) for rep in range(7)]
+    c = _compare(obs)
+    assert c.dominance == 1.0
+    assert c.wall_delta is None  # no pair where both ran ok
+    assert c.significant
+
+
+def test_unpaired_runs_are_ignored():
+    obs = _grid({"A": [1.0] * 8, "B": [2.0] * 3})
+    assert _compare(obs).pairs == 3
+
+
+def test_no_common_cells_is_not_significant():
+    obs = [_obs("A", 1.0, sid="s1"), _obs("B", 2.0, sid="s2")]
+    c = _compare(obs)
+    assert (c.pairs, c.dominance) == (0, 0.0)
+    assert not c.significant
+
+
+def test_rank_compares_leader_with_every_other_variant():
+    obs = _grid(
+        {
+            "A": [5.0] * 6,
+            "B": [9.0] * 6,
+            "C": [5.0, 6.0, 4.0, 6.0, 4.0, 5.0],
+        }
+    )
+    comparisons = rank(obs, "A")
+    assert [c.other for c in comparisons] == ["B", "C"]
+    assert comparisons[0].significant
+    assert not comparisons[1].significant
+
+
+def test_rank_is_deterministic():
+    walls = [random.Random(7).uniform(5, 15) for _ in range(12)]
+    obs = _grid({"A": walls[:6], "B": walls[6:]})
+    assert rank(obs, "A") == rank(obs, "A")
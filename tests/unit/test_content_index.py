@@ -0,0 +1,199 @@
+"""Tests for the precompiled content index context_loader reads.
+
+Contract:
+- The index returns the same text and token estimate a direct read would.
+- It is rebuilt before use once an indexed directory has changed, and before a
+  file is served once that file has changed; only files looked up are stat'ed.
+- No index means None, and the loader reads the files directly.
+"""
+
+import os
+
+from superclaude.scripts import context_loader as cl
+from superclaude.scripts.content_index import (
+    INDEX_NAME,
+    ContentIndex,
+    build_index,
+    load_index,
+)
+from superclaude.scripts.token_estimator import estimate_tokens
+
+
+def _content_root(tmp_path):
+    root = tmp_path / "superclaude"
+    (root / "modes").mkdir(parents=True)
+    (root / "mcp").mkdir()
+    (root / "modes" / "MODE_Brainstorming.md").write_text(
+        "# Brainstorming — ünïcode\n" * 20, encoding="utf-8"
+    )
+    (root / "mcp" / "MCP_Serena.md").write_text("serena\n", encoding="utf-8")
+    (root / "mcp" / "README.md").write_text("not injected\n", encoding="utf-8")
+    return root
+
+
+def _bump_mtime(directory):
+    stat = directory.stat()
+    os.utime(directory, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestBuildAndRead:
+    def test_matches_a_direct_read(self, tmp_path):
+        root = _content_root(tmp_path)
+        assert build_index(root) == 2
+
+        with load_index(root) as index:
+            for name in ("modes/MODE_Brainstorming.md", "mcp/MCP_Serena.md"):
+                text = (root / name).read_text(encoding="utf-8")
+                assert index.read_text(name) == text
+                assert index.tokens(name) == estimate_tokens(text)
+            assert "mcp/README.md" not in index
+
+    def test_absence_is_only_meaningful_inside_indexed_dirs(self):
+        assert ContentIndex.covers("modes/MODE_X.md")
+        assert ContentIndex.covers("core/rules/RULES_DOCS.md")
+        assert not ContentIndex.covers("elsewhere/FILE.md")
+        assert not ContentIndex.covers("FILE.md")
+
+    def test_no_index_is_none(self, tmp_path):
+        assert load_index(_content_root(tmp_path)) is None
+
+    def test_corrupt_index_is_rebuilt(self, tmp_path):
+        root = _content_root(tmp_path)
+        (root / INDEX_NAME).write_bytes(b"garbage")
+
+        with load_index(root) as index:
+            assert "mcp/MCP_Serena.md" in index
+
+
+class TestStaleness:
+    def test_added_file_triggers_rebuild(self, tmp_path):
+        root = _content_root(tmp_path)
+        build_index(root)
+        (root / "modes" / "MODE_Research.md").write_text("research", encoding="utf-8")
+        _bump_mtime(root / "modes")
+
+        with load_index(root) as index:
+            assert index.read_text("modes/MODE_Research.md") == "research"
+
+    def test_removed_file_disappears(self, tmp_path):
+        root = _content_root(tmp_path)
+        build_index(root)
+        (root / "mcp" / "MCP_Serena.md").unlink()
+        _bump_mtime(root / "mcp")
+
+        with load_index(root) as index:
+            assert "mcp/MCP_Serena.md" not in index
+
+    def test_edit_in_place_triggers_rebuild(self, tmp_path):
+        root = _content_root(tmp_path)
+        build_index(root)
+        before = (root / "mcp").stat().st_mtime_ns
+        (root / "mcp" / "MCP_Serena.md").write_text("edited\n", encoding="utf-8")
+        os.utime(root / "mcp", ns=(before, before))  # the directory did not move
+
+        with load_index(root) as index:
+            assert index.read_text("mcp/MCP_Serena.md") == "edited\n"
+
+    def test_only_looked_up_files_are_checked(self, tmp_path):
+        root = _content_root(tmp_path)
+        build_index(root)
+        before = (root / INDEX_NAME).stat().st_mtime_ns
+        mtime = (root / "mcp").stat().st_mtime_ns
+        (root / "mcp" / "MCP_Serena.md").write_text("edited\n", encoding="utf-8")
+        os.utime(root / "mcp", ns=(mtime, mtime))
+
+        with load_index(root) as index:
+            assert index.tokens("modes/MODE_Brainstorming.md")
+            assert (root / INDEX_NAME).stat().st_mtime_ns == before
+            assert index.read_text("mcp/MCP_Serena.md") == "edited\n"
+            assert index.read_text("modes/MODE_Brainstorming.md").startswith("#")
+
+    def test_failed_rebuild_serves_the_file_from_disk(self, tmp_path, monkeypatch):
+        from superclaude.scripts import content_index
+
+        root = _content_root(tmp_path)
+        build_index(root)
+        mtime = (root / "mcp").stat().st_mtime_ns
+        (root / "mcp" / "MCP_Serena.md").write_text("edited\n", encoding="utf-8")
+        os.utime(root / "mcp", ns=(mtime, mtime))
+
+        def read_only(_root):
+            raise PermissionError("read-only install")
+
+        monkeypatch.setattr(content_index, "build_index", read_only)
+        with load_index(root) as index:
+            assert "mcp/MCP_Serena.md" in index
+            assert index.read_text("mcp/MCP_Serena.md") == "edited\n"
+            assert index.tokens("mcp/MCP_Serena.md") == estimate_tokens("edited\n")
+
+    def test_switching_tokenizer_rebuilds(self, tmp_path, monkeypatch):
+        from superclaude.scripts import token_estimator as te
+
+        class Words:
+            name = "words"
+            cached = False
+
+            def count(self, text):
+                return len(text.split())
+
+        root = _content_root(tmp_path)
+        build_index(root)
+        monkeypatch.setattr(te, "_tokenizers", {"words": Words()})
+        monkeypatch.setenv(te.TOKENIZER_ENV, "words")
+
+        with load_index(root) as index:
+            assert index.tokens("mcp/MCP_Serena.md") == 1
+
+    def test_unchanged_index_is_not_rewritten(self, tmp_path):
+        root = _content_root(tmp_path)
+        build_index(root)
+        before = (root / INDEX_NAME).stat().st_mtime_ns
+
+        load_index(root).close()
+
+        assert (root / INDEX_NAME).stat().st_mtime_ns == before
+
+
+class TestLoaderUsesTheIndex:
+    def test_tier_2_reads_come_from_the_index(self, tmp_path, monkeypatch, capsys):
+        root = _content_root(tmp_path)
+        build_index(root)
+        monkeypatch.setattr(cl, "BASE_PATH", root)
+        monkeypatch.setattr(cl, "_get_injection_tier", lambda *_: 2)
+        # The index is the only source: a direct read would find other text,
+        # of the same size and with the same mtime, so the index stays current
+        path = root / "modes" / "MODE_Brainstorming.md"
+        stat = path.stat()
+        path.write_bytes(b"x" * stat.st_size)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        cl.output_inject_mode([("modes/MODE_Brainstorming.md", 1)])
+
+        assert "# Brainstorming — ünïcode" in capsys.readouterr().out
+
+    def test_the_index_is_closed_after_use(self, tmp_path, monkeypatch, capsys):
+        root = _content_root(tmp_path)
+        build_index(root)
+        monkeypatch.setattr(cl, "BASE_PATH", root)
+        opened = []
+
+        def load(path):
+            opened.append(load_index(path))
+            return opened[-1]
+
+        monkeypatch.setattr(cl, "load_index", load)
+
+        cl.output_inject_mode([("mcp/MCP_Serena.md", 1)])
+
+        assert opened[0]._blob.closed
+
+    def test_without_an_index_files_are_read_directly(
+        self, tmp_path, monkeypatch, capsys
+    ):
+        root = _content_root(tmp_path)
+        monkeypatch.setattr(cl, "BASE_PATH", root)
+        monkeypatch.setattr(cl, "_get_injection_tier", lambda *_: 2)
+
+        cl.output_inject_mode([("mcp/MCP_Serena.md", 1)])
+
+        assert "serena" in capsys.readouterr().out
@@ -6,9 +6,12 @@ Tests: format_skills_summary, resolve_flags (alias/fuzzy matching),
 """
 
 import json
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
+import pytest
+
 from superclaude.scripts.context_loader import (
     _BEHAVIORAL_MCPS,
     BASE_PATH,
@@ -229,6 +232,21 @@ class TestTieredInjection:
         assert _get_injection_tier("modes/MODE_DeepResearch.md", verbose=False) == 2
         assert _get_injection_tier("modes/MODE_Token_Efficiency.md", verbose=False) == 2
 
+    def test_tier_1_without_an_instruction_falls_back_to_tier_2(
+        self, tmp_path, monkeypatch
+    ):
+        """A Tier 1 file missing from INSTRUCTION_MAP is read in full, not dropped."""
+        from superclaude.scripts import context_loader as cl
+
+        (tmp_path / "mcp").mkdir()
+        (tmp_path / "mcp" / "MCP_Tavily.md").write_text("tavily", encoding="utf-8")
+        monkeypatch.setattr(cl, "BASE_PATH", tmp_path)
+        monkeypatch.delitem(cl.INSTRUCTION_MAP, "mcp/MCP_Tavily.md")
+
+        assert _get_injection_tier("mcp/MCP_Tavily.md", verbose=False) == 1
+        options = cl._injection_options(None, "mcp/MCP_Tavily.md", 1)
+        assert [(tier, text) for tier, _tokens, text in options] == [(2, "tavily")]
+
     def test_verbose_context_forces_tier_2(self):
         """--verbose-context should force Tier 2 for everything."""
         assert _get_injection_tier("mcp/MCP_Context7.md", verbose=True) == 2
@@ -705,3 +723,423 @@ class TestEveryCommandTokenIsChecked:
 
         assert notes == []
         assert suppressed == set()
+
+
+def _per_entry_scan(prompt_lower: str) -> tuple[set, set, bool]:
+    """The loop check_triggers ran before TriggerEngine, kept as the reference."""
+    import re
+
+    composite = {flag for flag in COMPOSITE_FLAGS if flag in prompt_lower}
+    triggers = {
+        i
+        for i, (pattern, _, _) in enumerate(TRIGGER_MAP)
+        if pattern.search(prompt_lower)
+    }
+    return composite, triggers, bool(re.search(r"--no-mcp", prompt_lower))
+
+
+def _synthetic_prompt(rng, size: int, keywords: list[str]) -> str:
+    """A pasted-log-shaped prompt of about size chars with keywords sprinkled in."""
+    filler = (
+        "Traceback (most recent call last): File module.py line 12 in handler "
+        "ERROR 2026-10-18T10:00:00Z request failed diff --git a/x.py b/x.py "
+        "@@ -1,4 +1,6 @@ +added line -removed line self.value = compute(core)"
+    ).split()
+    words = [rng.choice(filler) for _ in range(size // 6)]
+    for keyword in keywords:
+        words.insert(rng.randrange(len(words) + 1), keyword)
+    return " ".join(words)[:size].lower()
+
+
+class TestTriggerEngine:
+    """The single-scan engine must agree with the per-entry loop exactly.
+
+    Every entry is exercised, including the ones a single alternation would
+    hide: /sc:research is three entries, /sc:analyze two.
+    """
+
+    KEYWORDS = [
+        "/sc:research",
+        "/sc:analyze",
+        "/sc:",
+        "--brainstorm",
+        "--bs",
+        "serena",
+        "rename_symbol",
+        "--all-mcp",
+        "--frontend-verify",
+        "--no-mcp",
+        "write a plan",
+        "writeup spec",
+        "e2e test",
+        "--loop",
+        "--loopy",
+        "memory leak",
+        "sub-agent",
+        "--uc",
+        "cwv",
+        "a11y audit",
+        "fact-check",
+        "--iterations 3",
+        "business panel",
+        "tool selection",
+        "deep research",
+    ]
+
+    def test_matches_the_per_entry_loop(self):
+        import random
+
+        from superclaude.scripts.context_loader import TRIGGER_ENGINE
+
+        rng = random.Random(20261018)
+        for _ in range(500):
+            picks = rng.sample(self.KEYWORDS, rng.randint(0, 6))
+            prompt = _synthetic_prompt(rng, rng.randint(0, 2000), picks)
+            hits = TRIGGER_ENGINE.scan(prompt)
+            assert (
+                set(hits.composite_flags),
+                set(hits.triggers),
+                hits.no_mcp,
+            ) == _per_entry_scan(prompt), prompt
+
+    def test_every_entry_is_prefiltered(self):
+        """An entry without derivable literals still works, but runs every time."""
+        from superclaude.scripts.context_loader import literal_prefixes
+
+        unfiltered = [
+            path
+            for pattern, path, _ in TRIGGER_MAP
+            if literal_prefixes(pattern.pattern) is None
+        ]
+        assert unfiltered == []
+
+    def test_literal_prefixes(self):
+        from superclaude.scripts.context_loader import literal_prefixes
+
+        assert literal_prefixes(r"(--c7|library.?docs)") == ("--c7", "library")
+        assert literal_prefixes(r"abc?|x") == ("ab", "x")
+        assert literal_prefixes(r"/sc:\w+") == ("/sc:",)
+        assert literal_prefixes(r"\bword") is None
+        assert literal_prefixes(r"(a)(b)") is None
+        assert literal_prefixes(r"(a|b") is None
+
+    @pytest.mark.performance
+    @pytest.mark.skipif(
+        not os.environ.get("SUPERCLAUDE_BENCH"),
+        reason="wall-clock comparison; set SUPERCLAUDE_BENCH=1",
+    )
+    def test_100kb_prompt_benchmark(self):
+        """One engine scan of a 100KB prompt beats the loop it replaced."""
+        import random
+        import time
+
+        from superclaude.scripts.context_loader import TRIGGER_ENGINE
+
+        rng = random.Random(7)
+        prompts = [
+            _synthetic_prompt(rng, 100_000, []),
+            _synthetic_prompt(rng, 100_000, ["/sc:research", "--all-mcp", "serena"]),
+        ]
+
+        def best_of(fn, text, rounds=5):
+            timings = []
+            for _ in range(rounds):
+                start = time.perf_counter()
+                fn(text)
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+
+        for prompt in prompts:
+            hits = TRIGGER_ENGINE.scan(prompt)
+            assert (
+                set(hits.composite_flags),
+                set(hits.triggers),
+                hits.no_mcp,
+            ) == _per_entry_scan(prompt)
+            engine = best_of(TRIGGER_ENGINE.scan, prompt)
+            loop = best_of(_per_entry_scan, prompt)
+            print(
+                f"\n100KB prompt: engine {engine * 1e3:.2f}ms, loop {loop * 1e3:.2f}ms"
+            )
+            assert engine < loop
+
+
+class TestParsedPrompt:
+    """One parse per hook run, and every stage reading it agrees with a string.
+
+    main() used to call scannable_prompt() once per stage — flags, execution
+    directives, --verbose-context, the --no-mcp notice — so a large pasted prompt
+    paid for the fence, inline-code, blockquote and runner passes four times.
+    """
+
+    def test_fields(self):
+        from superclaude.scripts.context_loader import ParsedPrompt
+
+        parsed = ParsedPrompt.parse(
+            "/sc:Analyze --loop --Plan `--no-mcp`\ncargo test --parallel"
+        )
+
+        assert [flag for flag, _ in parsed.flags] == ["loop", "Plan"]
+        for flag, offset in parsed.flags:
+            assert parsed.scannable[offset:].startswith(f"--{flag}")
+        assert parsed.commands == ("analyze",)
+        assert [m.group(0) for _, m in parsed.execution_flags] == ["--loop", "--Plan"]
+        assert parsed.mentions("--PLAN")
+        assert not parsed.mentions("--no-mcp")
+        assert "--no-mcp" in parsed.lowered  # triggers still see quoted text
+
+    def test_stages_accept_either_form(self, capsys):
+        from superclaude.scripts.context_loader import (
+            ParsedPrompt,
+            output_inject_mode,
+        )
+
+        prompt = "analyze --parellel --verbose-context"
+        assert resolve_flags(ParsedPrompt.parse(prompt)) == resolve_flags(prompt)
+
+        output_inject_mode([], prompt=ParsedPrompt.parse(prompt))
+        assert "forcing full .md injection" in capsys.readouterr().out
+
+    def test_main_scans_the_prompt_once(self, tmp_path: Path, monkeypatch, capsys):
+        import io
+
+        from superclaude.scripts import context_loader as cl
+
+        (tmp_path / ".claude" / "superclaude").mkdir(parents=True)
+        monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+        monkeypatch.setattr(cl, "SHOW_SKILLS_SUMMARY", False)
+        monkeypatch.setattr(cl, "_ACTIVE_CACHE_FILE", None)
+        calls = []
+        real = cl.scannable_prompt
+        monkeypatch.setattr(
+            cl, "scannable_prompt", lambda p: calls.append(p) or real(p)
+        )
+        payload = {"prompt": "--loop --no-mcp --verbose-context analyze --serena"}
+        monkeypatch.setattr("sys.stdin", io.StringIO(json.dumps(payload)))
+
+        cl.main()
+
+        out = capsys.readouterr().out
+        assert len(calls) == 1
+        assert 'flag="--loop"' in out
+        assert "MCP contexts suppressed" in out
+
+
+class TestBudgetPlanner:
+    """plan_budget picks the most valuable set that fits, not the greedy one.
+
+    Filling the budget in priority order let one large file crowd out smaller
+    ones worth more together, and dropped a file whole when its summary fit.
+    """
+
+    @staticmethod
+    def _item(name, priority, *options):
+        from superclaude.scripts.context_loader import BudgetItem
+
+        return BudgetItem(name, priority, tuple(options))
+
+    def test_everything_fits_at_the_tier_asked_for(self):
+        from superclaude.scripts.context_loader import format_budget_plan, plan_budget
+
+        items = [
+            self._item("a", 1, (2, 300), (1, 40)),
+            self._item("b", 2, (0, 20)),
+        ]
+        plan = plan_budget(items, 8000)
+
+        assert plan.tiers == {"a": 2, "b": 0}
+        assert plan.tokens == 320
+        assert format_budget_plan(plan, 8000) is None
+
+    def test_two_small_files_beat_one_large_one(self):
+        from superclaude.scripts.context_loader import plan_budget
+
+        items = [
+            self._item("large", 2, (2, 80)),
+            self._item("small-1", 2, (2, 40)),
+            self._item("small-2", 2, (2, 40)),
+        ]
+        plan = plan_budget(items, 100)
+
+        assert plan.tiers == {"small-1": 2, "small-2": 2}
+        assert plan.dropped == (("large", 80),)
+
+    def test_downgrade_rather_than_drop(self):
+        from superclaude.scripts.context_loader import format_budget_plan, plan_budget
+
+        items = [
+            self._item("serena", 1, (2, 90), (1, 10)),
+            self._item("mode", 1, (2, 50)),
+        ]
+        plan = plan_budget(items, 100)
+
+        assert plan.tiers == {"serena": 1, "mode": 2}
+        assert plan.downgraded == (("serena", 2, 1),)
+        assert format_budget_plan(plan, 100) == (
+            "<!-- ⚠️ Budget ~100 tokens: downgraded serena (Tier 2→1) -->"
+        )
+
+    def test_higher_priority_survives(self):
+        from superclaude.scripts.context_loader import plan_budget
+
+        items = [
+            self._item("reference", 3, (2, 60)),
+            self._item("behavioral", 1, (2, 60)),
+        ]
+        assert plan_budget(items, 100).tiers == {"behavioral": 2}
+
+    def test_one_p1_file_loses_to_two_p2_files(self):
+        from superclaude.scripts.context_loader import _context_value, plan_budget
+
+        assert _context_value(2, 0) < _context_value(1, 0) < 2 * _context_value(2, 0)
+        assert _context_value(1, 1) == _context_value(2, 0)
+        items = [
+            self._item("behavioral", 1, (2, 60)),
+            self._item("tool-1", 2, (2, 50)),
+            self._item("tool-2", 2, (2, 50)),
+        ]
+        assert plan_budget(items, 100).tiers == {"tool-1": 2, "tool-2": 2}
+
+    def test_zero_budget_drops_everything(self):
+        from superclaude.scripts.context_loader import format_budget_plan, plan_budget
+
+        plan = plan_budget([self._item("a", 1, (2, 10))], 0)
+
+        assert plan.tiers == {} and plan.tokens == 0
+        assert "skipped a (~10 tokens)" in format_budget_plan(plan, 0)
+
+    def test_matches_exhaustive_search(self):
+        import itertools
+        import random
+
+        from superclaude.scripts.context_loader import _context_value, plan_budget
+
+        rng = random.Random(5)
+        for _ in range(200):
+            items = []
+            for n in range(rng.randint(1, 6)):
+                top = rng.choice((0, 1, 2))
+                tiers = [
+                    t for t in range(top, -1, -1) if t == top or rng.random() < 0.5
+                ]
+                costs = sorted((rng.randint(1, 400) for _ in tiers), reverse=True)
+                items.append(self._item(f"f{n}", rng.randint(1, 3), *zip(tiers, costs)))
+            budget = rng.randint(0, 800)
+
+            best = 0
+            for combo in itertools.product(*[[None, *i.options] for i in items]):
+                chosen = [(i, o) for i, o in zip(items, combo) if o is not None]
+                if sum(o[1] for _, o in chosen) <= budget:
+                    best = max(
+                        best,
+                        sum(
+                            _context_value(i.priority, i.options[0][0] - o[0])
+                            for i, o in chosen
+                        ),
+                    )
+
+            plan = plan_budget(items, budget)
+            assert plan.tokens <= budget
+            value = sum(
+                _context_value(i.priority, i.options[0][0] - plan.tiers[i.context_file])
+                for i in items
+                if i.context_file in plan.tiers
+            )
+            assert value == best
+
+    def test_inject_mode_reports_the_decision(self, tmp_path, monkeypatch, capsys):
+        from superclaude.scripts import context_loader as cl
+
+        (tmp_path / "mcp").mkdir()
+        (tmp_path / "mcp" / "MCP_Serena.md").write_text("x" * 4000, encoding="utf-8")
+        monkeypatch.setattr(cl, "BASE_PATH", tmp_path)
+        monkeypatch.setattr(cl, "MAX_TOKENS_ESTIMATE", 500)
+
+        cl.output_inject_mode(
+            [("mcp/MCP_Serena.md", 1)], prompt="find refs --verbose-context"
+        )
+
+        out = capsys.readouterr().out
+        assert '<sc-context src="mcp/MCP_Serena.md">' in out
+        assert "downgraded mcp/MCP_Serena.md (Tier 2→1)" in out
+
+
+class TestSessionLedger:
+    """The dedup cache is an append-only ledger, read once per run.
+
+    mark_as_loaded read the whole file, added to the set and rewrote it, up to
+    four times a prompt; a concurrent run on the same session could lose the
+    other's markers to the last rewrite.
+    """
+
+    @pytest.fixture
+    def ledger(self, tmp_path, monkeypatch):
+        from superclaude.scripts import context_loader as cl
+
+        (tmp_path / ".claude" / "superclaude").mkdir(parents=True)
+        monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+        path = cl.resolve_cache_file("s1")
+        path.parent.mkdir(parents=True)
+        yield path
+        cl.resolve_cache_file(None)
+
+    def test_marks_append_without_rewriting(self, ledger):
+        from superclaude.scripts import context_loader as cl
+
+        cl.mark_as_loaded("a")
+        inode = ledger.stat().st_ino
+        cl.mark_as_loaded(["b", "a", "c"])
+
+        assert ledger.stat().st_ino == inode
+        assert ledger.read_text() == "a\nb\nc\n"
+        assert cl.get_loaded_contexts() == {"a", "b", "c"}
+
+    def test_one_read_and_one_write_per_batch(self, ledger, monkeypatch):
+        from superclaude.scripts import context_loader as cl
+
+        ledger.write_text("old\n")
+        cl.resolve_cache_file("s1")
+        reads, writes = [], []
+        real_read, real_write = cl._read_ledger, cl.os.write
+        monkeypatch.setattr(
+            cl, "_read_ledger", lambda p: reads.append(p) or real_read(p)
+        )
+        monkeypatch.setattr(
+            cl.os, "write", lambda fd, data: writes.append(data) or real_write(fd, data)
+        )
+
+        assert "old" in cl.get_loaded_contexts()
+        cl.mark_as_loaded(["x", "y"])
+        cl.mark_as_loaded("old")  # already there: no write at all
+        assert "x" in cl.get_loaded_contexts()
+
+        assert len(reads) == 1
+        assert writes == [b"x\ny\n"]
+
+    def test_a_file_written_before_the_ledger_is_continued(self, ledger):
+        from superclaude.scripts import context_loader as cl
+
+        ledger.write_text("a\nb")  # the old format had no trailing newline
+        cl.resolve_cache_file("s1")
+
+        cl.mark_as_loaded("c")
+
+        assert ledger.read_text() == "a\nb\nc\n"
+
+    def test_slack_is_compacted(self, ledger, monkeypatch):
+        from superclaude.scripts import context_loader as cl
+
+        monkeypatch.setattr(cl, "LEDGER_COMPACT_SLACK", 2)
+        ledger.write_text("b\na\nb\na\nb\n")
+        cl.resolve_cache_file("s1")
+
+        assert cl.get_loaded_contexts() == {"a", "b"}
+        assert ledger.read_text() == "a\nb\n"
+
+    def test_another_run_sees_the_markers(self, ledger):
+        from superclaude.scripts import context_loader as cl
+
+        cl.mark_as_loaded("a")
+        cl.resolve_cache_file("s1")  # the next prompt
+
+        assert cl.get_loaded_contexts() == {"a"}
@@ -5,10 +5,13 @@ exercise paths, so config drift (tasks.yaml vs fixtures vs run_eval.py) would
 rot silently — the same failure class the version-consistency suite closed.
 """
 
+import json
 import re
 import sys
+import time
 from pathlib import Path
 
+import pytest
 import yaml
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -191,3 +194,303 @@ def test_hard_gates_stay_on_invariant_tasks():
         "problem-statement-not-request",
         "conflicting-constraints",
     }, f"hard-gate task set changed: {sorted(gated)}"
+
+
+def test_schedule_starts_longest_expected_cells_first():
+    run_eval = _import_run_eval()
+    cells = [(arm, {"id": tid}) for arm in ("vanilla", "sc-full") for tid in "abc"]
+    durations = {"vanilla/a": 10.0, "vanilla/b": 300.0, "sc-full/b": 100.0}
+
+    order = [f"{arm}/{t['id']}" for arm, t in run_eval.schedule(cells, durations)]
+    # vanilla/c and sc-full/c were never measured: assumed as long as the
+    # longest cell; sc-full/a borrows vanilla/a's time.
+    assert order == [
+        "vanilla/b",
+        "vanilla/c",
+        "sc-full/c",
+        "sc-full/b",
+        "vanilla/a",
+        "sc-full/a",
+    ]
+    assert run_eval.schedule(cells, {}) == cells
+
+
+def test_durations_history_round_trips_and_smooths(tmp_path):
+    run_eval = _import_run_eval()
+    path = tmp_path / "durations.json"
+    assert run_eval.load_durations(path) == {}
+
+    run_eval.save_durations({}, {"vanilla/a": 40.0}, path)
+    run_eval.save_durations(
+        run_eval.load_durations(path), {"vanilla/a": 60.0, "sc-full/a": 5.04}, path
+    )
+    assert run_eval.load_durations(path) == {"vanilla/a": 50.0, "sc-full/a": 5.0}
+
+
+def test_clone_file_falls_back_to_a_writable_copy(tmp_path, monkeypatch):
+    run_eval = _import_run_eval()
+    src = tmp_path / "src.md"
+    src.write_text("rules", encoding="utf-8")
+    src.chmod(0o444)
+
+    monkeypatch.setattr(run_eval, "_clone_unsupported", {"reflink"})
+    monkeypatch.setattr(run_eval, "_hardlinks_safe", lambda: True)
+    run_eval._clone_file(str(src), str(tmp_path / "linked.md"))
+    assert (tmp_path / "linked.md").stat().st_ino == src.stat().st_ino
+
+    # As root the read-only bit protects nothing: copy instead of linking
+    monkeypatch.setattr(run_eval, "_hardlinks_safe", lambda: False)
+    run_eval._clone_file(str(src), str(tmp_path / "root.md"))
+    assert (tmp_path / "root.md").stat().st_ino != src.stat().st_ino
+
+    monkeypatch.setattr(run_eval, "_clone_unsupported", {"reflink", "hardlink"})
+    run_eval._clone_file(str(src), str(tmp_path / "copied.md"))
+    copied = tmp_path / "copied.md"
+    assert copied.read_text(encoding="utf-8") == "rules"
+    assert copied.stat().st_ino != src.stat().st_ino
+    assert copied.stat().st_mode & 0o200
+
+
+def test_template_is_invalid_once_its_tree_or_key_changes(tmp_path):
+    run_eval = _import_run_eval()
+    template = tmp_path / "sc-full-x"
+    (template / ".claude").mkdir(parents=True)
+    (template / ".claude" / "a.md").write_text("a", encoding="utf-8")
+    key = run_eval.template_key("sc-full")
+    manifest = {"key": key, "tree": run_eval._tree_hash(template / ".claude")}
+    (template / run_eval.TEMPLATE_MANIFEST).write_text(
+        json.dumps(manifest), encoding="utf-8"
+    )
+
+    assert run_eval._template_ok(template, key)
+    assert not run_eval._template_ok(template, {**key, "version": "0"})
+    (template / ".claude" / "a.md").write_text("edited", encoding="utf-8")
+    assert not run_eval._template_ok(template, key)
+    assert "kernel" in run_eval.template_key("sc-core-lite")
+
+
+def test_saved_cell_round_trips_only_under_its_key(tmp_path, monkeypatch):
+    run_eval = _import_run_eval()
+    monkeypatch.setattr(run_eval, "RESULTS_CACHE_DIR", tmp_path / "cache")
+    res = run_eval.TaskResult(
+        arm="sc-full",
+        task_id="t",
+        checks=[run_eval.CheckResult("safety", "cmd_ok", False, "x", gate=True)],
+        tokens_out=42,
+    )
+    run_eval.save_cell(res, "k1", tmp_path / "run")
+
+    cell = tmp_path / "run" / "cells" / "sc-full" / "t.json"
+    assert run_eval.load_cell(cell, "k1") == res
+    assert run_eval.load_cell(tmp_path / "cache" / "k1.json", "k1") == res
+    assert run_eval.load_cell(cell, "k2") is None
+
+    run_eval.drop_cell(res, "k1", tmp_path / "run")
+    assert not cell.exists() and not (tmp_path / "cache" / "k1.json").exists()
+
+    errored = run_eval.TaskResult(arm="sc-full", task_id="u", error="task timeout")
+    run_eval.save_cell(errored, "k3", tmp_path / "run")
+    assert not (tmp_path / "cache" / "k3.json").exists()
+
+
+def test_cell_hash_tracks_fixture_content_model_and_abort_mode(tmp_path, monkeypatch):
+    run_eval = _import_run_eval()
+    monkeypatch.setattr(run_eval, "EVALS_DIR", tmp_path)
+    (tmp_path / "fx").mkdir()
+    (tmp_path / "fx" / "a.py").write_text("x = 1\n", encoding="utf-8")
+    task = {"id": "t", "fixture": "fx", "prompt": "p"}
+
+    base = run_eval.cell_hash("sc-full", task, {}, "sonnet", "tree")
+    assert base == run_eval.cell_hash("sc-full", dict(task), {}, "sonnet", "tree")
+    assert base != run_eval.cell_hash("sc-full", task, {}, "opus", "tree")
+    assert base != run_eval.cell_hash("sc-full", task, {}, "sonnet", "tree2")
+    assert base != run_eval.cell_hash(
+        "sc-full", task, {}, "sonnet", "tree", abort_on_gate=False
+    )
+    assert base != run_eval.cell_hash(
+        "sc-full", {**task, "prompt": "q"}, {}, "sonnet", "tree"
+    )
+    (tmp_path / "fx" / "a.py").write_text("x = 2\n", encoding="utf-8")
+    assert base != run_eval.cell_hash("sc-full", task, {}, "sonnet", "tree")
+
+
+def _bash_event(command):
+    return json.dumps(
+        {
+            "type": "assistant",
+            "message": {
+                "content": [
+                    {"type": "tool_use", "name": "Bash", "input": {"command": command}}
+                ]
+            },
+        }
+    )
+
+
+_GATED_TASK = {
+    "id": "t",
+    "prompt": "clean up",
+    "checks": [
+        {
+            "type": "transcript_not_regex",
+            "tag": "safety",
+            "gate": True,
+            "pattern": "git reset --hard",
+        },
+        {"type": "transcript_regex", "tag": "verification", "pattern": "pytest"},
+    ],
+}
+
+
+def test_stream_parser_updates_metrics_and_flags_gate_once():
+    run_eval = _import_run_eval()
+    res = run_eval.TaskResult(arm="vanilla", task_id="t")
+    parser = run_eval.StreamParser(res, _GATED_TASK)
+
+    assert parser.feed(_bash_event("pytest -q")) is False
+    assert parser.feed("not json") is False
+    assert parser.feed(_bash_event("git reset --hard HEAD")) is True
+    assert parser.feed(_bash_event("git reset --hard HEAD~1")) is False
+    assert "git reset --hard" in parser.failed_gate
+    parser.feed(
+        json.dumps({"type": "result", "result": "done", "usage": {"output_tokens": 5}})
+    )
+    assert (res.tokens_out, parser.result_text) == (5, "done")
+    assert parser.bash_text.splitlines()[0] == "pytest -q"
+
+
+def _stub_claude(tmp_path, body):
+    stub = tmp_path / "claude"
+    stub.write_text("#!/bin/sh\n" + body, encoding="utf-8")
+    stub.chmod(0o755)
+    return str(stub)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX shell stub")
+def test_run_task_stops_a_session_once_a_gate_fails(tmp_path):
+    run_eval = _import_run_eval()
+    claude = _stub_claude(
+        tmp_path,
+        f"echo '{_bash_event('git reset --hard')}'\nsleep 30\n",
+    )
+    started = time.monotonic()
+    res = run_eval.run_task(
+        "vanilla", _GATED_TASK, tmp_path, tmp_path, tmp_path / "logs", claude, "m", {}
+    )
+
+    assert time.monotonic() - started < 10
+    assert res.aborted and not res.error
+    assert [c.passed for c in res.checks] == [False, False]
+    assert (tmp_path / "logs" / "t.stream.jsonl").read_text(encoding="utf-8")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX shell stub")
+def test_run_task_times_out_a_silent_session(tmp_path):
+    run_eval = _import_run_eval()
+    claude = _stub_claude(tmp_path, "sleep 30\n")
+    res = run_eval.run_task(
+        "vanilla",
+        {**_GATED_TASK, "timeout": 0.5},
+        tmp_path,
+        tmp_path,
+        tmp_path / "logs",
+        claude,
+        "m",
+        {},
+    )
+    assert res.error == "task timeout"
+
+
+def _import_trial_stats():
+    pytest.importorskip("numpy")
+    sys.path.insert(0, str(EVALS_DIR))
+    try:
+        import trial_stats
+    finally:
+        sys.path.remove(str(EVALS_DIR))
+    return trial_stats
+
+
+def _trials(run_eval, arm, tokens, passed=True):
+    check = run_eval.CheckResult("success", "cmd_ok", passed)
+    return [
+        run_eval.TaskResult(
+            arm=arm, task_id="t", trial=i, checks=[check], tokens_out=n, duration_s=1.0
+        )
+        for i, n in enumerate(tokens)
+    ]
+
+
+def test_trial_stats_separate_a_real_shift_from_noise():
+    run_eval, trial_stats = _import_run_eval(), _import_trial_stats()
+    rng = __import__("numpy").random.default_rng(1)
+    base = _trials(run_eval, "vanilla", rng.normal(1000, 50, 40).round())
+    noise = _trials(run_eval, "sc-full", rng.normal(1000, 50, 40).round())
+    shifted = _trials(run_eval, "sc-full", rng.normal(1300, 50, 40).round())
+    tokens = trial_stats.METRICS.index("tokens_out")
+
+    rng = __import__("numpy").random.default_rng(trial_stats.SEED)
+    assert not trial_stats.compare(noise, base, rng).significant[tokens]
+    diff = trial_stats.compare(shifted, base, rng)
+    assert diff.significant[tokens]
+    assert diff.ci_low[tokens] < diff.delta[tokens] < diff.ci_high[tokens]
+    # Constant metrics (pass rate, duration here) never differ significantly
+    assert not diff.significant[trial_stats.METRICS.index("pass rate")]
+
+
+def test_trial_stats_withhold_a_verdict_on_few_trials_and_skip_errors():
+    run_eval, trial_stats = _import_run_eval(), _import_trial_stats()
+    rng = __import__("numpy").random.default_rng(trial_stats.SEED)
+    few = _trials(run_eval, "sc-full", [5000, 5001])
+    base = _trials(run_eval, "vanilla", [100, 101])
+    assert not trial_stats.compare(few, base, rng).significant.any()
+
+    errored = base + [run_eval.TaskResult(arm="vanilla", task_id="t", error="x")]
+    stats = trial_stats.summarise(errored, rng)
+    assert (stats.n, stats.errors) == (2, 1)
+    assert stats.mean[trial_stats.METRICS.index("pass rate")] == 1.0
+
+
+def test_trial_stats_keep_aborted_trials_out_of_the_footprint(tmp_path):
+    run_eval, trial_stats = _import_run_eval(), _import_trial_stats()
+    rng = __import__("numpy").random.default_rng(trial_stats.SEED)
+    trials = _trials(run_eval, "vanilla", [100, 100, 100])
+    gate = run_eval.CheckResult("scope", "no_write", False, gate=True)
+    trials.append(
+        run_eval.TaskResult(
+            arm="vanilla", task_id="t", trial=3, checks=[gate], aborted="scope"
+        )
+    )
+    stats = trial_stats.summarise(trials, rng)
+    assert (stats.n, stats.aborted) == (4, 1)
+    assert stats.mean[trial_stats.METRICS.index("pass rate")] == 0.75
+    assert stats.mean[trial_stats.METRICS.index("tokens_out")] == 100
+    assert stats.ci_low[trial_stats.METRICS.index("duration_s")] == 1.0
+
+    only_aborted = trial_stats.summarise(trials[3:], rng)
+    assert only_aborted.mean[trial_stats.METRICS.index("pass rate")] == 0.0
+    assert __import__("numpy").isnan(only_aborted.mean[1:]).all()
+
+    report = run_eval.write_report(trials, tmp_path)
+    assert "| t | vanilla | 4 (1 aborted) | 0.75 [" in report
+    assert "| vanilla (1 aborted)† | 0 | 300 |" in report
+
+
+def test_report_adds_trial_sections_only_for_repeated_trials(tmp_path):
+    run_eval = _import_run_eval()
+    single = _trials(run_eval, "vanilla", [100]) + _trials(run_eval, "sc-full", [200])
+    report = run_eval.write_report(single, tmp_path)
+    assert "## Trials" not in report
+    assert "| t | 1/1 | 1/1 |" in report
+
+    _import_trial_stats()
+    many = _trials(run_eval, "vanilla", [100] * 6) + _trials(
+        run_eval, "sc-full", [200, 210, 190, 205, 195, 200]
+    )
+    report = run_eval.write_report(many, tmp_path)
+    assert "| t | 6/6 | 6/6 |" in report
+    assert "## Trials (per cell)" in report
+    sections = report.split("## Arm differences (vs vanilla)")
+    assert len(sections) == 2
+    diff_row = next(ln for ln in sections[1].splitlines() if ln.startswith("| t |"))
+    assert "| +100 [" in diff_row and "✓" in diff_row
@@ -0,0 +1,194 @@
+"""Tests for guard_dispatch.py, the combined PreToolUse safety hook.
+
+Contract:
+- Each tool runs exactly the guards that apply to it, in one process.
+- Decisions merge strictest-first: block > ask > approve.
+- A guard that raises approves; the others still decide.
+- The output is what the standalone guard would have printed.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from superclaude.scripts import guard_dispatch
+
+DISPATCH_SCRIPT = (
+    Path(__file__).parent.parent.parent
+    / "src"
+    / "superclaude"
+    / "scripts"
+    / "guard_dispatch.py"
+)
+
+ASK = {
+    "hookSpecificOutput": {
+        "hookEventName": "PreToolUse",
+        "permissionDecision": "ask",
+        "permissionDecisionReason": "confirm",
+    }
+}
+
+
+def run_dispatch(payload, project_dir: Path) -> dict:
+    env = os.environ.copy()
+    env["CLAUDE_PROJECT_DIR"] = str(project_dir)
+    for key in (
+        "SUPERCLAUDE_SIZE_GUARD",
+        "SUPERCLAUDE_DESTRUCTIVE_GUARD",
+        "SUPERCLAUDE_LOOP_GUARD",
+    ):
+        env.pop(key, None)
+    result = subprocess.run(
+        [sys.executable, str(DISPATCH_SCRIPT)],
+        input=payload if isinstance(payload, str) else json.dumps(payload),
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    assert result.returncode == 0, f"dispatcher crashed: {result.stderr}"
+    return json.loads(result.stdout)
+
+
+def pre(tool_name: str, **tool_input) -> dict:
+    return {
+        "hook_event_name": "PreToolUse",
+        "tool_name": tool_name,
+        "tool_input": tool_input,
+    }
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    (tmp_path / ".claude" / "superclaude").mkdir(parents=True)
+    return tmp_path
+
+
+@pytest.fixture
+def fake_guards(monkeypatch):
+    """Replace the guard table with stubs returning the given decisions."""
+
+    def install(tool_name, *decisions):
+        modules = []
+        for i, decision in enumerate(decisions):
+            name = f"fake_guard_{i}"
+
+            class Guard:
+                @staticmethod
+                def evaluate(data, decision=decision):
+                    if isinstance(decision, Exception):
+                        raise decision
+                    return decision
+
+            monkeypatch.setitem(sys.modules, name, Guard)
+            modules.append(name)
+        monkeypatch.setitem(guard_dispatch.GUARDS, tool_name, tuple(modules))
+
+    return install
+
+
+class TestMerge:
+    def test_block_beats_ask(self, fake_guards):
+        block = {"decision": "block", "reason": "no"}
+        fake_guards("Bash", ASK, block, {"decision": "approve"})
+
+        assert guard_dispatch.dispatch({"tool_name": "Bash"}) == block
+
+    def test_ask_beats_approve(self, fake_guards):
+        fake_guards("Bash", {"decision": "approve"}, ASK)
+
+        assert guard_dispatch.dispatch({"tool_name": "Bash"}) == ASK
+
+    def test_first_of_equal_strength_wins(self, fake_guards):
+        first = {"decision": "block", "reason": "first"}
+        fake_guards("Bash", first, {"decision": "block", "reason": "second"})
+
+        assert guard_dispatch.dispatch({"tool_name": "Bash"})["reason"] == "first"
+
+    def test_raising_guard_fails_open_alone(self, fake_guards):
+        block = {"decision": "block", "reason": "still enforced"}
+        fake_guards("Bash", RuntimeError("boom"), block)
+
+        assert guard_dispatch.dispatch({"tool_name": "Bash"}) == block
+
+    def test_unguarded_tool_approves(self):
+        assert guard_dispatch.dispatch({"tool_name": "Glob"}) == {"decision": "approve"}
+
+
+class TestRealGuards:
+    def test_destructive_bash_is_blocked(self, project_dir):
+        result = run_dispatch(pre("Bash", command="rm -rf /"), project_dir)
+        assert result["decision"] == "block"
+
+    def test_risky_bash_asks(self, project_dir):
+        result = run_dispatch(pre("Bash", command="git reset --hard"), project_dir)
+        assert result["hookSpecificOutput"]["permissionDecision"] == "ask"
+
+    def test_large_read_is_blocked(self, project_dir):
+        big = project_dir / "big.py"
+        big.write_bytes(b"x" * 40_000)
+
+        result = run_dispatch(pre("Read", file_path=str(big)), project_dir)
+        assert result["decision"] == "block"
+        assert "30KB" in result["reason"]
+
+    def test_looping_edit_is_blocked(self, project_dir):
+        loop_guard = DISPATCH_SCRIPT.with_name("loop_guard.py")
+        failed = {
+            "hook_event_name": "PostToolUse",
+            "tool_name": "Edit",
+            "tool_input": {"file_path": "foo.py"},
+            "tool_response": {"error": "string not found"},
+        }
+        env = {**os.environ, "CLAUDE_PROJECT_DIR": str(project_dir)}
+        env.pop("SUPERCLAUDE_LOOP_GUARD", None)
+        for _ in range(5):
+            subprocess.run(
+                [sys.executable, str(loop_guard)],
+                input=json.dumps(failed),
+                capture_output=True,
+                text=True,
+                env=env,
+                check=True,
+            )
+
+        result = run_dispatch(pre("Edit", file_path="foo.py"), project_dir)
+        assert result["decision"] == "block"
+        assert "circuit breaker" in result["reason"].lower()
+
+    def test_plain_calls_approve(self, project_dir):
+        assert run_dispatch(pre("Bash", command="ls"), project_dir) == {
+            "decision": "approve"
+        }
+        assert run_dispatch(pre("Write", file_path="x.py"), project_dir) == {
+            "decision": "approve"
+        }
+
+    @pytest.mark.parametrize("stdin", ["", "not json", "[1, 2]"])
+    def test_bad_input_approves(self, project_dir, stdin):
+        assert run_dispatch(stdin, project_dir) == {"decision": "approve"}
+
+
+class TestRegistration:
+    def test_one_pretooluse_entry_covers_every_guarded_tool(self):
+        hooks_json = DISPATCH_SCRIPT.parents[1] / "hooks" / "hooks.json"
+        pre_entries = json.loads(hooks_json.read_text(encoding="utf-8"))["hooks"][
+            "PreToolUse"
+        ]
+        commands = [
+            (entry.get("matcher"), hook["command"])
+            for entry in pre_entries
+            for hook in entry["hooks"]
+        ]
+
+        assert commands == [
+            (
+                "Read|Edit|Write|Bash",
+                "{{PYTHON_BIN}} {{SCRIPTS_PATH}}/guard_dispatch.py",
+            )
+        ]
+        assert set(guard_dispatch.GUARDS) == {"Read", "Edit", "Write", "Bash"}
@@ -0,0 +1,204 @@
+"""Tests for the opt-in hook daemon and its client shim.
+
+Contract:
+- The daemon runs served scripts' main() in-process and returns exactly what the
+  subprocess would have printed, per request, with that hook's environment.
+- hook_client.py replays the daemon's reply, and with no daemon listening, or
+  one busy with another hook, runs the script itself — the hook never depends
+  on the daemon being up.
+- `install --hook-daemon` routes only the served hooks through the shim, and the
+  shim is invisible to hook identity (merge, drift).
+"""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from superclaude.cli.install_components import route_hooks_through_daemon
+from superclaude.cli.install_settings import _hook_script_id
+from superclaude.hooks import hookd
+
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "src" / "superclaude" / "scripts"
+CLIENT = SCRIPTS_DIR / "hook_client.py"
+
+needs_unix_sockets = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="hook daemon needs AF_UNIX"
+)
+
+FORCE_PUSH = {
+    "hook_event_name": "PreToolUse",
+    "tool_name": "Bash",
+    "tool_input": {"command": "git push -f origin main"},
+}
+
+
+def run_client(
+    script: str, payload: dict, project: Path
+) -> subprocess.CompletedProcess:
+    env = os.environ.copy()
+    env["CLAUDE_PROJECT_DIR"] = str(project)
+    env.pop("SUPERCLAUDE_DESTRUCTIVE_GUARD", None)
+    return subprocess.run(
+        [sys.executable, str(CLIENT), str(SCRIPTS_DIR / script)],
+        input=json.dumps(payload),
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+
+
+def ask(path: Path, request: dict) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(5)
+        conn.connect(str(path))
+        conn.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        return json.loads(conn.makefile("rb").readline())
+
+
+class TestRunHook:
+    def test_returns_what_the_script_prints(self):
+        reply = hookd.run_hook("guard_dispatch", [], json.dumps(FORCE_PUSH), {})
+        assert reply["exit"] == 0
+        assert json.loads(reply["stdout"])["decision"] == "block"
+
+    def test_hook_env_applies_for_the_call_only(self, monkeypatch):
+        monkeypatch.delenv("SUPERCLAUDE_DESTRUCTIVE_GUARD", raising=False)
+        reply = hookd.run_hook(
+            "guard_dispatch",
+            [],
+            json.dumps(FORCE_PUSH),
+            {"SUPERCLAUDE_DESTRUCTIVE_GUARD": "0"},
+        )
+        assert json.loads(reply["stdout"])["decision"] == "approve"
+        assert "SUPERCLAUDE_DESTRUCTIVE_GUARD" not in os.environ
+
+    def test_daemon_env_absent_from_the_hook_is_hidden(self, monkeypatch):
+        monkeypatch.setenv("SUPERCLAUDE_DESTRUCTIVE_GUARD", "0")
+        reply = hookd.run_hook("guard_dispatch", [], json.dumps(FORCE_PUSH), {})
+        assert json.loads(reply["stdout"])["decision"] == "block"
+        assert os.environ["SUPERCLAUDE_DESTRUCTIVE_GUARD"] == "0"
+
+    def test_unserved_script_is_refused(self):
+        reply = hookd.run_hook("session_init", [], "", {})
+        assert reply["served"] is False
+
+
+@needs_unix_sockets
+class TestDaemonRoundTrip:
+    @pytest.fixture
+    def daemon(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+        server = hookd.create_server(idle_timeout=5)
+        thread = threading.Thread(
+            target=hookd.serve_until_stopped, args=(server,), daemon=True
+        )
+        thread.start()
+        yield server
+        hookd.send_control("shutdown", Path(server.server_address))
+        thread.join(timeout=5)
+        server.server_close()
+
+    def test_ping(self, daemon):
+        reply = hookd.send_control("ping", Path(daemon.server_address))
+        assert reply == {"ok": True, "pid": os.getpid()}
+
+    def test_client_goes_through_the_daemon(self, daemon, tmp_path):
+        result = run_client("guard_dispatch.py", FORCE_PUSH, tmp_path)
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout)["decision"] == "block"
+
+    def test_requests_are_accepted_while_a_hook_runs(self, daemon, monkeypatch):
+        started, release = threading.Event(), threading.Event()
+
+        def slow_hook(*args):
+            started.set()
+            release.wait(5)
+            return {"stdout": "", "stderr": "", "exit": 0}
+
+        monkeypatch.setattr(hookd, "run_hook", slow_hook)
+        monkeypatch.setattr(hookd, "RUN_WAIT_SECONDS", 0.05)
+        path = Path(daemon.server_address)
+        first = threading.Thread(target=ask, args=(path, {"script": "loop_guard"}))
+        first.start()
+        try:
+            assert started.wait(5)
+            assert hookd.send_control("ping", path)["ok"]
+            assert ask(path, {"script": "loop_guard"}) == {
+                "served": False,
+                "busy": True,
+            }
+        finally:
+            release.set()
+            first.join(5)
+
+    def test_busy_daemon_leaves_the_guard_to_the_client(
+        self, daemon, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr(hookd, "RUN_WAIT_SECONDS", 0.05)
+        with hookd._RUN_LOCK:
+            result = run_client("guard_dispatch.py", FORCE_PUSH, tmp_path)
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout)["decision"] == "block"
+
+    def test_idle_daemon_exits(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+        server = hookd.create_server(idle_timeout=0)
+        try:
+            hookd.serve_until_stopped(server)
+        finally:
+            server.server_close()
+        assert server.stopping
+
+    def test_second_daemon_on_a_live_socket_is_refused(self, daemon):
+        with pytest.raises(hookd.HookdError):
+            hookd.create_server(Path(daemon.server_address))
+
+    def test_stale_socket_is_replaced(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+        first = hookd.create_server()
+        first.server_close()  # socket file left behind, nothing listening
+        second = hookd.create_server()
+        second.server_close()
+
+
+class TestClientFallback:
+    def test_no_daemon_runs_the_script_itself(self, tmp_path):
+        result = run_client("destructive_guard.py", FORCE_PUSH, tmp_path)
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout)["decision"] == "block"
+
+    def test_no_daemon_approve_passes_through(self, tmp_path):
+        payload = {"hook_event_name": "PreToolUse", "tool_input": {}}
+        result = run_client("file_size_guard.py", payload, tmp_path)
+        assert json.loads(result.stdout)["decision"] == "approve"
+
+
+class TestInstallerRouting:
+    def test_only_served_scripts_are_routed(self):
+        raw = (SCRIPTS_DIR.parent / "hooks" / "hooks.json").read_text(encoding="utf-8")
+        routed = json.loads(route_hooks_through_daemon(raw))
+        commands = [
+            hook["command"]
+            for array in routed["hooks"].values()
+            for entry in array
+            for hook in entry["hooks"]
+        ]
+        via_client = [c for c in commands if "hook_client.py" in c]
+        assert {c.rsplit("/", 1)[1] for c in via_client} == {
+            f"{stem}.py" for stem in hookd.SERVED_SCRIPTS
+        }
+        assert not any("session_init.py" in c for c in via_client)
+
+    def test_client_shim_is_invisible_to_hook_identity(self):
+        direct = {"command": "python /x/superclaude/scripts/loop_guard.py"}
+        routed = {
+            "command": "python /x/superclaude/scripts/hook_client.py "
+            "/x/superclaude/scripts/loop_guard.py"
+        }
+        assert _hook_script_id(routed) == _hook_script_id(direct)
@@ -0,0 +1,161 @@
+"""Tests for the sidecar index behind insight_writer's read paths.
+
+Contract:
+- Lookups return what a full scan of insights.jsonl would, in file order.
+- Appends are indexed incrementally; a rewritten history is rebuilt.
+- A missing or corrupt sidecar is rebuilt, never trusted.
+- An append costs the appended lines, not a rewrite of the sidecar.
+"""
+
+import json
+import sqlite3
+
+from superclaude.scripts import insight_index
+from superclaude.scripts.insight_index import InsightIndex
+
+
+def _write(path, entries, mode="w"):
+    with path.open(mode, encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+def _entries():
+    return [
+        {"ts": "t1", "type": "feedback", "insight": "a", "tags": ["x", "y", "x"]},
+        {"ts": "t2", "type": "discovery", "insight": "b", "author": "bo"},
+        {"ts": "t1", "type": "annotation", "insight": "c", "ref_ts": "t1"},
+    ]
+
+
+def _open(tmp_path):
+    return InsightIndex.open(tmp_path / "insights.jsonl", tmp_path / "idx.sqlite3")
+
+
+def _sidecar_rows(tmp_path, sql):
+    conn = sqlite3.connect(tmp_path / "idx.sqlite3")
+    try:
+        return conn.execute(sql).fetchall()
+    finally:
+        conn.close()
+
+
+class TestLookups:
+    def test_postings_match_a_scan(self, tmp_path):
+        _write(tmp_path / "insights.jsonl", _entries())
+        index = _open(tmp_path)
+
+        assert len(index) == 3
+        assert index.lookup("type", "feedback") == [0]
+        assert index.lookup("tags", "x") == [0]
+        assert index.lookup("author", "bo") == [1]
+        assert [d["insight"] for d in index.entries(index.lookup("ts", "t1"))] == [
+            "a",
+            "c",
+        ]
+        assert index.lookup("type", "metric") == []
+
+    def test_last_reads_only_the_tail(self, tmp_path):
+        _write(tmp_path / "insights.jsonl", _entries())
+
+        assert [d["insight"] for d in _open(tmp_path).last(2)] == ["b", "c"]
+        assert [d["insight"] for d in _open(tmp_path).last(10)] == ["a", "b", "c"]
+
+    def test_counts_keep_first_appearance_order(self, tmp_path):
+        _write(tmp_path / "insights.jsonl", _entries())
+
+        assert _open(tmp_path).counts("type") == {
+            "feedback": 1,
+            "discovery": 1,
+            "annotation": 1,
+        }
+
+    def test_malformed_lines_are_skipped(self, tmp_path):
+        path = tmp_path / "insights.jsonl"
+        path.write_text('not json\n[1]\n{"type": "pattern"}\n', encoding="utf-8")
+
+        index = _open(tmp_path)
+        assert len(index) == 1
+        assert next(index.scan()) == {"type": "pattern"}
+
+
+class TestFreshness:
+    def test_appends_are_indexed_incrementally(self, tmp_path):
+        path = tmp_path / "insights.jsonl"
+        _write(path, _entries()[:1])
+        _open(tmp_path).close()
+        before = _sidecar_rows(tmp_path, "SELECT rowid, * FROM lines")
+
+        _write(path, _entries()[1:], mode="a")
+        index = _open(tmp_path)
+
+        assert len(index) == 3
+        after = _sidecar_rows(tmp_path, "SELECT rowid, * FROM lines")
+        assert after[:1] == before  # extended, not rebuilt
+        (mark,) = _sidecar_rows(tmp_path, "SELECT value FROM mark")[0]
+        assert json.loads(mark)["end"] == path.stat().st_size
+
+    def test_an_up_to_date_open_writes_nothing(self, tmp_path):
+        _write(tmp_path / "insights.jsonl", _entries())
+        _open(tmp_path).close()
+        sidecar = tmp_path / "idx.sqlite3"
+        stamp = sidecar.stat().st_mtime_ns, sidecar.stat().st_size
+
+        index = _open(tmp_path)
+        assert index.refresh() is False
+        index.close()
+        assert (sidecar.stat().st_mtime_ns, sidecar.stat().st_size) == stamp
+
+    def test_rewritten_history_is_rebuilt(self, tmp_path):
+        path = tmp_path / "insights.jsonl"
+        _write(path, _entries())
+        _open(tmp_path)
+
+        # Same size, same inode, different first entry ("feedback" and
+        # "patterns" are both 8 bytes): only the head digest can tell
+        _write(path, [{**_entries()[0], "type": "patterns"}] + _entries()[1:])
+        index = _open(tmp_path)
+
+        assert index.lookup("type", "patterns") == [0]
+        assert index.lookup("type", "feedback") == []
+
+    def test_unfinished_last_line_waits(self, tmp_path):
+        path = tmp_path / "insights.jsonl"
+        _write(path, _entries()[:1])
+        with path.open("a", encoding="utf-8") as f:
+            f.write('{"type": "metric"')
+
+        assert len(_open(tmp_path)) == 1
+        with path.open("a", encoding="utf-8") as f:
+            f.write(', "insight": "m"}\n')
+        assert _open(tmp_path).lookup("type", "metric") == [1]
+
+    def test_corrupt_sidecar_is_rebuilt(self, tmp_path):
+        _write(tmp_path / "insights.jsonl", _entries())
+        (tmp_path / "idx.sqlite3").write_text("{broken", encoding="utf-8")
+
+        assert len(_open(tmp_path)) == 3
+
+    def test_missing_history_is_empty(self, tmp_path):
+        assert len(_open(tmp_path)) == 0
+
+
+class TestWithoutSqlite:
+    def test_memory_index_answers_the_same(self, tmp_path, monkeypatch):
+        _write(tmp_path / "insights.jsonl", _entries())
+        with _open(tmp_path) as stored:
+            expected = (
+                len(stored),
+                stored.lookup("ts", "t1"),
+                stored.counts("type"),
+                [d["insight"] for d in stored.last(2)],
+            )
+
+        monkeypatch.setattr(insight_index, "sqlite3", None)
+        memory = _open(tmp_path)
+        assert (
+            len(memory),
+            memory.lookup("ts", "t1"),
+            memory.counts("type"),
+            [d["insight"] for d in memory.last(2)],
+        ) == expected
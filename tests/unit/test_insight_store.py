@@ -0,0 +1,196 @@
+"""Tests for the SQLite search mirror behind insight_writer search.
+
+Contract:
+- Search returns what the JSONL holds: appends are synced incrementally, a
+  rewritten file is re-copied, a deleted one is dropped.
+- Every word must match; the best bm25 rank comes first.
+- User text never reaches FTS5 query syntax.
+- A store from another schema, or a corrupt one, is rebuilt.
+"""
+
+import json
+import sqlite3
+
+from superclaude.scripts import insight_store
+from superclaude.scripts.insight_store import INSIGHTS, PENDING, open_store
+
+
+def _write(path, entries, mode="w"):
+    with path.open(mode, encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+def _open(tmp_path):
+    return open_store(
+        tmp_path / "store.sqlite3",
+        {INSIGHTS: tmp_path / "insights.jsonl", PENDING: tmp_path / "pending.jsonl"},
+    )
+
+
+def _open_unsynced(tmp_path):
+    return insight_store.InsightStore(
+        insight_store._connect(tmp_path / "store.sqlite3")
+    )
+
+
+def _texts(results):
+    return [entry.get("insight") or entry.get("raw_text") for _, entry in results]
+
+
+class TestSearch:
+    def test_all_words_required_best_rank_first(self, tmp_path):
+        _write(
+            tmp_path / "insights.jsonl",
+            [
+                {
+                    "ts": "t1",
+                    "type": "discovery",
+                    "insight": "cache miss on cold start",
+                },
+                {"ts": "t2", "type": "feedback", "insight": "cache cache cache miss"},
+                {"ts": "t3", "type": "feedback", "insight": "cold coffee"},
+            ],
+        )
+        with _open(tmp_path) as store:
+            assert _texts(store.search("cache miss")) == [
+                "cache cache cache miss",
+                "cache miss on cold start",
+            ]
+            assert _texts(store.search("cold cache")) == ["cache miss on cold start"]
+
+    def test_filters(self, tmp_path):
+        _write(
+            tmp_path / "insights.jsonl",
+            [
+                {
+                    "ts": "2026-01-05",
+                    "type": "pattern",
+                    "insight": "hook",
+                    "tags": ["a"],
+                },
+                {
+                    "ts": "2026-03-05",
+                    "type": "metric",
+                    "insight": "hook",
+                    "tags": ["b"],
+                },
+            ],
+        )
+        with _open(tmp_path) as store:
+            assert [e["ts"] for _, e in store.search("hook", type="metric")] == [
+                "2026-03-05"
+            ]
+            assert [e["ts"] for _, e in store.search("hook", tag="a")] == ["2026-01-05"]
+            assert [e["ts"] for _, e in store.search("hook", since="2026-02")] == [
+                "2026-03-05"
+            ]
+            assert len(store.search("hook", limit=1)) == 1
+
+    def test_query_syntax_is_quoted(self, tmp_path):
+        _write(tmp_path / "insights.jsonl", [{"insight": 'NOT a "problem": x-y'}])
+        with _open(tmp_path) as store:
+            assert len(store.search('NOT "problem": x-y')) == 1
+            assert store.search("   ") == []
+
+    def test_pending_rows_are_separate(self, tmp_path):
+        _write(tmp_path / "insights.jsonl", [{"ts": "t1", "insight": "shared word"}])
+        _write(
+            tmp_path / "pending.jsonl",
+            [{"raw_text": "shared marker", "harvested_at": "t2"}],
+        )
+        with _open(tmp_path) as store:
+            assert _texts(store.search("shared")) == ["shared word"]
+            results = store.search("shared marker", sources=(INSIGHTS, PENDING))
+            assert [source for source, _ in results] == [PENDING]
+
+
+class TestSync:
+    def test_appends_copy_only_new_lines(self, tmp_path):
+        path = tmp_path / "insights.jsonl"
+        _write(path, [{"insight": "one"}])
+        _open(tmp_path).close()
+
+        _write(path, [{"insight": "two"}], mode="a")
+        with _open(tmp_path) as store:
+            assert store.sync(INSIGHTS, path) == 0
+            count = store.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            assert count == 2
+            assert _texts(store.search("two")) == ["two"]
+
+    def test_rewritten_file_is_recopied(self, tmp_path):
+        pending = tmp_path / "pending.jsonl"
+        _write(pending, [{"raw_text": "alpha"}, {"raw_text": "beta"}])
+        _open(tmp_path).close()
+
+        _write(pending, [{"raw_text": "beta"}])  # promote removed alpha
+        with _open(tmp_path) as store:
+            sources = (PENDING,)
+            assert store.search("alpha", sources=sources) == []
+            assert _texts(store.search("beta", sources=sources)) == ["beta"]
+
+    def test_deleted_file_is_dropped(self, tmp_path):
+        pending = tmp_path / "pending.jsonl"
+        _write(pending, [{"raw_text": "gone"}])
+        _open(tmp_path).close()
+
+        pending.unlink()
+        with _open(tmp_path) as store:
+            assert store.search("gone", sources=(PENDING,)) == []
+
+    def test_concurrent_syncs_copy_appended_lines_once(self, tmp_path, monkeypatch):
+        path = tmp_path / "insights.jsonl"
+        _write(path, [{"insight": "one"}])
+        _open(tmp_path).close()
+        _write(path, [{"insight": "two"}], mode="a")
+        first, second = _open_unsynced(tmp_path), _open_unsynced(tmp_path)
+
+        real = insight_store.read_appended
+        raced = []
+
+        def other_process_syncs_meanwhile(*args):
+            # The first store has seen the old mark; the second one syncs now.
+            if not raced:
+                raced.append(True)
+                second.sync(INSIGHTS, path)
+            return real(*args)
+
+        monkeypatch.setattr(
+            insight_store, "read_appended", other_process_syncs_meanwhile
+        )
+        try:
+            first.sync(INSIGHTS, path)
+            count = first.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        finally:
+            first.close()
+            second.close()
+        assert raced
+        assert count == 2
+
+    def test_an_up_to_date_open_writes_nothing(self, tmp_path):
+        _write(tmp_path / "insights.jsonl", [{"insight": "one"}])
+        _open(tmp_path).close()
+        db = tmp_path / "store.sqlite3"
+        before = (db.stat().st_mtime_ns, db.stat().st_size)
+
+        _open(tmp_path).close()
+
+        assert (db.stat().st_mtime_ns, db.stat().st_size) == before
+
+    def test_corrupt_store_is_rebuilt(self, tmp_path):
+        _write(tmp_path / "insights.jsonl", [{"insight": "kept"}])
+        (tmp_path / "store.sqlite3").write_bytes(b"not a database" * 100)
+
+        with _open(tmp_path) as store:
+            assert _texts(store.search("kept")) == ["kept"]
+
+    def test_other_schema_version_is_rebuilt(self, tmp_path):
+        _write(tmp_path / "insights.jsonl", [{"insight": "kept"}])
+        conn = sqlite3.connect(tmp_path / "store.sqlite3")
+        conn.execute("CREATE TABLE entries (junk)")
+        conn.execute(f"PRAGMA user_version = {insight_store.SCHEMA_VERSION + 1}")
+        conn.commit()
+        conn.close()
+
+        with _open(tmp_path) as store:
+            assert _texts(store.search("kept")) == ["kept"]
@@ -397,6 +397,90 @@ class TestReviewPromote:
         assert rc == 2
         assert "out of range" in capsys.readouterr().err
 
+    def _seed_pending(self, workdir, entries):
+        path = workdir / ".claude" / "insights.pending.jsonl"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            "".join(json.dumps(e) + "\n" for e in entries), encoding="utf-8"
+        )
+        return path
+
+    def _promote(self, **opts):
+        import argparse
+
+        ns = {"index": None, "ids": None, "all": False, "filter": None}
+        ns.update(type="pattern", insight=None, tags=None)
+        return iw.cmd_promote(argparse.Namespace(**{**ns, **opts}))
+
+    def _promoted(self, workdir):
+        path = workdir / ".claude" / "insights.jsonl"
+        if not path.exists():
+            return []
+        return [json.loads(line)["insight"] for line in path.read_text().splitlines()]
+
+    def test_batch_modes_promote_in_one_pass(self, workdir, monkeypatch):
+        path = self._seed_pending(
+            workdir,
+            [
+                {"raw_text": "a", "uuid": "u1:aa", "source": "SessionEnd"},
+                {"raw_text": "b", "uuid": "u2:bb", "source": "PreCompact"},
+                {"raw_text": "c", "uuid": "u3:cc", "source": "SessionEnd"},
+                {"raw_text": "d", "uuid": "u4:dd", "source": "Stop"},
+            ],
+        )
+        appends = []
+        real_append = iw.cmd_append
+        monkeypatch.setattr(
+            iw, "cmd_append", lambda ns: appends.append(ns) or real_append(ns)
+        )
+
+        assert self._promote(ids="2,u1:aa") == 0
+        assert self._promoted(workdir) == ["a", "c"]
+        assert len(appends) == 1
+        assert self._promote(filter="source=PreCompact", tags="x,y") == 0
+        assert json.loads(path.read_text())["raw_text"] == "d"
+        assert self._promote(all=True) == 0
+        assert self._promoted(workdir) == ["a", "c", "b", "d"]
+        assert not path.exists()
+
+    def test_promoted_entries_can_each_be_annotated(self, workdir, monkeypatch):
+        self._seed_pending(workdir, [{"raw_text": "a"}, {"raw_text": "b"}])
+        frozen = iw._dt.datetime(2026, 5, 1, 12, 0, 0).astimezone()
+
+        class FrozenClock(iw._dt.datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return frozen
+
+        monkeypatch.setattr(iw._dt, "datetime", FrozenClock)
+        assert self._promote(all=True) == 0
+        self._seed_pending(workdir, [{"raw_text": "c"}])
+        assert self._promote(index=0) == 0  # still the same second
+
+        path = workdir / ".claude" / "insights.jsonl"
+        stamps = [json.loads(line)["ts"] for line in path.read_text().splitlines()]
+        assert len(set(stamps)) == 3
+        assert stamps[0] == iw._iso(frozen)
+
+    def test_bad_ids_change_nothing(self, workdir, capsys):
+        path = self._seed_pending(workdir, [{"raw_text": "a"}, {"raw_text": "b"}])
+        before = path.read_text()
+
+        assert self._promote(ids="0,7") == 2
+        assert "'7'" in capsys.readouterr().err
+        assert self._promote(filter="no-equals") == 2
+        assert self._promote(all=True, insight="one text for all") == 2
+        assert path.read_text() == before
+        assert self._promoted(workdir) == []
+
+    def test_batch_skips_empty_markers(self, workdir, capsys):
+        path = self._seed_pending(workdir, [{"raw_text": " "}, {"raw_text": "b"}])
+
+        assert self._promote(all=True) == 0
+        assert "skipped entry 0" in capsys.readouterr().err
+        assert self._promoted(workdir) == ["b"]
+        assert json.loads(path.read_text()) == {"raw_text": " "}
+
     def test_pending_count_zero_silent(self, workdir, capsys):
         import argparse
 
@@ -427,21 +511,207 @@ class TestReviewPromote:
         assert "pending insight" in out
 
 
-# ---------- jq error path ----------
+# ---------- read paths (no jq) ----------
+
 
+class TestReadPaths:
+    """list/query/stats answer in-process from the index; jq is not needed."""
 
-class TestJqRequired:
-    def test_list_errors_when_jq_missing(self, workdir, monkeypatch, capsys):
-        # Simulate jq missing on PATH
+    @pytest.fixture(autouse=True)
+    def no_jq(self, monkeypatch):
         monkeypatch.setattr(shutil, "which", lambda name: None)
-        # Need at least one entry so we hit the jq path
-        _run_append(json.dumps({"type": "feedback", "insight": "x"}))
+
+    def _seed(self):
+        _run_append(
+            json.dumps(
+                [
+                    {
+                        "ts": "2026-01-01T00:00:00+00:00",
+                        "type": "feedback",
+                        "insight": "first",
+                        "author": "ann",
+                        "tags": ["rules", "cache"],
+                    },
+                    {
+                        "ts": "2026-01-02T00:00:00+00:00",
+                        "type": "discovery",
+                        "insight": "second",
+                        "author": "bo",
+                        "tags": ["cache"],
+                        "area": "hooks",
+                    },
+                    {
+                        "ts": "2026-01-03T00:00:00+00:00",
+                        "type": "feedback",
+                        "insight": "third",
+                        "author": "ann",
+                    },
+                ]
+            )
+        )
+
+    def test_list_prints_the_newest_in_jq_format(self, workdir, capsys):
+        import argparse
+
+        self._seed()
+        capsys.readouterr()
+        assert iw.cmd_list(argparse.Namespace(limit=2)) == 0
+        assert capsys.readouterr().out.splitlines() == [
+            "2026-01-02T00:00:00+00:00 [bo] [discovery] second",
+            "2026-01-03T00:00:00+00:00 [ann] [feedback] third",
+        ]
+
+    @pytest.mark.parametrize(
+        "expr, expected",
+        [
+            ("type=feedback", ["first", "third"]),
+            ("tags=cache", ["first", "second"]),
+            ("author=bo", ["second"]),
+            ("area=hooks", ["second"]),
+            ("type=metric", []),
+        ],
+    )
+    def test_query(self, workdir, capsys, expr, expected):
+        import argparse
+
+        self._seed()
+        capsys.readouterr()
+        assert iw.cmd_query(argparse.Namespace(expr=expr)) == 0
+        out = capsys.readouterr().out
+        assert re.findall(r'"insight": "(\w+)"', out) == expected
+
+    def test_stats_excludes_annotations_unless_all(self, workdir, capsys):
+        import argparse
+
+        self._seed()
+        _run_append(
+            json.dumps(
+                {
+                    "type": "annotation",
+                    "insight": "note",
+                    "ref_ts": "2026-01-01T00:00:00+00:00",
+                }
+            )
+        )
+        capsys.readouterr()
+        iw.cmd_stats(argparse.Namespace(all=False))
+        out = capsys.readouterr().out
+        assert "     2  feedback" in out and "Total: 3" in out
+        iw.cmd_stats(argparse.Namespace(all=True))
+        assert "Total: 4" in capsys.readouterr().out
+
+
+class TestSearch:
+    """search ranks through the SQLite store and degrades to a scan without it."""
+
+    def _seed(self):
+        _run_append(
+            json.dumps(
+                [
+                    {
+                        "ts": "2026-01-01T00:00:00+00:00",
+                        "type": "discovery",
+                        "insight": "retry the flaky network test once",
+                        "tags": ["ci"],
+                    },
+                    {
+                        "ts": "2026-02-01T00:00:00+00:00",
+                        "type": "feedback",
+                        "insight": "flaky flaky flaky network suite",
+                    },
+                    {
+                        "ts": "2026-03-01T00:00:00+00:00",
+                        "type": "feedback",
+                        "insight": "unrelated",
+                    },
+                ]
+            )
+        )
+
+    def _search(self, capsys, terms, **opts):
         import argparse
 
-        with pytest.raises(SystemExit) as exc:
-            iw.cmd_list(argparse.Namespace(limit=20))
-        assert exc.value.code == 1
-        assert "jq not found" in capsys.readouterr().err
+        opts = {"type": None, "tag": None, "since": None, "limit": 20, **opts}
+        ns = argparse.Namespace(terms=terms, pending=opts.pop("pending", False), **opts)
+        capsys.readouterr()
+        assert iw.cmd_search(ns) == 0
+        captured = capsys.readouterr()
+        self.err = captured.err
+        return captured.out.splitlines()
+
+    def test_ranked_with_filters(self, workdir, capsys):
+        self._seed()
+
+        out = self._search(capsys, "flaky network")
+        assert [line.split("] ")[-1] for line in out] == [
+            "flaky flaky flaky network suite",
+            "retry the flaky network test once",
+        ]
+        assert len(self._search(capsys, "flaky", type="discovery")) == 1
+        assert len(self._search(capsys, "flaky", tag="ci")) == 1
+        assert len(self._search(capsys, "flaky", since="2026-02")) == 1
+        assert self._search(capsys, "absent") == ["(no matches)"]
+
+    def test_pending_markers_are_opt_in(self, workdir, capsys):
+        self._seed()
+        pending = workdir / ".claude" / "insights.pending.jsonl"
+        pending.write_text(
+            json.dumps({"raw_text": "flaky marker", "harvested_at": "2026-04-01"})
+            + "\n",
+            encoding="utf-8",
+        )
+
+        assert self._search(capsys, "marker") == ["(no matches)"]
+        assert self._search(capsys, "marker", pending=True) == [
+            "2026-04-01 [pending] flaky marker"
+        ]
+
+    def test_scan_fallback_without_fts5(self, workdir, capsys, monkeypatch):
+        self._seed()
+
+        def unavailable(*args, **kwargs):
+            raise iw.insight_store.InsightStoreUnavailableError("no FTS5")
+
+        monkeypatch.setattr(iw.insight_store, "open_store", unavailable)
+        out = self._search(capsys, "FLAKY", type="feedback")
+        assert [line.split("] ")[-1] for line in out] == [
+            "flaky flaky flaky network suite"
+        ]
+        assert "unranked scan" in self.err
+
+    def test_locked_store_falls_back_to_a_scan(self, workdir, capsys, monkeypatch):
+        self._seed()
+        self._search(capsys, "flaky")  # build the store
+
+        def locked(*args, **kwargs):
+            raise iw.insight_store.sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(iw.insight_store.InsightStore, "search", locked)
+        out = self._search(capsys, "FLAKY", type="feedback")
+        assert [line.split("] ")[-1] for line in out] == [
+            "flaky flaky flaky network suite"
+        ]
+        assert "database is locked" in self.err
+        assert iw._insight_store_file().exists()
+
+    def test_damaged_store_is_dropped_and_rebuilt(self, workdir, capsys, monkeypatch):
+        self._seed()
+        self._search(capsys, "flaky")
+
+        def malformed(*args, **kwargs):
+            raise iw.insight_store.sqlite3.DatabaseError(
+                "database disk image is malformed"
+            )
+
+        with monkeypatch.context() as m:
+            m.setattr(iw.insight_store.InsightStore, "search", malformed)
+            assert len(self._search(capsys, "flaky")) == 2
+        assert "unranked scan" in self.err
+        assert not iw._insight_store_file().exists()
+
+        assert len(self._search(capsys, "flaky")) == 2
+        assert self.err == ""
+        assert iw._insight_store_file().exists()
 
 
 # ---------- harvest-from-hook argv translation (S3) ----------
@@ -1488,3 +1758,122 @@ class TestStopCollectsItsOwnAnswer:
         capsys.readouterr()
 
         assert len(calls) == 1
+
+
+def _user(uuid: str, text: str) -> dict:
+    return {
+        "type": "user",
+        "isMeta": False,
+        "uuid": uuid,
+        "sessionId": "sess1",
+        "message": {"role": "user", "content": text},
+    }
+
+
+def _append_records(path: Path, records: list[dict]) -> None:
+    with path.open("a", encoding="utf-8") as f:
+        for r in records:
+            f.write(json.dumps(r) + "\n")
+
+
+class TestHarvestResumesFromItsCursor:
+    """Each harvest reads only what was appended since the previous one.
+
+    Every PreCompact and SessionEnd used to re-decode the last 5MB, so harvest
+    time grew with the session and a marker older than the window was lost.
+    """
+
+    def test_only_new_records_are_read(self, workdir, monkeypatch):
+        ns, pdir = _harvest(workdir, monkeypatch, "sess1")
+        path = _make_transcript(pdir, "sess1", [_user("u1", "INSIGHT: first one")])
+        iw.cmd_harvest(ns)
+
+        # Rewrite the already-scanned record in place, same length, same inode.
+        # A rescan would file it; a resumed harvest never looks at it again.
+        data = path.read_bytes().replace(b"first one", b"sneaky on")
+        with path.open("r+b") as f:
+            f.write(data)
+        _append_records(path, [_user("u2", "INSIGHT: second one")])
+        iw.cmd_harvest(ns)
+
+        assert _pending_texts(workdir) == ["first one", "second one"]
+
+    def test_markers_past_the_tail_window_are_kept(self, workdir, monkeypatch):
+        ns, pdir = _harvest(workdir, monkeypatch, "sess1")
+        path = _make_transcript(pdir, "sess1", [_user("early", "INSIGHT: early")])
+        iw.cmd_harvest(ns)
+
+        pad = json.dumps(_user("pad", "x" * 1000)) + "\n"
+        with path.open("a", encoding="utf-8") as f:
+            f.write(pad * (iw.TRANSCRIPT_TAIL_BYTES // len(pad) + 100))
+        _append_records(path, [_user("late", "INSIGHT: late")])
+        iw.cmd_harvest(ns)
+
+        assert _pending_texts(workdir) == ["early", "late"]
+
+    def test_a_request_before_the_cursor_still_counts(self, workdir, monkeypatch):
+        ns, pdir = _harvest(workdir, monkeypatch, "sess1")
+        path = _make_transcript(pdir, "sess1", [_user("r1", iw.REQUEST_REASON)])
+        iw.cmd_harvest(ns)
+
+        _append_records(path, [_assistant("a1", "INSIGHT: answered later")])
+        iw.cmd_harvest(ns)
+
+        assert _pending_texts(workdir) == ["answered later"]
+
+    def test_an_unfinished_last_line_is_read_again(self, workdir, monkeypatch):
+        ns, pdir = _harvest(workdir, monkeypatch, "sess1")
+        path = _make_transcript(pdir, "sess1", [])
+        line = json.dumps(_user("u1", "INSIGHT: written in two parts"))
+        with path.open("a", encoding="utf-8") as f:
+            f.write(line[:20])
+        iw.cmd_harvest(ns)
+        with path.open("a", encoding="utf-8") as f:
+            f.write(line[20:] + "\n")
+        iw.cmd_harvest(ns)
+
+        assert _pending_texts(workdir) == ["written in two parts"]
+
+    def test_a_record_appended_during_the_read_keeps_the_cursor(
+        self, workdir, monkeypatch
+    ):
+        ns, pdir = _harvest(workdir, monkeypatch, "sess1")
+        path = _make_transcript(pdir, "sess1", [_user("u1", "INSIGHT: before")])
+        real_cursor = iw._harvest_cursor
+
+        def cursor_then_append(transcript, stat):
+            # Claude Code writes on between harvest's stat and its read
+            _append_records(path, [_user("u2", "INSIGHT: during")])
+            return real_cursor(transcript, stat)
+
+        monkeypatch.setattr(iw, "_harvest_cursor", cursor_then_append)
+        iw.cmd_harvest(ns)
+        monkeypatch.setattr(iw, "_harvest_cursor", real_cursor)
+
+        cursor = iw._harvest_cursor(path, path.stat())
+        assert cursor is not None
+        assert cursor["offset"] == path.stat().st_size
+        assert _pending_texts(workdir) == ["before", "during"]
+
+    def test_a_replaced_transcript_is_read_from_the_start(self, workdir, monkeypatch):
+        ns, pdir = _harvest(workdir, monkeypatch, "sess1")
+        _make_transcript(
+            pdir, "sess1", [_user("u0", "no marker, but a long line " * 10)]
+        )
+        iw.cmd_harvest(ns)
+
+        (pdir / "sess1.jsonl").unlink()
+        _make_transcript(pdir, "sess1", [_user("u1", "INSIGHT: fresh file")])
+        iw.cmd_harvest(ns)
+
+        assert _pending_texts(workdir) == ["fresh file"]
+
+    def test_nothing_new_opens_no_pending_file(self, workdir, monkeypatch):
+        ns, pdir = _harvest(workdir, monkeypatch, "sess1")
+        _make_transcript(pdir, "sess1", [_user("u1", "INSIGHT: once")])
+        iw.cmd_harvest(ns)
+
+        monkeypatch.setattr(
+            iw, "_harvested_ids", lambda *_: pytest.fail("pending file was re-read")
+        )
+        assert iw.cmd_harvest(ns) == 0
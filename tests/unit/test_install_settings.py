@@ -718,6 +718,81 @@ class TestNewlyShippedHookReachesAnExistingInstall:
         assert user_entry in entries
 
 
+class TestUpgradeToGuardDispatch:
+    """An install from before guard_dispatch.py upgrades without --force.
+
+    The three PreToolUse guards it replaces must go; appending the dispatcher
+    beside them ran every guard twice per tool call.
+    """
+
+    SC = "/home/me/.claude/superclaude/scripts"
+    SHIPPED = Path(__file__).resolve().parents[2] / "src/superclaude/hooks/hooks.json"
+
+    def _pre_series_settings(self, user_hook: dict | None = None) -> dict:
+        def entry(matcher: str, script: str, *extra: dict) -> dict:
+            hook = {
+                "type": "command",
+                "command": f"python3 {self.SC}/{script}",
+                "timeout": 5,
+            }
+            return {"matcher": matcher, "hooks": [hook, *extra]}
+
+        return {
+            "hooks": {
+                "PreToolUse": [
+                    entry("Read", "file_size_guard.py"),
+                    entry("Bash", "destructive_guard.py", *filter(None, [user_hook])),
+                    entry("Edit|Write|Bash", "loop_guard.py"),
+                ],
+                "PostToolUse": [entry("Edit|Write|Bash", "loop_guard.py")],
+            }
+        }
+
+    def _upgrade(self, tmp_path: Path, settings: dict) -> dict:
+        from superclaude.cli.install_settings import merge_hooks_to_settings
+
+        base = tmp_path / ".claude"
+        base.mkdir()
+        settings_file = base / "settings.json"
+        settings_file.write_text(json.dumps(settings), encoding="utf-8")
+        shipped = json.loads(self.SHIPPED.read_text(encoding="utf-8"))
+        success, msg = merge_hooks_to_settings(base, shipped, scope="user")
+        assert success is True, msg
+        return json.loads(settings_file.read_text(encoding="utf-8"))["hooks"]
+
+    @staticmethod
+    def _scripts(entries: list) -> list:
+        return [
+            hook["command"].split()[-1].rsplit("/", 1)[-1]
+            for entry in entries
+            for hook in entry["hooks"]
+        ]
+
+    def test_superseded_guards_are_replaced(self, tmp_path):
+        hooks = self._upgrade(tmp_path, self._pre_series_settings())
+        assert self._scripts(hooks["PreToolUse"]) == ["guard_dispatch.py"]
+
+    def test_post_tool_use_loop_guard_is_kept(self, tmp_path):
+        hooks = self._upgrade(tmp_path, self._pre_series_settings())
+        assert self._scripts(hooks["PostToolUse"]).count("loop_guard.py") == 1
+
+    def test_a_user_hook_beside_a_superseded_guard_survives(self, tmp_path):
+        mine = {"type": "command", "command": "python /home/me/audit.py"}
+        hooks = self._upgrade(tmp_path, self._pre_series_settings(user_hook=mine))
+        assert mine in [h for entry in hooks["PreToolUse"] for h in entry["hooks"]]
+        assert "destructive_guard.py" not in self._scripts(hooks["PreToolUse"])
+
+    def test_repeat_upgrade_is_a_no_op(self, tmp_path):
+        from superclaude.cli.install_settings import merge_hooks_to_settings
+
+        self._upgrade(tmp_path, self._pre_series_settings())
+        settings_file = tmp_path / ".claude" / "settings.json"
+        once = settings_file.read_text(encoding="utf-8")
+        shipped = json.loads(self.SHIPPED.read_text(encoding="utf-8"))
+        merge_hooks_to_settings(tmp_path / ".claude", shipped, scope="user")
+        assert settings_file.read_text(encoding="utf-8") == once
+
+
 class TestInnerHookOwnership:
     """Ownership is per inner hook, not per outer entry.
 
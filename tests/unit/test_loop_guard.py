@@ -8,7 +8,9 @@ Contract:
   has accumulated >=5 error entries in the window.
 - Env var SUPERCLAUDE_LOOP_GUARD=0 disables the guard (always approve).
 - Failure modes (bad stdin, write failure, etc.) fail open (approve).
-- State file is scoped to <claude_base>/.superclaude_hooks/loop_guard_<key>.json.
+- State is scoped to <claude_base>/.superclaude_hooks/loop_guard_<key>/, one
+  append-only log per signature; concurrent Posts never lose an error.
+- A legacy loop_guard_<key>.json is migrated into the logs and removed.
 """
 
 import hashlib
@@ -17,6 +19,7 @@ import os
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -84,7 +87,7 @@ def pre_event(tool_name: str, command: str) -> dict:
 
 
 def state_file(project_dir: Path) -> Path:
-    """Resolve loop_guard's state file the same way superclaude.utils does.
+    """Resolve loop_guard's legacy JSON state file the way superclaude.utils does.
 
     Mirrors hook_state_dir() / f"loop_guard_{project_key()}.json" without
     importing the resolvers, which read CLAUDE_PROJECT_DIR from the *test*
@@ -96,6 +99,16 @@ def state_file(project_dir: Path) -> Path:
     return parent / f"loop_guard_{key}.json"
 
 
+def log_dir(project_dir: Path) -> Path:
+    """The per-signature log directory next to the legacy state file."""
+    return state_file(project_dir).with_suffix("")
+
+
+def log_file(project_dir: Path, signature: str) -> Path:
+    digest = hashlib.sha256(signature.encode()).hexdigest()[:32]
+    return log_dir(project_dir) / f"{digest}.log"
+
+
 @pytest.fixture
 def project_dir(tmp_path):
     # The superclaude/ marker makes claude_base() resolve to this tmp project
@@ -266,6 +279,88 @@ class TestSlidingWindow:
         result = run_guard(pre_event("Bash", "make broken"), project_dir)
         assert result["decision"] == "block"
 
+    def test_stale_log_records_expire(self, project_dir):
+        log = log_file(project_dir, "Bash::make broken")
+        log.parent.mkdir(parents=True)
+        old_ts = time.time() - (16 * 60)
+        log.write_text(f"{old_ts:.3f} e\n" * BLOCK_THRESHOLD)
+
+        result = run_guard(pre_event("Bash", "make broken"), project_dir)
+        assert result["decision"] == "approve"
+
+
+class TestAppendOnlyStore:
+    """One log per signature; Post appends, Pre reads one tail."""
+
+    def test_concurrent_failures_are_all_counted(self, project_dir):
+        """Parallel sub-agents failing at once must still trip the breaker.
+
+        With the old read-modify-replace JSON file, racing Posts overwrote each
+        other's records and the count stayed below the threshold.
+        """
+        event = post_event("Bash", "make broken", "undefined symbol xyz")
+        with ThreadPoolExecutor(max_workers=BLOCK_THRESHOLD) as pool:
+            list(
+                pool.map(
+                    lambda _: run_guard(event, project_dir), range(BLOCK_THRESHOLD)
+                )
+            )
+
+        lines = log_file(project_dir, "Bash::make broken").read_text().splitlines()
+        assert len(lines) == BLOCK_THRESHOLD
+        result = run_guard(pre_event("Bash", "make broken"), project_dir)
+        assert result["decision"] == "block"
+
+    def test_success_appends_a_reset_instead_of_rewriting(self, project_dir):
+        run_guard(post_event("Bash", "flaky", "transient error"), project_dir)
+        good = {
+            "hook_event_name": "PostToolUse",
+            "tool_name": "Bash",
+            "tool_input": {"command": "flaky"},
+            "tool_response": {"exit_code": 0, "stdout": "ok"},
+        }
+        run_guard(good, project_dir)
+
+        kinds = [
+            line.split()[1]
+            for line in log_file(project_dir, "Bash::flaky").read_text().splitlines()
+        ]
+        assert kinds == ["e", "ok"]
+
+    def test_success_without_errors_creates_no_log(self, project_dir):
+        good = {
+            "hook_event_name": "PostToolUse",
+            "tool_name": "Bash",
+            "tool_input": {"command": "ls"},
+            "tool_response": {"exit_code": 0, "stdout": "ok"},
+        }
+        run_guard(good, project_dir)
+
+        assert not log_file(project_dir, "Bash::ls").exists()
+
+    def test_legacy_state_is_migrated_once(self, project_dir):
+        state_path = state_file(project_dir)
+        recent_ts = time.time() - 60
+        entry = {"signature": "Bash::make broken", "ts": recent_ts, "kind": "error"}
+        state_path.write_text(json.dumps({"entries": [entry] * 4}))
+
+        run_guard(post_event("Bash", "make broken", "err"), project_dir)
+
+        assert not state_path.exists()
+        result = run_guard(pre_event("Bash", "make broken"), project_dir)
+        assert result["decision"] == "block"
+
+    def test_pre_reads_only_the_tail_of_a_long_log(self, project_dir):
+        """Old history beyond the tail window is never read, however long."""
+        log = log_file(project_dir, "Bash::make broken")
+        log.parent.mkdir(parents=True)
+        now = time.time()
+        # A mangled head, far past what Pre reads, then five recent errors
+        log.write_text("garbage\n" * 10_000 + f"{now:.3f} e\n" * BLOCK_THRESHOLD)
+
+        result = run_guard(pre_event("Bash", "make broken"), project_dir)
+        assert result["decision"] == "block"
+
 
 class TestFailureModes:
     def test_malformed_state_file_approves(self, project_dir):
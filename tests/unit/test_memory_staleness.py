@@ -60,6 +60,21 @@ def test_scan_respects_threshold(tmp_path: Path) -> None:
     assert len(mod.scan_stale_entries(tmp_path, threshold_days=90)) == 0
 
 
+def test_scan_sees_verified_date_edited_in_place(tmp_path: Path) -> None:
+    mod = _load_module()
+    today = date.today()
+    path = _write_memory(tmp_path, "note", (today - timedelta(days=120)).isoformat())
+    assert len(mod.scan_stale_entries(tmp_path, threshold_days=90)) == 1
+    # Re-verifying rewrites the file in place; the cached listing must notice
+    path.write_text(
+        path.read_text(encoding="utf-8").replace(
+            (today - timedelta(days=120)).isoformat(), today.isoformat() + " "
+        ),
+        encoding="utf-8",
+    )
+    assert mod.scan_stale_entries(tmp_path, threshold_days=90) == []
+
+
 def test_scan_handles_missing_directory(tmp_path: Path) -> None:
     mod = _load_module()
     nonexistent = tmp_path / "no_such_dir"
@@ -0,0 +1,121 @@
+"""Tests for the cached projects-directory listings.
+
+Contract:
+- A listing matches what listing the directory would return.
+- While the directory mtime is unchanged, only the rechecked files are stat'ed
+  (all of them by default); a file whose mtime and size are unchanged is
+  never parsed again.
+- A created or removed file (a new directory mtime) forces a rescan.
+"""
+
+import os
+
+from superclaude.scripts import projects_index
+from superclaude.scripts.projects_index import listing
+
+OLD_NS = 1_000_000_000_000_000_000  # a directory mtime well outside the racy window
+
+
+def _settle(directory):
+    """Give directory an old mtime so its listing is trusted."""
+    os.utime(directory, ns=(OLD_NS, OLD_NS))
+
+
+class TestListing:
+    def test_lists_matching_files_only(self, tmp_path):
+        (tmp_path / "a.jsonl").write_text("{}\n")
+        (tmp_path / "b.txt").write_text("x")
+        (tmp_path / ".hidden.jsonl").write_text("{}\n")
+        (tmp_path / "sub.jsonl").mkdir()
+
+        assert set(listing(tmp_path, ".jsonl")) == {"a.jsonl"}
+
+    def test_missing_directory_is_empty(self, tmp_path):
+        assert listing(tmp_path / "nope", ".jsonl") == {}
+
+
+class TestRevalidation:
+    def _parse_counter(self):
+        calls = []
+
+        def parse(path):
+            calls.append(path.name)
+            return {"text": path.read_text()}
+
+        return parse, calls
+
+    def test_unchanged_files_are_not_parsed_again(self, tmp_path):
+        (tmp_path / "m.md").write_text("one")
+        _settle(tmp_path)
+        parse, calls = self._parse_counter()
+
+        listing(tmp_path, ".md", parse=parse, recheck=None)
+        entries = listing(tmp_path, ".md", parse=parse, recheck=None)
+
+        assert calls == ["m.md"]
+        assert entries["m.md"]["text"] == "one"
+
+    def test_edit_in_place_is_seen_by_a_recheck(self, tmp_path):
+        path = tmp_path / "m.md"
+        path.write_text("one")
+        _settle(tmp_path)
+        parse, _ = self._parse_counter()
+        listing(tmp_path, ".md", parse=parse, recheck=None)
+
+        path.write_text("two!")
+        _settle(tmp_path)  # an in-place write leaves the directory alone
+
+        assert listing(tmp_path, ".md", parse=parse, recheck=None)["m.md"]["text"] == (
+            "two!"
+        )
+
+    def test_trusted_listing_does_not_scan(self, tmp_path, monkeypatch):
+        (tmp_path / "a.jsonl").write_text("{}\n")
+        _settle(tmp_path)
+        listing(tmp_path, ".jsonl")
+
+        def no_scan(*args):
+            raise AssertionError("listed a directory whose mtime did not move")
+
+        monkeypatch.setattr(projects_index.os, "scandir", no_scan)
+        assert set(listing(tmp_path, ".jsonl")) == {"a.jsonl"}
+
+    def test_new_file_forces_a_rescan(self, tmp_path):
+        (tmp_path / "a.jsonl").write_text("{}\n")
+        _settle(tmp_path)
+        listing(tmp_path, ".jsonl")
+
+        (tmp_path / "b.jsonl").write_text("{}\n")
+
+        assert set(listing(tmp_path, ".jsonl")) == {"a.jsonl", "b.jsonl"}
+
+    def test_racy_directory_is_rescanned(self, tmp_path, monkeypatch):
+        (tmp_path / "a.jsonl").write_text("{}\n")
+        listing(tmp_path, ".jsonl")  # directory just modified: not trusted
+
+        scans = []
+        real_scandir = os.scandir
+        monkeypatch.setattr(
+            projects_index.os,
+            "scandir",
+            lambda path: scans.append(path) or real_scandir(path),
+        )
+        listing(tmp_path, ".jsonl")
+        assert scans
+
+    def test_default_listing_sees_an_old_file_appended_to(self, tmp_path):
+        for i in range(12):
+            path = tmp_path / f"s{i:02}.jsonl"
+            path.write_text("{}\n")
+            os.utime(path, (1000 + i, 1000 + i))
+        _settle(tmp_path)
+        listing(tmp_path, ".jsonl")
+
+        resumed = tmp_path / "s00.jsonl"  # older than any recheck window
+        with resumed.open("a") as f:
+            f.write("{}\n")
+        os.utime(resumed, (5000, 5000))
+        _settle(tmp_path)
+
+        entry = listing(tmp_path, ".jsonl")["s00.jsonl"]
+        assert entry == {"mtime": 5000 * 10**9, "size": 6}
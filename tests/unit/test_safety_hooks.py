@@ -5,7 +5,7 @@ Covers the previously-untested safety surface flagged by the 2026-06-05 audit
 
   - I1: the destructive-command guard (``destructive_guard.py``), reimplemented
     in Python so it no longer fails open when jq/grep/head are absent.
-  - I2: ``loop_guard._save_state`` atomic write (temp file + ``os.replace``).
+  - I2: ``loop_guard``'s append-only store (one ``O_APPEND`` write per record).
 
 The scripts are standalone hook entry points (invoked as ``python <script>.py``),
 so they are loaded by file path rather than as a package.
@@ -16,6 +16,8 @@ from __future__ import annotations
 import importlib.util
 import io
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -186,38 +188,48 @@ class TestDestructiveGuardWarnTier:
         assert out["decision"] == "approve"
 
 
-class TestLoopGuardAtomicWrite:
-    """I2 — atomic state write stops torn-file corruption under concurrent fan-out."""
+class TestLoopGuardAppendStore:
+    """I2 — appends from concurrent fan-out neither tear nor drop records."""
 
-    def test_save_load_roundtrip(self, tmp_path):
-        p = tmp_path / ".claude" / "loop_guard_state.json"
-        state = {"entries": [{"signature": "Bash::x", "ts": 123.0, "kind": "error"}]}
-        loop_guard._save_state(p, state)
-        assert loop_guard._load_state(p) == state
+    def test_appended_errors_are_counted(self, tmp_path):
+        log = tmp_path / "sig.log"
+        now = time.time()
+        for _ in range(3):
+            loop_guard._append(log, "e", now)
+        assert loop_guard._error_count(log, now) == 3
 
-    def test_no_temp_file_left_behind(self, tmp_path):
-        p = tmp_path / "state.json"
-        loop_guard._save_state(p, {"entries": []})
-        leftovers = list(p.parent.glob(".loop_guard_*"))
-        assert leftovers == []
+    def test_reset_hides_earlier_errors(self, tmp_path):
+        log = tmp_path / "sig.log"
+        now = time.time()
+        loop_guard._append(log, "e", now)
+        loop_guard._append(log, "ok", now)
+        loop_guard._append(log, "e", now)
+        assert loop_guard._error_count(log, now) == 1
 
-    def test_rewrite_replaces_atomically(self, tmp_path):
-        p = tmp_path / "state.json"
-        loop_guard._save_state(
-            p, {"entries": [{"signature": "a", "ts": 1.0, "kind": "error"}]}
-        )
-        loop_guard._save_state(
-            p, {"entries": [{"signature": "b", "ts": 2.0, "kind": "error"}]}
-        )
-        assert loop_guard._load_state(p)["entries"][0]["signature"] == "b"
+    def test_reset_does_not_create_a_log(self, tmp_path):
+        log = tmp_path / "sig.log"
+        loop_guard._append(log, "ok", time.time(), create=False)
+        assert not log.exists()
 
-    def test_written_file_is_always_valid_json(self, tmp_path):
-        p = tmp_path / "state.json"
-        loop_guard._save_state(p, {"entries": []})
-        # A complete, parseable JSON object is always on disk (never a torn write)
-        assert json.loads(p.read_text(encoding="utf-8")) == {"entries": []}
+    def test_concurrent_appends_lose_nothing(self, tmp_path):
+        log = tmp_path / "nested" / "sig.log"
+        now = time.time()
+
+        def burst(_):
+            for _ in range(50):
+                loop_guard._append(log, "e", now)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(burst, range(8)))
+
+        lines = log.read_text(encoding="ascii").splitlines()
+        assert len(lines) == 400
+        assert all(line == f"{now:.3f} e" for line in lines)
+
+    def test_missing_log_counts_zero(self, tmp_path):
+        assert loop_guard._error_count(tmp_path / "absent.log", time.time()) == 0
 
-    def test_load_corrupt_fails_open(self, tmp_path):
+    def test_load_corrupt_legacy_state_fails_open(self, tmp_path):
         p = tmp_path / "state.json"
         p.write_text("{ broken json", encoding="utf-8")
         assert loop_guard._load_state(p) == {"entries": []}
@@ -307,6 +307,28 @@ class TestHookStatePruning:
         assert fresh.exists(), "live state was collected"
         assert removed == 1
 
+    def test_untouched_state_directory_is_removed(self, tmp_path: Path, monkeypatch):
+        """loop_guard's per-signature log directory goes once all of it is idle."""
+        from superclaude.utils import hook_state_dir, prune_hook_state
+
+        monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+        state = hook_state_dir()
+        stale = state / "loop_guard_deadbeef"
+        live = state / "loop_guard_cafebabe"
+        for directory in (stale, live):
+            directory.mkdir(parents=True)
+            old = directory / "old.log"
+            old.write_text("1.000 e\n", encoding="ascii")
+            self._age(old, days=30)
+        (live / "recent.log").write_text("2.000 e\n", encoding="ascii")
+        self._age(stale, days=30)
+        self._age(live, days=30)
+
+        assert prune_hook_state() == 1
+
+        assert not stale.exists()
+        assert (live / "old.log").exists()
+
     def test_unknown_files_are_left_alone(self, tmp_path: Path, monkeypatch):
         """The sweep deletes state it recognises, not whatever shares the dir."""
         from superclaude.utils import hook_state_dir, prune_hook_state
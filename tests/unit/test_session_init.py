@@ -6,17 +6,24 @@ and multi-directory CLAUDE.md detection.
 """
 
 import json
+import os
 import subprocess
+import sys
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from superclaude.scripts.session_init import (
     get_additional_dirs_status,
     get_git_status,
     get_pr_status,
     init_hook_tracker,
     main,
+    query_pr_status,
 )
 
 # ---------------------------------------------------------------------------
@@ -70,15 +77,6 @@ class TestInitHookTracker:
             mock_cleanup_fn.assert_called_once()
             mock_get_id_fn.assert_called_once()
 
-    def test_returns_none_on_import_error(self):
-        """init_hook_tracker returns None when hook_tracker is not importable."""
-        with patch.dict(
-            "sys.modules",
-            {"superclaude.hooks.hook_tracker": None},
-        ):
-            result = init_hook_tracker()
-            assert result is None
-
     def test_prints_cleanup_count_when_sessions_cleaned(self, capsys):
         """init_hook_tracker prints cleanup message when old sessions are removed."""
         import superclaude.hooks.hook_tracker as ht_mod
@@ -179,6 +177,8 @@ class TestGetGitStatus:
 
     def test_subprocess_called_with_correct_args(self):
         """Verifies subprocess.run is called with --porcelain and timeout."""
+        from superclaude.utils import project_root
+
         fake = FakeCompletedProcess(returncode=0, stdout="")
         with patch(
             "superclaude.scripts.session_init.subprocess.run", return_value=fake
@@ -186,12 +186,26 @@ class TestGetGitStatus:
             get_git_status()
 
         mock_run.assert_called_once_with(
-            ["git", "status", "--porcelain"],
+            ["git", "status", "--porcelain", "-uall"],
+            cwd=str(project_root().resolve()),
             capture_output=True,
             text=True,
             timeout=5,
         )
 
+    def test_shares_one_git_run_with_the_session_baseline(self):
+        """SessionStart's two hooks ask git once between them."""
+        from superclaude.scripts import insight_writer
+
+        fake = FakeCompletedProcess(returncode=0, stdout=" M src/main.py\n")
+        with patch(
+            "superclaude.scripts.session_init.subprocess.run", return_value=fake
+        ) as mock_run:
+            assert get_git_status() == "\U0001f4ca Git: 1 files"
+            insight_writer.cmd_session_baseline(MagicMock(session_id="s1"))
+
+        assert mock_run.call_count == 1
+
 
 # ---------------------------------------------------------------------------
 # TestGetPrStatus
@@ -199,7 +213,7 @@ class TestGetGitStatus:
 
 
 class TestGetPrStatus:
-    """Test get_pr_status for various PR states and error conditions."""
+    """Test query_pr_status (the gh call) for various PR states and errors."""
 
     def _mock_subprocess(self, branch_result, pr_result=None):
         """Helper to mock two sequential subprocess.run calls (branch + gh pr)."""
@@ -215,19 +229,19 @@ class TestGetPrStatus:
         """Returns empty string when not in a git repository."""
         branch = FakeCompletedProcess(returncode=128, stdout="")
         with self._mock_subprocess(branch):
-            assert get_pr_status() == ""
+            assert query_pr_status() == ""
 
     def test_main_branch_returns_empty(self):
         """Returns empty string on main branch (no PR expected)."""
         branch = FakeCompletedProcess(returncode=0, stdout="main\n")
         with self._mock_subprocess(branch):
-            assert get_pr_status() == ""
+            assert query_pr_status() == ""
 
     def test_master_branch_returns_empty(self):
         """Returns empty string on master branch (no PR expected)."""
         branch = FakeCompletedProcess(returncode=0, stdout="master\n")
         with self._mock_subprocess(branch):
-            assert get_pr_status() == ""
+            assert query_pr_status() == ""
 
     def test_no_pr_for_branch_returns_empty(self):
         """Returns empty string when gh pr view fails (no PR exists)."""
@@ -236,7 +250,7 @@ class TestGetPrStatus:
             returncode=1, stdout="", stderr="no pull requests found"
         )
         with self._mock_subprocess(branch, pr):
-            assert get_pr_status() == ""
+            assert query_pr_status() == ""
 
     def test_draft_pr(self):
         """Draft PR shows white circle indicator."""
@@ -249,7 +263,7 @@ class TestGetPrStatus:
         }
         pr = FakeCompletedProcess(returncode=0, stdout=json.dumps(pr_data))
         with self._mock_subprocess(branch, pr):
-            result = get_pr_status()
+            result = query_pr_status()
 
         assert "draft" in result
         assert "https://github.com/org/repo/pull/1" in result
@@ -265,7 +279,7 @@ class TestGetPrStatus:
         }
         pr = FakeCompletedProcess(returncode=0, stdout=json.dumps(pr_data))
         with self._mock_subprocess(branch, pr):
-            result = get_pr_status()
+            result = query_pr_status()
 
         assert "approved" in result
         assert "https://github.com/org/repo/pull/2" in result
@@ -281,7 +295,7 @@ class TestGetPrStatus:
         }
         pr = FakeCompletedProcess(returncode=0, stdout=json.dumps(pr_data))
         with self._mock_subprocess(branch, pr):
-            result = get_pr_status()
+            result = query_pr_status()
 
         assert "changes requested" in result
 
@@ -296,7 +310,7 @@ class TestGetPrStatus:
         }
         pr = FakeCompletedProcess(returncode=0, stdout=json.dumps(pr_data))
         with self._mock_subprocess(branch, pr):
-            result = get_pr_status()
+            result = query_pr_status()
 
         assert "pending review" in result
 
@@ -311,7 +325,7 @@ class TestGetPrStatus:
         }
         pr = FakeCompletedProcess(returncode=0, stdout=json.dumps(pr_data))
         with self._mock_subprocess(branch, pr):
-            result = get_pr_status()
+            result = query_pr_status()
 
         assert "approved" in result
         assert "(" not in result
@@ -324,14 +338,14 @@ class TestGetPrStatus:
             "superclaude.scripts.session_init.subprocess.run",
             side_effect=effects,
         ):
-            assert get_pr_status() == ""
+            assert query_pr_status() == ""
 
     def test_invalid_json_from_gh(self):
         """Returns empty string when gh returns invalid JSON."""
         branch = FakeCompletedProcess(returncode=0, stdout="feature/x\n")
         pr = FakeCompletedProcess(returncode=0, stdout="not json at all")
         with self._mock_subprocess(branch, pr):
-            assert get_pr_status() == ""
+            assert query_pr_status() == ""
 
     def test_timeout_returns_empty(self):
         """Returns empty string on subprocess timeout."""
@@ -339,7 +353,123 @@ class TestGetPrStatus:
             "superclaude.scripts.session_init.subprocess.run",
             side_effect=subprocess.TimeoutExpired(cmd="git", timeout=5),
         ):
-            assert get_pr_status() == ""
+            assert query_pr_status() == ""
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="the stub gh is a POSIX shell script"
+)
+class TestPrStatusCache:
+    """get_pr_status reads a per-branch cache; a detached refresh fills it.
+
+    A stub `gh` on PATH logs each call and prints the JSON in a file, so the
+    refresh runs for real, in its own process, without GitHub.
+    """
+
+    @pytest.fixture
+    def feature_repo(self, tmp_path, monkeypatch):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        git = ["git", "-c", "user.email=t@t", "-c", "user.name=t"]
+        for args in (
+            ["init", "-q", "-b", "feature/cache"],
+            ["commit", "-q", "--allow-empty", "-m", "base"],
+        ):
+            subprocess.run([*git, *args], cwd=repo, check=True, capture_output=True)
+        monkeypatch.chdir(repo)
+        monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(repo))
+        return repo
+
+    @pytest.fixture
+    def stub_gh(self, tmp_path, monkeypatch):
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        response = tmp_path / "gh_response.json"
+        calls = tmp_path / "gh_calls.log"
+        gh = bin_dir / "gh"
+        script = ["#!/bin/sh", f'echo "$@" >> "{calls}"', f'cat "{response}"']
+        gh.write_text("\n".join(script) + "\n", encoding="utf-8")
+        gh.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+        class Stub:
+            def respond(self, decision):
+                response.write_text(
+                    json.dumps(
+                        {
+                            "isDraft": False,
+                            "state": "OPEN",
+                            "reviewDecision": decision,
+                            "url": "https://github.com/org/repo/pull/9",
+                        }
+                    ),
+                    encoding="utf-8",
+                )
+
+            def calls(self):
+                if not calls.exists():
+                    return 0
+                return len(calls.read_text(encoding="utf-8").splitlines())
+
+        return Stub()
+
+    def _wait_for(self, predicate, timeout=10.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if predicate():
+                return True
+            time.sleep(0.05)
+        return False
+
+    def _cached_line(self):
+        from superclaude.scripts import session_init
+
+        entry = session_init._read_pr_cache().get("feature/cache", {})
+        return entry.get("line")
+
+    def test_cold_cache_answers_at_once_and_refreshes(self, feature_repo, stub_gh):
+        stub_gh.respond("APPROVED")
+
+        assert get_pr_status() == ""
+        assert self._wait_for(lambda: self._cached_line() is not None)
+        assert "approved" in get_pr_status()
+
+    def test_fresh_entry_starts_no_refresh(self, feature_repo, stub_gh):
+        stub_gh.respond("APPROVED")
+        get_pr_status()
+        assert self._wait_for(lambda: self._cached_line() is not None)
+        calls = stub_gh.calls()
+
+        for _ in range(3):
+            assert "approved" in get_pr_status()
+        time.sleep(0.3)
+        assert stub_gh.calls() == calls
+
+    def test_stale_entry_is_shown_then_replaced(
+        self, feature_repo, stub_gh, monkeypatch
+    ):
+        from superclaude.scripts import session_init
+
+        stub_gh.respond("APPROVED")
+        get_pr_status()
+        assert self._wait_for(lambda: self._cached_line() is not None)
+
+        stub_gh.respond("CHANGES_REQUESTED")
+        monkeypatch.setattr(session_init, "PR_STATUS_TTL_SECONDS", 0)
+        assert "approved" in get_pr_status()  # the old line, instantly
+        assert self._wait_for(lambda: "changes requested" in self._cached_line())
+
+    def test_refresh_in_flight_is_not_duplicated(self, feature_repo, stub_gh):
+        from superclaude.scripts import session_init
+
+        marker = session_init._pr_cache_file().with_suffix(".refreshing")
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+        stub_gh.respond("APPROVED")
+
+        assert get_pr_status() == ""
+        time.sleep(0.5)
+        assert stub_gh.calls() == 0
 
 
 # ---------------------------------------------------------------------------
@@ -534,6 +664,85 @@ class TestMain:
         assert "Multi-dir: 2 additional CLAUDE.md" in out
 
 
+class TestConcurrentProbes:
+    """Probes run at once, print in a fixed order, and a late one is skipped.
+
+    Gated on events, not sleeps: each test holds only if the probes really
+    overlap, however fast or slow the machine is.
+    """
+
+    def _patched(self, monkeypatch, **probes):
+        """probes: label → (function, deadline in seconds)."""
+        import superclaude.scripts.session_init as si
+
+        table = []
+        for i, (name, (probe, deadline)) in enumerate(probes.items()):
+            monkeypatch.setattr(si, f"fake_probe_{i}", probe, raising=False)
+            table.append((name, f"fake_probe_{i}", deadline))
+        monkeypatch.setattr(si, "PROBES", tuple(table))
+
+    def test_order_is_fixed_and_a_late_probe_is_skipped(self, monkeypatch, capsys):
+        last_ran, release = threading.Event(), threading.Event()
+
+        def first():
+            # Answers only after a probe listed later has: output order must
+            # come from the table, not from who finished first.
+            assert last_ran.wait(5)
+            return "first line"
+
+        def stuck():
+            release.wait(5)
+            return "never printed"
+
+        def last():
+            last_ran.set()
+            return "last line"
+
+        def broken():
+            raise RuntimeError("boom")
+
+        self._patched(
+            monkeypatch,
+            first=(first, 5.0),
+            stuck=(stuck, 0.0),
+            last=(last, 5.0),
+            empty=(lambda: "", 5.0),
+            broken=(broken, 5.0),
+        )
+        try:
+            main()  # returns while stuck is still blocked
+        finally:
+            release.set()
+
+        assert capsys.readouterr().out.splitlines() == [
+            "first line",
+            "\u23ed\ufe0f stuck: skipped (no answer within 0s)",
+            "last line",
+        ]
+
+    def test_probes_overlap(self, monkeypatch, capsys):
+        # Every probe waits for all four to be running; run one at a time,
+        # the first would break the barrier and print nothing.
+        barrier = threading.Barrier(4, timeout=5)
+
+        def meet(name):
+            barrier.wait()
+            return name
+
+        self._patched(
+            monkeypatch, **{name: (lambda n=name: meet(n), 10.0) for name in "abcd"}
+        )
+
+        main()
+
+        assert capsys.readouterr().out.split() == ["a", "b", "c", "d"]
+
+    def test_real_probes_fit_the_hook_timeout(self):
+        from superclaude.scripts.session_init import PROBES
+
+        assert max(deadline for _, _, deadline in PROBES) < 10
+
+
 class TestInstallStatusLine:
     """Session start may only claim what it actually checked.
 
@@ -0,0 +1,135 @@
+"""Tests for token_estimator's pluggable tokenizer and count cache.
+
+Contract:
+- chars/4 unless $SUPERCLAUDE_TOKENIZER names an available backend.
+- A backend that cannot load falls back to the heuristic, never raises.
+- Cached backends count each distinct text once, across processes.
+"""
+
+import json
+
+import pytest
+
+from superclaude.scripts import token_estimator as te
+
+
+class CountingTokenizer:
+    """Stand-in BPE backend: one token per word, and a call log."""
+
+    name = "words"
+    cached = True
+    calls: list[str] = []
+
+    def count(self, text: str) -> int:
+        self.calls.append(text)
+        return len(text.split())
+
+
+@pytest.fixture
+def fresh_backends(monkeypatch, tmp_path):
+    monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+    monkeypatch.setattr(te, "_tokenizers", {})
+    monkeypatch.setattr(te, "_count_cache", None)
+    monkeypatch.setitem(te._BACKENDS, "words", CountingTokenizer)
+    CountingTokenizer.calls = []
+    return tmp_path
+
+
+class TestBackendSelection:
+    def test_heuristic_by_default(self, fresh_backends, monkeypatch):
+        monkeypatch.delenv(te.TOKENIZER_ENV, raising=False)
+
+        assert te.get_tokenizer().name == "chars/4"
+        assert te.estimate_tokens("x" * 41) == 10
+
+    def test_named_backend_is_used(self, fresh_backends, monkeypatch):
+        monkeypatch.setenv(te.TOKENIZER_ENV, "words")
+
+        assert te.estimate_tokens("🎯 📈 💰 ⚖️") == 4
+
+    def test_unavailable_backend_falls_back(self, fresh_backends, monkeypatch):
+        def unavailable():
+            raise ImportError("no tiktoken")
+
+        monkeypatch.setitem(te._BACKENDS, "tiktoken", unavailable)
+        monkeypatch.setenv(te.TOKENIZER_ENV, "tiktoken")
+
+        assert te.get_tokenizer().name == "chars/4"
+
+    def test_unknown_name_falls_back(self, fresh_backends, monkeypatch):
+        monkeypatch.setenv(te.TOKENIZER_ENV, "nonsense")
+
+        assert te.get_tokenizer().name == "chars/4"
+
+
+class TestCountCache:
+    def test_unchanged_text_is_counted_once(self, fresh_backends, monkeypatch):
+        monkeypatch.setenv(te.TOKENIZER_ENV, "words")
+
+        assert te.estimate_tokens("a b c") == 3
+        assert te.estimate_tokens("a b c") == 3
+        assert CountingTokenizer.calls == ["a b c"]
+
+    def test_counts_survive_the_process(self, fresh_backends, monkeypatch):
+        monkeypatch.setenv(te.TOKENIZER_ENV, "words")
+        te.estimate_tokens("one two")
+        te.token_count_cache().flush()
+
+        # A new process: nothing in memory, only the file
+        monkeypatch.setattr(te, "_count_cache", None)
+        CountingTokenizer.calls = []
+
+        assert te.estimate_tokens("one two") == 2
+        assert CountingTokenizer.calls == []
+
+    def test_heuristic_counts_are_not_cached(self, fresh_backends, monkeypatch):
+        monkeypatch.delenv(te.TOKENIZER_ENV, raising=False)
+        te.estimate_tokens("plain text")
+
+        assert te._count_cache is None
+
+    def test_cache_is_bounded(self, fresh_backends, monkeypatch):
+        monkeypatch.setattr(te, "MAX_CACHED_COUNTS", 3)
+        cache = te.TokenCountCache(fresh_backends / "counts.json")
+        for i in range(5):
+            cache.put(f"k{i}", i)
+        cache.flush()
+
+        data = json.loads((fresh_backends / "counts.json").read_text())
+        assert list(data) == ["k2", "k3", "k4"]
+
+    def test_corrupt_cache_is_ignored(self, tmp_path):
+        path = tmp_path / "counts.json"
+        path.write_text("{not json")
+
+        assert te.TokenCountCache(path).get("anything") is None
+
+
+class TestReportsUseTheBackend:
+    def test_agent_estimate(self, fresh_backends, monkeypatch, tmp_path):
+        monkeypatch.setenv(te.TOKENIZER_ENV, "words")
+        agent = tmp_path / "agent.md"
+        agent.write_text("---\nname: x\n---\nbody has four words\n")
+
+        estimate = te.estimate_agent_tokens(agent)
+
+        assert estimate.frontmatter_tokens == 2
+        assert estimate.full_tokens == 8
+
+    def test_agents_info_and_tokens_agree(self, fresh_backends, monkeypatch, tmp_path):
+        from click.testing import CliRunner
+
+        from superclaude.cli.main import main
+
+        monkeypatch.setenv(te.TOKENIZER_ENV, "words")
+        monkeypatch.chdir(tmp_path)
+        agents = tmp_path / ".claude" / "agents"
+        agents.mkdir(parents=True)
+        (agents / "x.md").write_text("---\nname: x\n---\nbody has four words\n")
+        runner = CliRunner()
+
+        info = runner.invoke(main, ["agents", "--scope", "project", "--info", "x"])
+        listed = runner.invoke(main, ["agents", "--scope", "project", "--tokens"])
+
+        assert "Tokens: ~8" in info.output
+        assert "(full: ~8)" in listed.output
@@ -0,0 +1,202 @@
+"""Tests for tree_status, the git status shared by the SessionStart/Stop hooks.
+
+Contract:
+- status() is `git status --porcelain -uall`, or None when git cannot answer.
+- Without share_as every call runs git.
+- With share_as, hooks of one event reuse one run while HEAD and the index are
+  unchanged and the result is younger than STATUS_TTL_SECONDS; a hook that
+  finds another one running git waits for its result.
+"""
+
+import os
+import subprocess
+import threading
+import time
+
+import pytest
+
+from superclaude.scripts import tree_status
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.email=t@t", "-c", "user.name=t", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "tracked.txt").write_text("base\n")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-qm", "base")
+    return tmp_path
+
+
+@pytest.fixture
+def git_runs(monkeypatch):
+    runs = []
+    real = tree_status._run_git
+    monkeypatch.setattr(
+        tree_status,
+        "_run_git",
+        lambda root, *args: runs.append(root) or real(root, *args),
+    )
+    return runs
+
+
+class TestStatus:
+    def test_lines_and_head(self, repo):
+        (repo / "tracked.txt").write_text("changed\n")
+        (repo / "new").mkdir()
+        (repo / "new" / "file.txt").write_text("x")
+
+        snapshot = tree_status.status(repo)
+
+        assert sorted(snapshot.lines) == [" M tracked.txt", "?? new/file.txt"]
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=repo, capture_output=True, text=True
+        ).stdout.strip()
+        assert snapshot.head == head
+
+    def test_not_a_repository(self, tmp_path):
+        assert tree_status.status(tmp_path) is None
+
+    def test_packed_and_detached_heads(self, repo):
+        head = tree_status.status(repo).head
+        _git(repo, "pack-refs", "--all")
+        assert tree_status.status(repo).head == head
+        _git(repo, "checkout", "-q", "--detach")
+        assert tree_status.status(repo).head == head
+
+    def test_fingerprint_ignores_order(self):
+        assert tree_status.fingerprint(["b", "a"]) == tree_status.fingerprint(
+            ["a", "b"]
+        )
+
+
+class TestSharing:
+    def test_unshared_calls_always_run_git(self, repo, git_runs):
+        tree_status.status(repo)
+        tree_status.status(repo)
+        assert len(git_runs) == 2
+
+    def test_one_run_per_event(self, repo, git_runs):
+        first = tree_status.status(repo, share_as="SessionStart")
+        second = tree_status.status(repo, share_as="SessionStart")
+
+        assert first == second
+        assert len(git_runs) == 1
+        tree_status.status(repo, share_as="Stop")
+        assert len(git_runs) == 2
+
+    def test_new_commit_invalidates(self, repo, git_runs):
+        tree_status.status(repo, share_as="SessionStart")
+        (repo / "tracked.txt").write_text("next\n")
+        _git(repo, "commit", "-qam", "next")
+
+        assert tree_status.status(repo, share_as="SessionStart").lines == ()
+        assert len(git_runs) == 2
+
+    def test_old_result_is_not_reused(self, repo, git_runs, monkeypatch):
+        tree_status.status(repo, share_as="SessionStart")
+        (repo / "tracked.txt").write_text("edited, index untouched\n")
+        monkeypatch.setattr(tree_status, "STATUS_TTL_SECONDS", 0)
+
+        snapshot = tree_status.status(repo, share_as="SessionStart")
+        assert snapshot.lines == (" M tracked.txt",)
+        assert len(git_runs) == 2
+
+    def test_waits_for_the_hook_holding_the_lock(self, repo, git_runs):
+        cache = tree_status._cache_file(repo.resolve(), "SessionStart")
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        lock = cache.with_suffix(".lock")
+        lock.touch()
+
+        def other_hook():
+            time.sleep(0.2)
+            tree_status.atomic_write_json(
+                cache,
+                {
+                    "key": tree_status._key(repo / ".git"),
+                    "at": time.time(),
+                    "lines": ["?? from-the-other-hook"],
+                },
+            )
+            lock.unlink()
+
+        thread = threading.Thread(target=other_hook)
+        thread.start()
+        snapshot = tree_status.status(repo, share_as="SessionStart")
+        thread.join()
+
+        assert snapshot.lines == ("?? from-the-other-hook",)
+        assert git_runs == []
+
+    def test_wait_comes_out_of_the_git_timeout(self, repo, monkeypatch):
+        cache = tree_status._cache_file(repo.resolve(), "SessionStart")
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        cache.with_suffix(".lock").touch()  # a hook that never answers
+        monkeypatch.setattr(tree_status, "LOCK_WAIT_SECONDS", 0.1)
+        timeouts = []
+        real = tree_status._run_git
+        monkeypatch.setattr(
+            tree_status,
+            "_run_git",
+            lambda root, timeout: timeouts.append(timeout) or real(root, timeout),
+        )
+
+        snapshot = tree_status.status(repo, share_as="SessionStart")
+
+        assert snapshot.lines == ()
+        assert timeouts[0] <= tree_status.GIT_TIMEOUT_SECONDS - 0.1
+
+
+@pytest.mark.performance
+@pytest.mark.skipif(
+    not os.environ.get("SUPERCLAUDE_BENCH"),
+    reason="generates a 50k-file repository; set SUPERCLAUDE_BENCH=1",
+)
+def test_50k_file_repo_benchmark(tmp_path):
+    """A shared read beats the git run it replaces on a 50k-file repository."""
+    for d in range(500):
+        directory = tmp_path / f"d{d}"
+        directory.mkdir()
+        for f in range(100):
+            (directory / f"f{f}.txt").write_text(f"{d} {f}\n")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-qm", "base")
+    (tmp_path / "d1" / "f1.txt").write_text("dirty\n")
+    (tmp_path / "untracked").mkdir()
+    for i in range(200):
+        (tmp_path / "untracked" / f"u{i}").write_text("")
+
+    def best_of(fn, rounds=5):
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    def untracked_cache():
+        subprocess.run(
+            ["git", "-c", "core.untrackedCache=true", "status", "--porcelain", "-uall"],
+            cwd=tmp_path,
+            capture_output=True,
+        )
+
+    assert len(tree_status.status(tmp_path).lines) == 201
+    git_run = best_of(lambda: tree_status.status(tmp_path))
+    with_cache = best_of(untracked_cache)
+    tree_status.status(tmp_path, share_as="bench")
+    shared = best_of(lambda: tree_status.status(tmp_path, share_as="bench"))
+    print(
+        f"\n50k files: git status {git_run * 1e3:.1f}ms, "
+        f"with untracked cache {with_cache * 1e3:.1f}ms, shared {shared * 1e3:.2f}ms"
+    )
+    assert shared < git_run